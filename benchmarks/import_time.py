@@ -0,0 +1,55 @@
+"""
+Tracks how long `import pymocker` takes in a fresh interpreter and which heavy
+dependencies it pulls in. Run with `python benchmarks/import_time.py [runs]`.
+"""
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = [
+    'pandas',
+    'pydantic',
+    'polyfactory',
+    'faker',
+    'numpy',
+    'torch',
+    'sentence_transformers',
+]
+
+PROBE = (
+    "import time, sys\n"
+    "start = time.perf_counter()\n"
+    "import pymocker\n"
+    "elapsed = time.perf_counter() - start\n"
+    "from pymocker.builder import utils\n"
+    "loaded = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(elapsed)\n"
+    "print(','.join(loaded))\n"
+    "print(int(utils._segmenter is not None))\n"
+)
+
+def measure(runs: int = 10) -> dict:
+    timings = []
+    loaded = set()
+    corpus_loaded = False
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', PROBE.format(heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True,
+        ).stdout.splitlines()
+        timings.append(float(out[0]))
+        loaded.update(filter(None, out[1].split(',')))
+        corpus_loaded = corpus_loaded or int(out[2]) > 0
+    return {
+        'median_ms': statistics.median(timings) * 1000,
+        'max_ms': max(timings) * 1000,
+        'heavy_modules_loaded': sorted(loaded),
+        'word_corpus_loaded': corpus_loaded,
+    }
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    result = measure(runs)
+    print(f"import pymocker: median {result['median_ms']:.1f} ms, max {result['max_ms']:.1f} ms over {runs} runs")
+    print(f"heavy modules loaded at import: {result['heavy_modules_loaded'] or 'none'}")
+    print(f"word corpus loaded at import: {result['word_corpus_loaded']}")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import math
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Mapping, get_origin
+
+from pymocker.builder.patterns import UnsupportedPattern, get_pattern_generator
+
+class ConstraintError(ValueError):
+    """Raised when a field's constraints cannot be satisfied by any value."""
+
+def _lower_bound(constraints: Mapping[str, Any]) -> tuple[Any, bool]:
+    """The tightest lower bound and whether it is inclusive."""
+    ge, gt = constraints.get('ge'), constraints.get('gt')
+    if gt is not None and (ge is None or gt >= ge):
+        return gt, False
+    return ge, True
+
+def _upper_bound(constraints: Mapping[str, Any]) -> tuple[Any, bool]:
+    """The tightest upper bound and whether it is inclusive."""
+    le, lt = constraints.get('le'), constraints.get('lt')
+    if lt is not None and (le is None or lt <= le):
+        return lt, False
+    return le, True
+
+def _without(constraints: Mapping[str, Any], *names: str) -> dict[str, Any]:
+    return {k: v for k, v in constraints.items() if k not in names}
+
+def _describe(constraints: Mapping[str, Any], *names: str) -> str:
+    return ', '.join(f"{name}={constraints[name]!r}" for name in names if constraints.get(name) is not None)
+
+def analyse_int(constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """Inclusive ge/le bounds, snapped to the first and last multiple of multiple_of inside the range."""
+    low, low_inclusive = _lower_bound(constraints)
+    high, high_inclusive = _upper_bound(constraints)
+    if low is not None:
+        low = math.ceil(low) if low_inclusive else math.floor(low) + 1
+    if high is not None:
+        high = math.floor(high) if high_inclusive else math.ceil(high) - 1
+    multiple_of = constraints.get('multiple_of')
+    if multiple_of is not None:
+        if multiple_of <= 0:
+            raise ConstraintError(f"multiple_of must be positive, got {multiple_of!r}")
+        if isinstance(multiple_of, int):
+            if low is not None:
+                low = -(-low // multiple_of) * multiple_of
+            if high is not None:
+                high = high // multiple_of * multiple_of
+    if low is not None and high is not None and low > high:
+        raise ConstraintError(
+            f"No integer satisfies {_describe(constraints, 'gt', 'ge', 'lt', 'le', 'multiple_of')}"
+        )
+    normalized = _without(constraints, 'gt', 'ge', 'lt', 'le')
+    if low is not None:
+        normalized['ge'] = low
+    if high is not None:
+        normalized['le'] = high
+    return normalized
+
+def analyse_real(constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """Checks float and Decimal bounds, multiple_of and, for Decimals, max_digits/decimal_places."""
+    low, low_inclusive = _lower_bound(constraints)
+    high, high_inclusive = _upper_bound(constraints)
+    described = _describe(constraints, 'gt', 'ge', 'lt', 'le', 'multiple_of', 'max_digits', 'decimal_places')
+    if low is not None and high is not None:
+        if low > high or (low == high and not (low_inclusive and high_inclusive)):
+            raise ConstraintError(f"No value satisfies {described}")
+
+    multiple_of = constraints.get('multiple_of')
+    if multiple_of is not None:
+        if multiple_of <= 0:
+            raise ConstraintError(f"multiple_of must be positive, got {multiple_of!r}")
+        if low is not None and high is not None:
+            # with a tolerance, so float rounding never rejects a feasible range
+            step = float(multiple_of)
+            if math.ceil(float(low) / step - 1e-9) > math.floor(float(high) / step + 1e-9):
+                raise ConstraintError(f"No multiple of {multiple_of!r} satisfies {described}")
+
+    max_digits, decimal_places = constraints.get('max_digits'), constraints.get('decimal_places')
+    if decimal_places is not None and decimal_places < 0:
+        raise ConstraintError(f"decimal_places must not be negative, got {decimal_places!r}")
+    if max_digits is not None:
+        if max_digits <= 0:
+            raise ConstraintError(f"max_digits must be positive, got {max_digits!r}")
+        if decimal_places is not None and decimal_places > max_digits:
+            raise ConstraintError(f"decimal_places={decimal_places} exceeds max_digits={max_digits}")
+        largest = Decimal(10) ** (max_digits - (decimal_places or 0)) - Decimal(1).scaleb(-(decimal_places or 0))
+        if low is not None and Decimal(str(low)) > largest:
+            raise ConstraintError(f"No value with {max_digits} digits satisfies {described}")
+        if high is not None and Decimal(str(high)) < -largest:
+            raise ConstraintError(f"No value with {max_digits} digits satisfies {described}")
+    return dict(constraints)
+
+def analyse_length(constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Checks length limits, that lower_case and upper_case are not both set, that pattern
+    compiles and that a string within the length limits can contain a match, or, for a pattern
+    anchored at both ends, be one.
+    """
+    min_length, max_length = constraints.get('min_length'), constraints.get('max_length')
+    for name, value in (('min_length', min_length), ('max_length', max_length)):
+        if value is not None and value < 0:
+            raise ConstraintError(f"{name} must not be negative, got {value!r}")
+    if min_length is not None and max_length is not None and min_length > max_length:
+        raise ConstraintError(f"min_length={min_length} exceeds max_length={max_length}")
+    if constraints.get('lower_case') and constraints.get('upper_case'):
+        raise ConstraintError("A value cannot be both lower_case and upper_case")
+    pattern = constraints.get('pattern')
+    if pattern:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ConstraintError(f"Invalid pattern {pattern!r}: {e}") from e
+        try:
+            generator = get_pattern_generator(pattern)
+        except UnsupportedPattern:
+            return dict(constraints)
+        if max_length is not None and generator.min_length > max_length:
+            raise ConstraintError(f"Pattern {pattern!r} needs at least {generator.min_length} characters, max_length={max_length}")
+        # pydantic searches for the pattern, so a longer string can hold a match unless both ends are anchored
+        anchored = generator.anchored_start and generator.anchored_end
+        if anchored and min_length is not None and generator.max_length < min_length:
+            raise ConstraintError(f"Pattern {pattern!r} matches at most {generator.max_length} characters, min_length={min_length}")
+    return dict(constraints)
+
+def analyse_collection(constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """Checks min_items/max_items (or min_length/max_length, as polyfactory reports them)."""
+    for low_name, high_name in (('min_items', 'max_items'), ('min_length', 'max_length')):
+        low, high = constraints.get(low_name), constraints.get(high_name)
+        if low is not None and high is not None and low > high:
+            raise ConstraintError(f"{low_name}={low} exceeds {high_name}={high}")
+    return dict(constraints)
+
+def analyse_date(constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """Inclusive ge/le bounds, one day inside gt/lt."""
+    low, low_inclusive = _lower_bound(constraints)
+    high, high_inclusive = _upper_bound(constraints)
+    if low is not None and not low_inclusive:
+        low += timedelta(days=1)
+    if high is not None and not high_inclusive:
+        high -= timedelta(days=1)
+    if low is not None and high is not None and low > high:
+        raise ConstraintError(f"No date satisfies {_describe(constraints, 'gt', 'ge', 'lt', 'le')}")
+    normalized = _without(constraints, 'gt', 'ge', 'lt', 'le')
+    if low is not None:
+        normalized['ge'] = low
+    if high is not None:
+        normalized['le'] = high
+    return normalized
+
+ANALYSER_MAP = {
+    int: analyse_int,
+    float: analyse_real,
+    Decimal: analyse_real,
+    str: analyse_length,
+    bytes: analyse_length,
+    list: analyse_collection,
+    set: analyse_collection,
+    frozenset: analyse_collection,
+    dict: analyse_collection,
+    date: analyse_date,
+}
+
+def analyse_constraints(annotation: Any, constraints: Mapping[str, Any] | None) -> dict[str, Any]:
+    """
+    Checks that some value of the annotation satisfies the constraints and returns the feasible
+    region as equivalent constraints: int and date bounds become inclusive ge/le, and int bounds
+    are snapped to multiples of multiple_of, so generators and coercers never leave the range.
+
+    :raises ConstraintError: If no value can satisfy the constraints.
+    """
+    constraints = {k: v for k, v in (constraints or {}).items() if v is not None}
+    origin_type = get_origin(annotation) or annotation
+    analyser = ANALYSER_MAP.get(origin_type)
+    if analyser is None or not constraints:
+        return constraints
+    return analyser(constraints)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping, Sequence, Set as AbstractSet
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated, Any, Literal, get_args, get_origin, get_type_hints, is_typeddict
+from uuid import UUID
+
+from polyfactory.field_meta import Null
+from polyfactory.utils.helpers import unwrap_optional
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ARROW_FORMATS = ('parquet', 'ipc')
+# Rows generated and written at a time: one Parquet row group or Arrow record batch
+DEFAULT_ROW_GROUP_SIZE = 65_536
+
+def import_pyarrow() -> Any:
+    """pyarrow, which is optional and only imported when a file is written."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Writing Parquet or Arrow files requires pyarrow: pip install pymocker[arrow]") from e
+    return pyarrow
+
+def arrow_type(annotation: Any) -> pa.DataType:
+    """
+    The Arrow type of a field's values, derived from its annotation: scalars, enums and literals,
+    lists, sets and homogeneous tuples as lists, dicts as maps, and models, dataclasses and
+    TypedDicts as structs. Optional annotations map to the type of their values, as every column
+    is nullable.
+
+    :raises TypeError: If the annotation, or a type inside it, has no Arrow type.
+    """
+    pa = import_pyarrow()
+    annotation = unwrap_optional(annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Annotated:
+        return arrow_type(args[0])
+    if origin is Literal:
+        return _common_type(annotation, [arrow_type(type(arg)) for arg in args])
+    if origin in (list, set, frozenset, Sequence, AbstractSet) and len(args) == 1:
+        return pa.list_(arrow_type(args[0]))
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return pa.list_(arrow_type(args[0]))
+    if origin in (dict, Mapping) and len(args) == 2:
+        return pa.map_(arrow_type(args[0]), arrow_type(args[1]))
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return _common_type(annotation, [arrow_type(type(member.value)) for member in annotation])
+        if hasattr(annotation, 'model_fields'):
+            return pa.struct([(name, arrow_type(field.annotation)) for name, field in annotation.model_fields.items()])
+        if dataclasses.is_dataclass(annotation) or is_typeddict(annotation):
+            return pa.struct([(name, arrow_type(hint)) for name, hint in get_type_hints(annotation).items()])
+        scalars = _scalar_types(pa)
+        # the first scalar base, e.g. datetime rather than date
+        for base in annotation.__mro__:
+            if base in scalars:
+                return scalars[base]
+    raise TypeError(f"No Arrow type for {annotation!r}")
+
+def _scalar_types(pa: Any) -> dict[type, pa.DataType]:
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        bytes: pa.binary(),
+        UUID: pa.string(),
+        datetime: pa.timestamp('us'),
+        date: pa.date32(),
+        time: pa.time64('us'),
+        timedelta: pa.duration('us'),
+    }
+
+def _common_type(annotation: Any, types: list[pa.DataType]) -> pa.DataType:
+    if not types or any(type != types[0] for type in types):
+        raise TypeError(f"No Arrow type for {annotation!r}, its values have different types")
+    return types[0]
+
+def arrow_schema(annotations: Mapping[str, Any]) -> pa.Schema:
+    """
+    The Arrow schema of the fields with the given annotations, see `arrow_type`.
+
+    :raises TypeError: If a field's annotation has no Arrow type.
+    """
+    pa = import_pyarrow()
+    fields = []
+    for name, annotation in annotations.items():
+        try:
+            fields.append(pa.field(name, arrow_type(annotation)))
+        except TypeError as e:
+            raise TypeError(f"Field {name!r} cannot be written to Arrow: {e}") from e
+    return pa.schema(fields)
+
+def _plain(value: Any) -> Any:
+    """A value pyarrow can convert: models and dataclasses become dicts, enums their values and Null None."""
+    if value is Null:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, 'model_dump'):
+        return _plain(value.model_dump())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _plain(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain(v) for v in value]
+    return value
+
+def column_to_arrow(values: list[Any], type: pa.DataType | None = None) -> pa.Array:
+    """
+    One generated column as an Arrow array, converted straight from the list of values.
+    Columns pyarrow cannot convert as they are, e.g. holding models, enums or Null, are first
+    turned into plain values.
+    """
+    pa = import_pyarrow()
+    try:
+        return pa.array(values, type=type)
+    except (pa.ArrowException, TypeError, ValueError):
+        return pa.array([_plain(value) for value in values], type=type)
+
+class ArrowSink:
+    """
+    Streams generated columns to a Parquet file (`pyarrow.parquet.ParquetWriter`) or an Arrow IPC
+    file, one record batch per `write`. Every batch is converted to the given schema, see
+    `arrow_schema`, so the file's types never depend on the values of a batch.
+
+    :param where: A path or writable file object.
+    :param schema: The Arrow schema of the file.
+    :param format: 'parquet' or 'ipc'.
+    :param compression: The codec, e.g. 'snappy', 'zstd' or 'lz4', or 'none'. Defaults to pyarrow's
+        default for the format: snappy for Parquet, uncompressed for IPC.
+    :param row_group_size: The maximum rows of a Parquet row group.
+    """
+    def __init__(
+        self,
+        where: Any,
+        schema: pa.Schema,
+        format: str = 'parquet',
+        compression: str | None = None,
+        row_group_size: int | None = None,
+    ):
+        if format not in ARROW_FORMATS:
+            raise ValueError(f"Unknown format {format!r}, expected one of {ARROW_FORMATS}")
+        self.where = where
+        self.schema = schema
+        self.format = format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._writer: Any = None
+
+    def write(self, columns: Mapping[str, list[Any]]) -> None:
+        """Writes one batch of columns, all of the same length, with a column for every field of the schema."""
+        pa = import_pyarrow()
+        arrays = []
+        for field in self.schema:
+            try:
+                arrays.append(column_to_arrow(columns[field.name], field.type))
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                raise ValueError(f"Column {field.name!r} does not fit its Arrow type {field.type}: {e}") from e
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        if self._writer is None:
+            self._writer = self._open(self.schema)
+        if self.format == 'parquet':
+            self._writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def _open(self, schema: pa.Schema) -> Any:
+        pa = import_pyarrow()
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.where, schema, compression=self.compression or 'snappy')
+        compression = None if self.compression in (None, 'none') else self.compression
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        return pa.ipc.new_file(self.where, schema, options=options)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> ArrowSink:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from importlib import metadata
+from typing import Any, Sequence
+
+from pymocker.builder.registry import get_provider_registry
+from pymocker.builder.utils import get_cache_dir
+
+MISSING = object()
+
+_CACHES: dict[str, "ResolutionCache"] = {}
+_CACHES_LOCK = threading.Lock()
+
+def _package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return ''
+
+def environment_fingerprint(providers: Sequence[object]) -> str:
+    """
+    Identifies everything a cached resolution depends on: the Faker version and
+    the class, locale, public method set and source of every provider, in order.
+    """
+    parts = [f"faker={_package_version('faker')}"]
+    parts.extend(get_provider_registry(provider).fingerprint for provider in providers)
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:32]
+
+class ResolutionCache:
+    """
+    Persistent map from a field lookup to the provider method that satisfied it.
+    Each environment fingerprint gets its own file, so a change of Faker version,
+    locale, provider classes or custom provider source starts from an empty cache.
+    """
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, Any] = self._load()
+
+    @staticmethod
+    def key(field_name: str, field_type: Any, confidence_threshold: float, rank_match: bool, ranker: Any = None) -> str:
+        ranker_name = (getattr(ranker, 'name', None) or type(ranker).__qualname__) if ranker is not None else ''
+        return f"{field_name}|{field_type!r}|{confidence_threshold}|{bool(rank_match)}|{ranker_name}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[int, str] | None | object:
+        """The cached (provider index, method name), None for a cached miss, or MISSING."""
+        entry = self._entries.get(key, MISSING)
+        if entry is MISSING or entry is None:
+            return entry
+        return entry[0], entry[1]
+
+    def set(self, key: str, value: tuple[int, str] | None) -> None:
+        self.update({key: value})
+
+    def update(self, values: dict[str, tuple[int, str] | None]) -> None:
+        """Stores many results with a single write."""
+        if not values:
+            return
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = list(value) if value is not None else None
+            self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.path and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _load(self) -> dict[str, Any]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        # merge with entries written by other processes since we loaded
+        entries = self._load()
+        entries.update(self._entries)
+        self._entries = entries
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix='.json.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+def get_resolution_cache(providers: Sequence[object]) -> ResolutionCache:
+    """Returns the resolution cache for a provider set, shared within the process."""
+    fingerprint = environment_fingerprint(providers)
+    cache = _CACHES.get(fingerprint)
+    if cache is not None:
+        return cache
+    with _CACHES_LOCK:
+        cache = _CACHES.get(fingerprint)
+        if cache is None:
+            cache = ResolutionCache(os.path.join(get_cache_dir('resolutions'), f"{fingerprint}.json"))
+            _CACHES[fingerprint] = cache
+    return cache
+
+def clear_resolution_caches() -> None:
+    """Forgets in-memory resolution caches. Files in the cache directory are left alone."""
+    with _CACHES_LOCK:
+        _CACHES.clear()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+from typing import Any
+
+from pymocker.builder.faker_types import FAKER_RETURN_TYPES
+from pymocker.builder.utils import get_cache_dir, get_public_method_names
+
+_CATALOGS: dict[str, "TypeCatalog"] = {}
+_CATALOGS_LOCK = threading.Lock()
+_UNRESOLVED = object()
+
+def _type_path(rtype: type) -> str:
+    return f"{rtype.__module__}:{rtype.__qualname__}"
+
+def _resolve_type_path(path: str) -> type | None:
+    module_name, _, qualname = path.partition(':')
+    try:
+        obj = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError):
+        return None
+    return obj if isinstance(obj, type) else None
+
+def _is_faker_builtin(func: Any) -> bool:
+    return getattr(func, '__module__', '').startswith('faker.providers')
+
+class TypeCatalog:
+    """
+    The return type of every public method of a provider, resolved once.
+
+    Resolution order for each method:
+    1. A return annotation that is a concrete class.
+    2. The shipped table of built-in Faker provider return types.
+    3. Any other (typing) return annotation, used as-is.
+    4. A type sampled by calling the method once, cached on disk so
+       later processes never call it again.
+    """
+    def __init__(self, provider: object, names: list[str] | None = None, cache_path: str | None = None):
+        self.names = get_public_method_names(provider) if names is None else names
+        self.cache_path = cache_path
+        self.types: dict[str, Any] = {}
+        self.by_type: dict[Any, list[str]] = {}
+        self._build(provider)
+
+    def _build(self, provider: object) -> None:
+        sampled = self._load_samples()
+        samples_changed = False
+        for name in self.names:
+            try:
+                func = getattr(provider, name)
+            except (AttributeError, TypeError, NotImplementedError):
+                continue
+            rtype = self._from_annotation_or_table(name, func)
+            if rtype is _UNRESOLVED:
+                cached = sampled.get(name)
+                rtype = _resolve_type_path(cached) if cached else None
+                if rtype is None:
+                    rtype = self._sample(func)
+                    sampled[name] = _type_path(rtype)
+                    samples_changed = True
+            self.types[name] = rtype
+        if samples_changed:
+            self._save_samples(sampled)
+        for name, rtype in self.types.items():
+            try:
+                self.by_type.setdefault(rtype, []).append(name)
+            except TypeError:
+                # unhashable annotations can still be found through `names_for(None)`
+                continue
+
+    def _from_annotation_or_table(self, name: str, func: Any) -> Any:
+        try:
+            annotation = inspect.signature(func).return_annotation
+        except (ValueError, TypeError):
+            return Any
+        if isinstance(annotation, type) and annotation is not inspect.Signature.empty:
+            return annotation
+        if _is_faker_builtin(func) and name in FAKER_RETURN_TYPES:
+            return FAKER_RETURN_TYPES[name]
+        if annotation is not inspect.Signature.empty:
+            return annotation
+        return _UNRESOLVED
+
+    @staticmethod
+    def _sample(func: Any) -> type:
+        try:
+            return type(func())
+        except Exception:
+            return Any
+
+    def _load_samples(self) -> dict[str, str]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_samples(self, sampled: dict[str, str]) -> None:
+        if not self.cache_path:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_path), suffix='.json.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(sampled, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, name: str) -> Any:
+        """The return type of a single method, or Any if unknown."""
+        return self.types.get(name, Any)
+
+    def names_for(self, field_type: Any = None) -> list[str]:
+        """Method names whose return type equals field_type. None returns every method."""
+        if field_type is None:
+            return list(self.types)
+        try:
+            return list(self.by_type.get(field_type, ()))
+        except TypeError:
+            return [name for name, rtype in self.types.items() if rtype == field_type]
+
+def get_type_catalog(provider: object) -> TypeCatalog:
+    """Returns the type catalog for a provider, building it once per provider class, locale and method set."""
+    from pymocker.builder.registry import get_provider_registry
+    registry = get_provider_registry(provider)
+    names = registry.names
+    key = hashlib.sha256(registry.fingerprint.encode()).hexdigest()[:32]
+    catalog = _CATALOGS.get(key)
+    if catalog is not None:
+        return catalog
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(key)
+        if catalog is None:
+            cache_path = os.path.join(get_cache_dir('types'), f"{key}.json")
+            catalog = TypeCatalog(provider, names, cache_path)
+            _CATALOGS[key] = catalog
+    return catalog
+
+def clear_type_catalogs() -> None:
+    """Forgets in-memory catalogs. Files in the cache directory are left alone."""
+    with _CATALOGS_LOCK:
+        _CATALOGS.clear()
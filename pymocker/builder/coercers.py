@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import collections.abc
 import inspect
+import re
+from functools import lru_cache, partial
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Collection, get_origin, Type, TypeVar
+from random import Random
+from typing import Any, Callable, Collection, Mapping, get_origin, Type, TypeVar
 from uuid import UUID, uuid1, uuid3, uuid4, uuid5, NAMESPACE_DNS
 
+from polyfactory.factories.base import BaseFactory
+
+from .patterns import get_pattern_generator
+
 T = TypeVar("T")
 
 
@@ -66,8 +74,17 @@ def coerce_decimal(value: Decimal, gt: Decimal | None = None, ge: Decimal | None
 
     return value
 
-def coerce_string(value: str, min_length: int | None = None, max_length: int | None = None, lower_case: bool = False, upper_case: bool = False, **kwargs) -> str:
-    """Applies constraints to a string value. Note: pattern coercion is not supported."""
+def coerce_string(value: str, min_length: int | None = None, max_length: int | None = None, lower_case: bool = False, upper_case: bool = False, pattern: str | None = None, random: Random | None = None, **kwargs) -> str:
+    """
+    Applies constraints to a string value. A value not matching the pattern is replaced by one
+    generated from it with `random`, the factory's, or polyfactory's default factory random instance.
+    """
+    if pattern and not re.search(pattern, value):
+        try:
+            return get_pattern_generator(pattern).generate(random or BaseFactory.__random__, min_length, max_length)
+        except ValueError:
+            # includes UnsupportedPattern, fall back to fitting the length
+            pass
     if lower_case: value = value.lower()
     if upper_case: value = value.upper()
 
@@ -154,23 +171,51 @@ COERCER_MAP = {
     Path: coerce_path,
 }
 
-def coerce_value(value: Any, annotation: Any, **constraints: Any) -> Any:
+def _identity(value: Any) -> Any:
+    return value
+
+@lru_cache(maxsize=None)
+def _parameter_names(func: Callable[..., Any]) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+def _build_coercer(origin_type: Any, constraints: Mapping[str, Any], random: Random | None = None) -> Callable[[Any], Any]:
+    coercer = COERCER_MAP.get(origin_type)
+    if coercer is None:
+        return _identity
+    valid_keys = _parameter_names(coercer)
+    kwargs = {k: v for k, v in constraints.items() if k in valid_keys}
+    if random is not None and 'random' in valid_keys:
+        kwargs['random'] = random
+    return partial(coercer, **kwargs)
+
+@lru_cache(maxsize=4096)
+def _cached_coercer(origin_type: Any, constraint_items: tuple[tuple[str, Any], ...], random: Random | None) -> Callable[[Any], Any]:
+    return _build_coercer(origin_type, dict(constraint_items), random)
+
+def _coercer_for(origin_type: Any, constraints: Mapping[str, Any], random: Random | None = None) -> Callable[[Any], Any]:
+    try:
+        return _cached_coercer(origin_type, tuple(sorted(constraints.items())), random)
+    except TypeError:
+        # unhashable constraint values
+        return _build_coercer(origin_type, constraints, random)
+
+def compile_coercer(annotation: Any, constraints: Mapping[str, Any] | None = None, random: Random | None = None) -> Callable[[Any], Any]:
     """
-    Dynamically selects and applies the correct coercer for a given type annotation.
-    If no coercer is found, it returns the original value.
+    Compiles the coercion for an (annotation, constraints) pair into a single callable taking the value.
+    Type dispatch and constraint filtering happen here, once, and the result is cached.
+    `random` is the instance coercers draw from, e.g. the factory's, so seeded factories stay reproducible.
     """
+    constraints = constraints or {}
     origin_type = get_origin(annotation) or annotation
-    
-    # Special case for Collection since it's not a concrete type
-    if origin_type is Collection:
-        origin_type = type(value)
 
-    coercer = COERCER_MAP.get(origin_type)
+    # Special case for Collection since it's not a concrete type
+    if origin_type is Collection or origin_type is collections.abc.Collection:
+        return lambda value: _coercer_for(type(value), constraints, random)(value)
+    return _coercer_for(origin_type, constraints, random)
 
-    if coercer:
-        sig = inspect.signature(coercer)
-        valid_keys = {p.name for p in sig.parameters.values()}
-        relevant_constraints = {k: v for k, v in constraints.items() if k in valid_keys}
-        return coercer(value, **relevant_constraints)
-    
-    return value
+def coerce_value(value: Any, annotation: Any, **constraints: Any) -> Any:
+    """
+    Dynamically selects and applies the correct coercer for a given type annotation.
+    If no coercer is found, it returns the original value.
+    """
+    return compile_coercer(annotation, constraints)(value)
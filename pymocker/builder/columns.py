@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import copy
+import re
+import string
+import threading
+import weakref
+from collections import OrderedDict
+from itertools import accumulate, repeat
+from typing import Any, Callable
+
+from faker.generator import Generator
+from faker.providers import BaseProvider
+
+# Faker's token syntax, see faker.generator.Generator.parse
+_TOKEN = re.compile(r"\{\{\s*(\w+)(:\s*\w+?)?\s*\}\}")
+# Faker methods rewriting a template character by character
+_TEMPLATE_METHODS = ('numerify', 'lexify', 'bothify', 'hexify')
+# What each placeholder of a template method is replaced with, all equally likely: '!' and '@'
+# are empty half of the time, as in random_digit_or_empty and random_digit_not_null_or_empty
+_DIGITS = tuple('0123456789')
+_NUMERIFY = {'#': _DIGITS, '%': _DIGITS[1:], '$': _DIGITS[2:], '!': ('',) * 10 + _DIGITS, '@': ('',) * 9 + _DIGITS[1:]}
+_PLACEHOLDERS = {
+    'numerify': _NUMERIFY,
+    'lexify': {'?': tuple(string.ascii_letters)},
+    'bothify': {**_NUMERIFY, '?': tuple(string.ascii_letters)},
+    'hexify': {'^': tuple(string.hexdigits[:-6])},
+}
+# The BaseProvider methods template methods draw with; a provider overriding one is left to Faker
+_REWRITE_HELPERS = _TEMPLATE_METHODS + (
+    'random_digit', 'random_digit_not_null', 'random_digit_above_two', 'random_digit_or_empty',
+    'random_digit_not_null_or_empty', 'random_element', 'random_elements',
+)
+# Nesting of templates followed when compiling a column, e.g. name -> first_name
+_MAX_DEPTH = 8
+
+ColumnDraw = Callable[[int], list[Any]]
+
+_DRAWS: weakref.WeakKeyDictionary[object, dict[Any, ColumnDraw | None]] = weakref.WeakKeyDictionary()
+_DRAWS_LOCK = threading.Lock()
+# Copies of Faker generators for the methods that are not traced, with the providers they were copied with
+_FAST_GENERATORS: weakref.WeakKeyDictionary[Generator, tuple[tuple[int, ...], _FastGenerator]] = weakref.WeakKeyDictionary()
+
+class _Untraceable(Exception):
+    pass
+
+class _Marker:
+    """Stands for a value drawn while a method is traced. Using it in any other way stops the trace."""
+    __slots__ = ('node',)
+
+    def __init__(self, node: tuple):
+        self.node = node
+
+    def _refuse(self, *args: Any, **kwargs: Any) -> Any:
+        raise _Untraceable
+
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _refuse
+    __bool__ = __hash__ = __len__ = __iter__ = __contains__ = _refuse
+    __str__ = __repr__ = __format__ = __getitem__ = _refuse
+    __add__ = __radd__ = __mul__ = __rmul__ = __mod__ = _refuse
+
+class _ProbeGenerator:
+    """The generator of a traced provider: records `parse` of a drawn template, refuses anything else."""
+    def __init__(self, calls: list[_Marker]):
+        self._calls = calls
+
+    def parse(self, text: Any) -> _Marker:
+        if not isinstance(text, _Marker):
+            raise _Untraceable
+        marker = _Marker(('parse', text.node))
+        self._calls.append(marker)
+        return marker
+
+    def __getattr__(self, name: str) -> Any:
+        raise _Untraceable
+
+def _trace(method: Callable[[], Any]) -> tuple | None:
+    """
+    How a Faker provider method builds its value, as a tree of ('element', elements, use_weighting),
+    ('parse', template) and (template method, template) nodes, or None when it does anything else:
+    other randomness, arguments, branching on a drawn value or changing it.
+    """
+    provider = getattr(method, '__self__', None)
+    func = getattr(method, '__func__', None)
+    if func is None or not callable(getattr(provider, 'random_elements', None)) or not hasattr(provider, 'generator'):
+        return None
+    calls: list[_Marker] = []
+
+    def random_elements(elements: Any = ('a', 'b', 'c'), length: int | None = None, unique: bool = False, use_weighting: bool | None = None) -> list[_Marker]:
+        # Faker refuses plain dicts, as their order depended on PYTHONHASHSEED
+        if length != 1 or unique or isinstance(elements, _Marker) or (isinstance(elements, dict) and not isinstance(elements, OrderedDict)):
+            raise _Untraceable
+        marker = _Marker(('element', elements, use_weighting))
+        calls.append(marker)
+        return [marker]
+
+    def template_method(name: str) -> Callable[..., _Marker]:
+        def rewrite(text: Any = None, *args: Any, **kwargs: Any) -> _Marker:
+            if not isinstance(text, _Marker) or args or kwargs:
+                raise _Untraceable
+            marker = _Marker((name, text.node))
+            calls.append(marker)
+            return marker
+        return rewrite
+
+    try:
+        probe = copy.copy(provider)
+        probe.random_elements = random_elements
+        for name in _TEMPLATE_METHODS:
+            setattr(probe, name, template_method(name))
+        probe.generator = _ProbeGenerator(calls)
+        result = func(probe)
+    except Exception:
+        return None
+    if type(result) is not _Marker:
+        return None
+    # every draw must end up in the value, each exactly once
+    nodes = 0
+    node = result.node
+    while node[0] != 'element':
+        nodes += 1
+        node = node[1]
+    return result.node if nodes + 1 == len(calls) else None
+
+def _element_draw(provider: Any, elements: Any, use_weighting: bool | None) -> ColumnDraw:
+    """Draws from a Faker collection as `random_element` does, weighted for OrderedDicts."""
+    if use_weighting is None:
+        use_weighting = getattr(provider, '__use_weighting__', True)
+    weighted = isinstance(elements, dict) and use_weighting
+    keys = tuple(elements)
+    cum_weights = list(accumulate(elements.values())) if weighted else None
+
+    def draw(size: int) -> list[Any]:
+        # the weights are summed once, not again for every value
+        return provider.generator.random.choices(keys, cum_weights=cum_weights, k=size)
+    return draw
+
+def _template_draw(provider: Any, templates: ColumnDraw, depth: int) -> ColumnDraw:
+    """Parses a column of Faker templates, drawing each token's values as a column of its own."""
+    generator = provider.generator
+    compiled: dict[str, list[Any]] = {}
+
+    def pieces(template: str) -> list[Any]:
+        parts = compiled.get(template)
+        if parts is None:
+            parts, end = [], 0
+            for match in _TOKEN.finditer(template):
+                parts.append(template[end:match.start()])
+                name, argument_group = match.groups()
+                if argument_group:
+                    # argument groups are looked up per call, leave the template to Faker
+                    parts = None
+                    break
+                formatter = generator.get_formatter(name)
+                parts.append(compile_column_draw(formatter, depth + 1) or _call_draw(formatter))
+                end = match.end()
+            if parts is not None:
+                parts.append(template[end:])
+            compiled[template] = parts
+        return parts
+
+    def draw(size: int) -> list[Any]:
+        values = templates(size)
+        rows: dict[str, list[int]] = {}
+        for row, template in enumerate(values):
+            rows.setdefault(template, []).append(row)
+        for template, positions in rows.items():
+            parts = pieces(template)
+            if parts is None:
+                for row in positions:
+                    values[row] = generator.parse(template)
+                continue
+            count = len(positions)
+            columns = [repeat(part) if isinstance(part, str) else map(str, part(count)) for part in parts]
+            for row, value in zip(positions, map(''.join, zip(*columns))):
+                values[row] = value
+        return values
+    return draw
+
+def _rewrite_draw(provider: Any, kind: str, templates: ColumnDraw) -> ColumnDraw:
+    """
+    Applies a template method to a column of templates, drawing each placeholder's replacements
+    as a column, or calling the method per value when the provider overrides how it draws.
+    """
+    rewrite = getattr(provider, kind)
+    if any(getattr(type(provider), name) is not getattr(BaseProvider, name) for name in _REWRITE_HELPERS):
+        return lambda size: [rewrite(template) for template in templates(size)]
+    placeholders = _PLACEHOLDERS[kind]
+
+    def draw(size: int) -> list[Any]:
+        values = templates(size)
+        rows: dict[str, list[int]] = {}
+        for row, template in enumerate(values):
+            rows.setdefault(template, []).append(row)
+        choices = provider.generator.random.choices
+        for template, positions in rows.items():
+            count = len(positions)
+            columns = [
+                choices(placeholders[char], k=count) if char in placeholders else repeat(char)
+                for char in template
+            ]
+            for row, value in zip(positions, map(''.join, zip(*columns))):
+                values[row] = value
+        return values
+    return draw
+
+def _call_draw(method: Callable[[], Any]) -> ColumnDraw:
+    return lambda size: [method() for _ in range(size)]
+
+class _FastGenerator(Generator):
+    """
+    A copy of a Faker generator, drawing from its random, whose providers pick weighted elements
+    without summing the weights again for every value.
+    """
+    _source: Generator
+    # the provider copies, by id of the provider they were copied from
+    _copies: dict[int, BaseProvider]
+
+    @property
+    def random(self) -> Any:
+        return self._source.random
+
+def _fast_random_elements(provider: BaseProvider) -> Callable[..., Any]:
+    """`random_elements` of a provider copy: single elements of OrderedDicts are drawn with cumulative weights kept on the dict."""
+    def random_elements(elements: Any = ('a', 'b', 'c'), length: int | None = None, unique: bool = False, use_weighting: bool | None = None) -> Any:
+        if length != 1 or unique or not isinstance(elements, OrderedDict):
+            return BaseProvider.random_elements(provider, elements, length, unique, use_weighting)
+        if not (use_weighting if use_weighting is not None else provider.__use_weighting__):
+            return [provider.generator.random.choice(tuple(elements))]
+        # kept on the dict like Faker's own _key_cache
+        cache = getattr(elements, '_cum_weights_cache', None)
+        if cache is None:
+            cache = elements._cum_weights_cache = (tuple(elements), list(accumulate(elements.values())))
+        return provider.generator.random.choices(cache[0], cum_weights=cache[1], k=1)
+    return random_elements
+
+def _fast_generator(generator: Generator) -> _FastGenerator:
+    """The copy of a generator its untraced methods run on, made again when its providers change."""
+    key = tuple(map(id, generator.providers))
+    cached = _FAST_GENERATORS.get(generator)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    fast = _FastGenerator.__new__(_FastGenerator)
+    fast.__dict__.update(vars(generator))
+    fast._source = generator
+    copies = fast._copies = {id(provider): _fast_provider(provider, fast) for provider in generator.providers}
+    fast.providers = list(copies.values())
+    # formatters are the providers' bound methods, see Generator.add_provider
+    for name, formatter in vars(generator).items():
+        owner = copies.get(id(getattr(formatter, '__self__', None)))
+        if owner is not None:
+            setattr(fast, name, getattr(owner, name))
+    with _DRAWS_LOCK:
+        _FAST_GENERATORS[generator] = (key, fast)
+    return fast
+
+def _fast_provider(provider: BaseProvider, generator: Generator) -> BaseProvider:
+    fast = copy.copy(provider)
+    fast.generator = generator
+    if type(provider).random_elements is BaseProvider.random_elements:
+        fast.random_elements = _fast_random_elements(fast)
+    return fast
+
+def _fast_call_draw(method: Callable[[], Any]) -> ColumnDraw:
+    """
+    Calls a Faker provider method once per value, on a copy of its generator (see `_FastGenerator`),
+    and on a copy of its provider sharing that generator.
+    """
+    provider, func = method.__self__, method.__func__
+    bound: dict[int, Callable[[], Any]] = {}
+
+    def draw(size: int) -> list[Any]:
+        fast = _fast_generator(provider.generator)
+        call = bound.get(id(fast))
+        if call is None:
+            # a provider that was not added to its generator gets a copy of its own
+            owner = fast._copies.get(id(provider)) or _fast_provider(provider, fast)
+            bound.clear()
+            call = bound[id(fast)] = func.__get__(owner)
+        return [call() for _ in range(size)]
+    return draw
+
+def _compile_node(provider: Any, node: tuple, depth: int) -> ColumnDraw:
+    kind = node[0]
+    if kind == 'element':
+        return _element_draw(provider, node[1], node[2])
+    inner = _compile_node(provider, node[1], depth)
+    if kind == 'parse':
+        return _template_draw(provider, inner, depth)
+    return _rewrite_draw(provider, kind, inner)
+
+def compile_column_draw(method: Callable[[], Any], depth: int = 0) -> ColumnDraw | None:
+    """
+    A function drawing a column of values of a Faker provider method at once, or None when the
+    method is not one. Methods picking an element of a collection, parsing a picked template, or
+    numerifying/lexifying one are traced once on a copy of their provider, then elements are drawn
+    in one loop without Faker's per-call overhead and templates are filled token by token, each
+    token's values drawn as a column. Methods doing anything else, e.g. drawing numbers or
+    post-processing the template like email, are called once per value on a copy of their
+    generator that keeps the weights of the elements it picks (see `_FastGenerator`). The values
+    follow the method's distribution, from the provider's random, though not in the order of
+    successive calls.
+    """
+    provider = getattr(method, '__self__', None)
+    func = getattr(method, '__func__', None)
+    if provider is None or func is None or depth > _MAX_DEPTH:
+        return None
+    try:
+        draws = _DRAWS.get(provider)
+    except TypeError:
+        return None
+    if draws is not None and func in draws:
+        return draws[func]
+    node = _trace(method)
+    if node is not None:
+        draw = _compile_node(provider, node, depth)
+    elif isinstance(provider, BaseProvider) and isinstance(getattr(provider, 'generator', None), Generator):
+        draw = _fast_call_draw(method)
+    else:
+        draw = None
+    with _DRAWS_LOCK:
+        _DRAWS.setdefault(provider, {})[func] = draw
+    return draw
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+_object_setattr = object.__setattr__
+
+def _is_plain_model(model: type) -> bool:
+    """A pydantic v2 model whose model_construct does nothing beyond setting fields and defaults."""
+    fields = getattr(model, '__pydantic_fields__', None)
+    if fields is None or getattr(model, '__pydantic_root_model__', False):
+        return False
+    if getattr(model, '__pydantic_post_init__', None) or model.model_config.get('extra') == 'allow':
+        return False
+    return all(field.alias in (None, name) and field.validation_alias in (None, name) for name, field in fields.items())
+
+def compile_constructor(model: type) -> Callable[[dict[str, Any]], Any] | None:
+    """
+    Compiles the equivalent of `model.model_construct(**row)` for trusted rows: an instance created
+    without validation, with defaults for the fields missing from the row. The field order and
+    defaults are resolved once, so the result is cheaper than model_construct, which rediscovers
+    aliases on every call. A row holding exactly the model's fields, in order, is used as the
+    instance's __dict__ without copying. Models with aliases, extra='allow', a root or a
+    post-init hook fall back to model_construct. None for classes that are not pydantic v2 models.
+    """
+    if not hasattr(model, 'model_construct'):
+        return None
+    if not _is_plain_model(model):
+        return lambda row: model.model_construct(**row)
+
+    fields = [(name, None if field.is_required() else field) for name, field in model.__pydantic_fields__.items()]
+    names = tuple(name for name, _ in fields)
+    new = model.__new__
+
+    def construct(row: dict[str, Any]) -> Any:
+        if tuple(row) == names:
+            # every field in order, the usual generated row: it becomes the instance's __dict__
+            values = row
+            fields_set = set(names)
+        else:
+            values = {}
+            for name, default in fields:
+                if name in row:
+                    values[name] = row[name]
+                elif default is not None:
+                    values[name] = default.get_default(call_default_factory=True, validated_data=values)
+            fields_set = {name for name in row if name in values}
+        instance = new(model)
+        _object_setattr(instance, '__dict__', values)
+        _object_setattr(instance, '__pydantic_fields_set__', fields_set)
+        _object_setattr(instance, '__pydantic_extra__', None)
+        _object_setattr(instance, '__pydantic_private__', None)
+        return instance
+    return construct
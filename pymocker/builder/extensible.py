@@ -1,21 +1,131 @@
 from __future__ import annotations
 
+import math
+import threading
+import time
+from collections import deque
+from itertools import compress
+from random import Random
 from typing import Any, Callable, TypeVar
 
-from .coercers import coerce_value
-from .validators import is_valid
+from .coercers import compile_coercer
+from .columns import compile_column_draw
+from .validators import compile_block_validator, compile_validator
 
 T = TypeVar("T")
 
+# Calls sampled with the full retry budget before a field's statistics are trusted
+ADAPTIVE_WARMUP_CALLS = 5
+# Below this estimated acceptance rate a field is only probed, then coerced
+MIN_ACCEPTANCE_RATE = 0.01
+PROBE_RETRIES = 3
+# The adaptive budget allows enough retries to pass with this probability
+TARGET_PASS_PROBABILITY = 0.99
+
 class GenerationError(Exception):
     """Raised when a valid value cannot be generated."""
 
+class FieldStats:
+    """
+    Running acceptance statistics of one field's rejection sampler.
+    A field whose values almost never pass points at an unsuitable provider method.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.accepted = 0
+        self.coerced = 0
+        self.failed = 0
+        self.directed = 0
+        self.timeouts = 0
+
+    @property
+    def acceptance_rate(self) -> float | None:
+        """Share of generated candidates that passed, None before the first attempt."""
+        return self.accepted / self.attempts if self.attempts else None
+
+    def retry_budget(self, max_retries: int) -> int:
+        """
+        The number of attempts worth making on the next call. Starts at max_retries, then
+        allows just enough attempts to pass with TARGET_PASS_PROBABILITY at the observed rate.
+        Fields that almost never pass get PROBE_RETRIES, which keeps the estimate current.
+        """
+        if self.calls < ADAPTIVE_WARMUP_CALLS:
+            return max_retries
+        # smoothed, so a perfect record still leaves room for an occasional retry
+        rate = (self.accepted + 1) / (self.attempts + 2)
+        if rate < MIN_ACCEPTANCE_RATE:
+            return min(PROBE_RETRIES, max_retries)
+        needed = math.ceil(math.log(1 - TARGET_PASS_PROBABILITY) / math.log(1 - rate))
+        return max(1, min(needed, max_retries))
+
+    def record(self, attempts: int, accepted: bool, coerced: bool = False, timed_out: bool = False) -> None:
+        self.calls += 1
+        self.attempts += attempts
+        if timed_out:
+            self.timeouts += 1
+        if accepted:
+            self.accepted += 1
+        elif coerced:
+            self.coerced += 1
+        else:
+            self.failed += 1
+
+    def record_block(self, attempts: int, accepted: int) -> None:
+        """Counts a block of candidates drawn ahead of the calls that will use them."""
+        self.attempts += attempts
+        self.accepted += accepted
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'attempts': self.attempts,
+            'accepted': self.accepted,
+            'coerced': self.coerced,
+            'failed': self.failed,
+            'directed': self.directed,
+            'timeouts': self.timeouts,
+            'acceptance_rate': self.acceptance_rate,
+        }
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{k}={v!r}" for k, v in self.as_dict().items())
+        return f"FieldStats({fields})"
+
+class BuildStats:
+    """Builds of a factory with a time budget, and how many of them ran past their deadline."""
+    def __init__(self):
+        self.builds = 0
+        self.timeouts = 0
+
+    def record(self, timed_out: bool, builds: int = 1) -> None:
+        self.builds += builds
+        if timed_out:
+            self.timeouts += builds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {'builds': self.builds, 'timeouts': self.timeouts}
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{k}={v!r}" for k, v in self.as_dict().items())
+        return f"BuildStats({fields})"
+
+def deadline_after(budget: float | None, deadline: float | None = None) -> float | None:
+    """The time.perf_counter() value budget seconds from now, or the earlier given deadline."""
+    if budget is None:
+        return deadline
+    own = time.perf_counter() + budget
+    return own if deadline is None else min(own, deadline)
+
 def generate_by_rejection_sampling(
     generator: Callable[..., T],
     annotation: Any,
     constraints: dict[str, Any],
     max_retries: int = 100,
     coerce_on_fail: bool = False,
+    stats: FieldStats | None = None,
+    deadline: float | None = None,
+    random: Random | None = None,
 ) -> T:
     """
     Generates a value by repeatedly calling a generator until it satisfies the given constraints.
@@ -27,18 +137,212 @@ def generate_by_rejection_sampling(
     :param constraints: A dictionary of constraints for the validator.
     :param max_retries: The maximum number of attempts before raising an exception or coercing.
     :param coerce_on_fail: If True, will coerce the last value on failure instead of raising an error.
+    :param stats: Acceptance statistics of the field, updated by this call. With coerce_on_fail,
+        they shrink the retry budget of fields that rarely pass, see FieldStats.retry_budget.
+    :param deadline: A time.perf_counter() value after which no further attempt is made, as if
+        the retries had run out. At least one attempt is always made.
+    :param random: The random instance coercion draws from, e.g. the factory's, so seeded
+        factories coerce reproducibly.
     :raises GenerationError: If a valid value cannot be generated and coerce_on_fail is False.
     :return: A valid value that satisfies the constraints.
     """
+    check = compile_validator(annotation, constraints)
+    budget = stats.retry_budget(max_retries) if stats is not None and coerce_on_fail else max_retries
     last_value = None
-    for _ in range(max_retries):
+    attempts = 0
+    timed_out = False
+    while attempts < budget:
+        attempts += 1
         last_value = generator()
-        if last_value is not None and is_valid(last_value, annotation, **constraints):
+        if last_value is not None and check(last_value):
+            if stats is not None:
+                stats.record(attempts, accepted=True)
             return last_value
+        if deadline is not None and attempts < budget and time.perf_counter() >= deadline:
+            timed_out = True
+            break
 
+    if stats is not None:
+        stats.record(attempts, accepted=False, coerced=coerce_on_fail and last_value is not None, timed_out=timed_out)
     if coerce_on_fail:
         if last_value is not None:
-            return coerce_value(last_value, annotation, **constraints)
+            return compile_coercer(annotation, constraints, random)(last_value)
+
+    msg = f"Could not generate a valid value for type '{annotation}' with constraints {constraints} after {attempts} attempts" + (" as its time budget ran out." if timed_out else ".")
+    raise GenerationError(msg)
+
+def generate_column_by_rejection_sampling(
+    generator: Callable[..., T],
+    annotation: Any,
+    constraints: dict[str, Any],
+    size: int,
+    max_retries: int = 100,
+    coerce_on_fail: bool = False,
+    stats: FieldStats | None = None,
+    deadline: float | None = None,
+    random: Random | None = None,
+) -> list[T]:
+    """
+    Column form of generate_by_rejection_sampling: size values, each the first accepted value of its
+    own sequence of at most max_retries candidates, so the values follow the same distribution as size
+    separate calls. Candidates for every position still missing a value are drawn in one loop, as a
+    column when `compile_column_draw` can compile the generator, and checked at once with a block validator.
+
+    :param size: The number of values to generate.
+    :param deadline: A time.perf_counter() value after which no further round of candidates is drawn.
+    :param random: The random instance coercion draws from.
+    :raises GenerationError: If a valid value cannot be generated for every position and coerce_on_fail is False.
+    :return: A list of size values satisfying the constraints.
+    """
+    check_block = compile_block_validator(annotation, constraints)
+    draw = compile_column_draw(generator) or (lambda count: [generator() for _ in range(count)])
+    budget = stats.retry_budget(max_retries) if stats is not None and coerce_on_fail else max_retries
+    values: list[Any] = [None] * size
+    last_values: list[Any] = [None] * size
+    pending = list(range(size))
+    attempts = rounds = 0
+    timed_out = False
+    while pending and rounds < budget:
+        if rounds and deadline is not None and time.perf_counter() >= deadline:
+            timed_out = True
+            break
+        rounds += 1
+        candidates = draw(len(pending))
+        attempts += len(candidates)
+        rejected = []
+        for position, candidate, ok in zip(pending, candidates, check_block(candidates)):
+            if ok:
+                values[position] = candidate
+            else:
+                last_values[position] = candidate
+                rejected.append(position)
+        pending = rejected
+
+    coercible = coerce_on_fail and all(last_values[position] is not None for position in pending)
+    if stats is not None:
+        stats.calls += size
+        stats.attempts += attempts
+        stats.accepted += size - len(pending)
+        if coercible:
+            stats.coerced += len(pending)
+        else:
+            stats.failed += len(pending)
+        if timed_out:
+            stats.timeouts += len(pending)
+    if not pending:
+        return values
+    if coercible:
+        coerce = compile_coercer(annotation, constraints, random)
+        for position in pending:
+            values[position] = coerce(last_values[position])
+        return values
+
+    msg = f"Could not generate {len(pending)} of {size} valid values for type '{annotation}' with constraints {constraints} after {rounds} attempts each."
+    raise GenerationError(msg)
+
+class CandidateBuffer:
+    """
+    Accepted values of one field, drawn and validated in blocks of `block_size` candidates.
+    Each block is checked at once with a block validator, and the values that pass are handed
+    out to successive calls, so many builds share a few large loops instead of one each.
+    """
+    def __init__(
+        self,
+        generator: Callable[..., T],
+        annotation: Any,
+        constraints: dict[str, Any],
+        block_size: int = 64,
+    ):
+        self.generator = generator
+        self.annotation = annotation
+        self.constraints = constraints
+        self.block_size = max(int(block_size), 1)
+        self.check_block = compile_block_validator(annotation, constraints)
+        self.accepted: deque[T] = deque()
+        self._last_block: tuple[list[T], list[bool]] = ([], [])
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.accepted)
+
+    def take(self, max_candidates: int, stats: FieldStats | None = None, deadline: float | None = None) -> T:
+        """
+        Pops the oldest accepted value, first drawing blocks until one is accepted,
+        max_candidates were drawn or, after the first block, the time.perf_counter()
+        deadline has passed. Raises IndexError when nothing was accepted.
+        """
+        with self._lock:
+            drawn = 0
+            while not self.accepted and drawn < max_candidates:
+                if drawn and deadline is not None and time.perf_counter() >= deadline:
+                    break
+                size = min(self.block_size, max_candidates - drawn)
+                drawn += size
+                self._draw_block(size, stats)
+            return self.accepted.popleft()
+
+    def _draw_block(self, size: int, stats: FieldStats | None) -> None:
+        candidates = [self.generator() for _ in range(size)]
+        mask = self.check_block(candidates)
+        before = len(self.accepted)
+        self.accepted.extend(compress(candidates, mask))
+        if len(self.accepted) - before < size:
+            self._last_block = (candidates, mask)
+        if stats is not None:
+            stats.record_block(size, len(self.accepted) - before)
+
+    @property
+    def last_rejected(self) -> T | None:
+        """The most recent candidate that failed the constraints and is not None, used for coercion."""
+        candidates, mask = self._last_block
+        for candidate, ok in zip(reversed(candidates), reversed(mask)):
+            if not ok and candidate is not None:
+                return candidate
+        return None
+
+def generate_by_batch_rejection_sampling(
+    buffer: CandidateBuffer,
+    max_retries: int = 100,
+    coerce_on_fail: bool = False,
+    stats: FieldStats | None = None,
+    deadline: float | None = None,
+    random: Random | None = None,
+) -> T:
+    """
+    Block form of generate_by_rejection_sampling: returns the next accepted value from the buffer,
+    drawing new blocks of candidates when it runs empty. At most max_retries candidates are drawn
+    per call, the same budget as the one-by-one sampler.
+
+    :param buffer: The CandidateBuffer of the field, holding its generator and constraints.
+    :param max_retries: The maximum number of candidates drawn before raising an exception or coercing.
+    :param coerce_on_fail: If True, will coerce the last rejected value on failure instead of raising an error.
+    :param stats: Acceptance statistics of the field, updated by this call.
+    :param deadline: A time.perf_counter() value after which no further block is drawn.
+    :param random: The random instance coercion draws from.
+    :raises GenerationError: If a valid value cannot be generated and coerce_on_fail is False.
+    :return: A valid value that satisfies the constraints.
+    """
+    budget = stats.retry_budget(max_retries) if stats is not None and coerce_on_fail else max_retries
+    try:
+        value = buffer.take(budget, stats, deadline)
+    except IndexError:
+        pass
+    else:
+        if stats is not None:
+            stats.calls += 1
+        return value
+
+    last_value = buffer.last_rejected
+    if stats is not None:
+        stats.calls += 1
+        if deadline is not None and time.perf_counter() >= deadline:
+            stats.timeouts += 1
+        if coerce_on_fail and last_value is not None:
+            stats.coerced += 1
+        else:
+            stats.failed += 1
+    if coerce_on_fail and last_value is not None:
+        return compile_coercer(buffer.annotation, buffer.constraints, random)(last_value)
 
-    msg = f"Could not generate a valid value for type '{annotation}' with constraints {constraints} after {max_retries} attempts."
+    msg = f"Could not generate a valid value for type '{buffer.annotation}' with constraints {buffer.constraints} after {budget} attempts."
     raise GenerationError(msg)
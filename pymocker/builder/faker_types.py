@@ -0,0 +1,283 @@
+"""
+Return types of the built-in Faker provider methods, sampled once from the
+default en_US generator. Used by the type catalog so that field-type
+filtering never has to call a Faker method just to learn what it returns.
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+FAKER_RETURN_TYPES: dict[str, type] = {
+    'aba': str,
+    'address': str,
+    'administrative_unit': str,
+    'am_pm': str,
+    'android_platform_token': str,
+    'ascii_company_email': str,
+    'ascii_email': str,
+    'ascii_free_email': str,
+    'ascii_safe_email': str,
+    'bank': str,
+    'bank_country': str,
+    'basic_phone_number': str,
+    'bban': str,
+    'binary': bytes,
+    'boolean': bool,
+    'bothify': str,
+    'bs': str,
+    'building_number': str,
+    'catch_phrase': str,
+    'century': str,
+    'chrome': str,
+    'city': str,
+    'city_prefix': str,
+    'city_suffix': str,
+    'color': str,
+    'color_hsl': tuple,
+    'color_hsv': tuple,
+    'color_name': str,
+    'color_rgb': tuple,
+    'color_rgb_float': tuple,
+    'company': str,
+    'company_email': str,
+    'company_suffix': str,
+    'coordinate': Decimal,
+    'country': str,
+    'country_calling_code': str,
+    'country_code': str,
+    'credit_card_expire': str,
+    'credit_card_full': str,
+    'credit_card_number': str,
+    'credit_card_provider': str,
+    'credit_card_security_code': str,
+    'cryptocurrency': tuple,
+    'cryptocurrency_code': str,
+    'cryptocurrency_name': str,
+    'csv': str,
+    'currency': tuple,
+    'currency_code': str,
+    'currency_name': str,
+    'currency_symbol': str,
+    'current_country': str,
+    'current_country_code': str,
+    'date': str,
+    'date_between': date,
+    'date_between_dates': date,
+    'date_object': date,
+    'date_of_birth': date,
+    'date_this_century': date,
+    'date_this_decade': date,
+    'date_this_month': date,
+    'date_this_year': date,
+    'date_time': datetime,
+    'date_time_ad': datetime,
+    'date_time_between': datetime,
+    'date_time_between_dates': datetime,
+    'date_time_this_century': datetime,
+    'date_time_this_decade': datetime,
+    'date_time_this_month': datetime,
+    'date_time_this_year': datetime,
+    'day_of_month': str,
+    'day_of_week': str,
+    'dga': str,
+    'doi': str,
+    'domain_name': str,
+    'domain_word': str,
+    'dsv': str,
+    'ean': str,
+    'ean13': str,
+    'ean8': str,
+    'ein': str,
+    'email': str,
+    'emoji': str,
+    'file_extension': str,
+    'file_name': str,
+    'file_path': str,
+    'firefox': str,
+    'first_name': str,
+    'first_name_female': str,
+    'first_name_male': str,
+    'first_name_nonbinary': str,
+    'fixed_width': str,
+    'free_email': str,
+    'free_email_domain': str,
+    'future_date': date,
+    'future_datetime': datetime,
+    'get_words_list': list,
+    'hex_color': str,
+    'hexify': str,
+    'hostname': str,
+    'http_method': str,
+    'http_status_code': int,
+    'iana_id': str,
+    'iban': str,
+    'image': bytes,
+    'image_url': str,
+    'internet_explorer': str,
+    'invalid_ssn': str,
+    'ios_platform_token': str,
+    'ipv4': str,
+    'ipv4_network_class': str,
+    'ipv4_private': str,
+    'ipv4_public': str,
+    'ipv6': str,
+    'isbn10': str,
+    'isbn13': str,
+    'iso8601': str,
+    'itin': str,
+    'job': str,
+    'job_female': str,
+    'job_male': str,
+    'json': str,
+    'json_bytes': bytes,
+    'language_code': str,
+    'language_name': str,
+    'last_name': str,
+    'last_name_female': str,
+    'last_name_male': str,
+    'last_name_nonbinary': str,
+    'latitude': Decimal,
+    'latlng': tuple,
+    'lexify': str,
+    'license_plate': str,
+    'linux_platform_token': str,
+    'linux_processor': str,
+    'local_latlng': tuple,
+    'locale': str,
+    'localized_ean': str,
+    'localized_ean13': str,
+    'localized_ean8': str,
+    'location_on_land': tuple,
+    'longitude': Decimal,
+    'mac_address': str,
+    'mac_platform_token': str,
+    'mac_processor': str,
+    'md5': str,
+    'military_apo': str,
+    'military_dpo': str,
+    'military_ship': str,
+    'military_state': str,
+    'mime_type': str,
+    'month': str,
+    'month_name': str,
+    'msisdn': str,
+    'name': str,
+    'name_female': str,
+    'name_male': str,
+    'name_nonbinary': str,
+    'nic_handle': str,
+    'nic_handles': list,
+    'numerify': str,
+    'opera': str,
+    'paragraph': str,
+    'paragraphs': list,
+    'passport_dates': tuple,
+    'passport_dob': date,
+    'passport_full': str,
+    'passport_gender': str,
+    'passport_number': str,
+    'passport_owner': tuple,
+    'password': str,
+    'past_date': date,
+    'past_datetime': datetime,
+    'phone_number': str,
+    'port_number': int,
+    'postalcode': str,
+    'postalcode_in_state': str,
+    'postalcode_plus4': str,
+    'postcode': str,
+    'postcode_in_state': str,
+    'prefix': str,
+    'prefix_female': str,
+    'prefix_male': str,
+    'prefix_nonbinary': str,
+    'pricetag': str,
+    'profile': dict,
+    'psv': str,
+    'pybool': bool,
+    'pydecimal': Decimal,
+    'pydict': dict,
+    'pyfloat': float,
+    'pyint': int,
+    'pylist': list,
+    'pyset': set,
+    'pystr': str,
+    'pystr_format': str,
+    'pystruct': tuple,
+    'pytuple': tuple,
+    'random_choices': list,
+    'random_digit': int,
+    'random_digit_above_two': int,
+    'random_digit_not_null': int,
+    'random_element': str,
+    'random_elements': list,
+    'random_int': int,
+    'random_letter': str,
+    'random_letters': list,
+    'random_lowercase_letter': str,
+    'random_number': int,
+    'random_sample': list,
+    'random_uppercase_letter': str,
+    'randomize_nb_elements': int,
+    'rgb_color': str,
+    'rgb_css_color': str,
+    'ripe_id': str,
+    'safari': str,
+    'safe_color_name': str,
+    'safe_domain_name': str,
+    'safe_email': str,
+    'safe_hex_color': str,
+    'sbn9': str,
+    'secondary_address': str,
+    'sentence': str,
+    'sentences': list,
+    'sha1': str,
+    'sha256': str,
+    'simple_profile': dict,
+    'slug': str,
+    'ssn': str,
+    'state': str,
+    'state_abbr': str,
+    'street_address': str,
+    'street_name': str,
+    'street_suffix': str,
+    'suffix': str,
+    'suffix_female': str,
+    'suffix_male': str,
+    'suffix_nonbinary': str,
+    'swift': str,
+    'swift11': str,
+    'swift8': str,
+    'tar': bytes,
+    'text': str,
+    'texts': list,
+    'time': str,
+    'time_delta': timedelta,
+    'time_object': time,
+    'timezone': str,
+    'tld': str,
+    'tsv': str,
+    'unix_device': str,
+    'unix_partition': str,
+    'unix_time': float,
+    'upc_a': str,
+    'upc_e': str,
+    'uri': str,
+    'uri_extension': str,
+    'uri_page': str,
+    'uri_path': str,
+    'url': str,
+    'user_agent': str,
+    'user_name': str,
+    'uuid1': str,
+    'uuid4': str,
+    'uuid7': str,
+    'vin': str,
+    'windows_platform_token': str,
+    'word': str,
+    'words': list,
+    'year': str,
+    'zip': bytes,
+    'zipcode': str,
+    'zipcode_in_state': str,
+    'zipcode_plus4': str,
+}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Sequence
+
+import numpy as np
+
+from pymocker.builder.rank import ModelManager, model_manager
+from pymocker.builder.registry import get_provider_registry
+from pymocker.builder.utils import get_cache_dir
+
+_INDEXES: dict[str, "MethodIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+class MethodIndex:
+    """
+    Normalized embeddings of a provider's public method names, stored as one
+    contiguous matrix with a row per name. Scoring a target is a single
+    query encode followed by a matrix-vector product.
+    """
+    def __init__(self, names: Sequence[str], embeddings: np.ndarray, manager: ModelManager = model_manager):
+        self.names = list(names)
+        self.embeddings = embeddings
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        self.manager = manager
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def scores(self, target: str, names: Sequence[str] | None = None) -> np.ndarray:
+        """Cosine similarity of target against every indexed name (or the given subset)."""
+        query = self.manager.get().encode(target, normalize_embeddings=True, convert_to_numpy=True)
+        if names is None:
+            return self.embeddings @ query
+        rows = [self.positions[name] for name in names]
+        return self.embeddings[rows] @ query
+
+    def encode_queries(self, targets: Sequence[str]) -> np.ndarray:
+        """Normalized embeddings of many targets, encoded in a single batch."""
+        return self.manager.get().encode(list(targets), normalize_embeddings=True, convert_to_numpy=True)
+
+    def best_matches(self, targets: Sequence[str], names: Sequence[str] | None = None) -> list[tuple[str, float] | None]:
+        """
+        The best (name, score) for each target. All targets are encoded in one batch and
+        scored with a single names-by-targets matrix product.
+        """
+        if not targets:
+            return []
+        names = self.names if names is None else list(names)
+        if not names:
+            return [None] * len(targets)
+        rows = [self.positions[name] for name in names]
+        similarity = self.embeddings[rows] @ self.encode_queries(targets).T
+        best_rows = similarity.argmax(axis=0)
+        best_scores = similarity[best_rows, np.arange(len(targets))]
+        return [(names[row], float(score)) for row, score in zip(best_rows, best_scores)]
+
+    def best_match_for_query(self, query: np.ndarray, names: Sequence[str] | None = None) -> tuple[str, float] | None:
+        """The best (name, score) for an already encoded query."""
+        names = self.names if names is None else list(names)
+        if not names:
+            return None
+        scores = self.embeddings[[self.positions[name] for name in names]] @ query
+        row = int(scores.argmax())
+        return names[row], float(scores[row])
+
+    def rank(self, target: str, names: Sequence[str] | None = None) -> list[tuple[str, list[float]]]:
+        """Same output shape as `rank()`: (name, [score]) pairs, best first."""
+        names = self.names if names is None else list(names)
+        if not names:
+            return []
+        scores = self.scores(target, names)
+        return sorted(
+            ((name, [float(score)]) for name, score in zip(names, scores)),
+            key=lambda x: x[1][0],
+            reverse=True
+        )
+
+def _index_key(fingerprint: str, model_name: str) -> str:
+    raw = f"{fingerprint}|{model_name}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+def _load_or_build(path: str, names: Sequence[str], manager: ModelManager) -> np.ndarray:
+    if os.path.exists(path):
+        try:
+            embeddings = np.load(path, mmap_mode='r')
+            if embeddings.shape[0] == len(names):
+                return embeddings
+        except (OSError, ValueError):
+            pass
+    embeddings = manager.get().encode(
+        list(names), normalize_embeddings=True, convert_to_numpy=True
+    ).astype(np.float32)
+    embeddings = np.ascontiguousarray(embeddings)
+    # write to a temp file first so concurrent processes never read a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.npy.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, embeddings)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return embeddings
+
+def get_method_index(provider: object, manager: ModelManager = model_manager) -> MethodIndex:
+    """
+    Returns the embedding index for a provider, building it at most once per
+    provider class, locale and method set. Embeddings are persisted as .npy
+    files in the pymocker cache directory and memory-mapped on later runs.
+    """
+    registry = get_provider_registry(provider)
+    names = registry.names
+    key = _index_key(registry.fingerprint, manager.model_name)
+    index = _INDEXES.get(key)
+    if index is not None:
+        return index
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            path = os.path.join(get_cache_dir('embeddings'), f"{key}.npy")
+            index = MethodIndex(names, _load_or_build(path, names, manager), manager)
+            _INDEXES[key] = index
+    return index
+
+def clear_method_indexes() -> None:
+    """Forgets in-memory indexes. Files in the cache directory are left alone."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import math
+import string
+from functools import lru_cache
+from random import Random
+from typing import Any, Pattern
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse  # type: ignore[no-redef]
+
+INF = math.inf
+# Extra repetitions allowed for unbounded quantifiers such as + and *
+DEFAULT_REPEAT = 8
+# Candidates drawn by PatternGenerator.generate before giving up on the length limits
+MAX_PATTERN_ATTEMPTS = 20
+
+_ALPHABET = string.ascii_letters + string.digits + string.punctuation + ' '
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: string.digits,
+    sre_parse.CATEGORY_WORD: string.ascii_letters + string.digits + '_',
+    sre_parse.CATEGORY_SPACE: ' \t',
+}
+_NEGATED_CATEGORIES = {
+    sre_parse.CATEGORY_NOT_DIGIT: sre_parse.CATEGORY_DIGIT,
+    sre_parse.CATEGORY_NOT_WORD: sre_parse.CATEGORY_WORD,
+    sre_parse.CATEGORY_NOT_SPACE: sre_parse.CATEGORY_SPACE,
+}
+
+_START_ANCHORS = ((sre_parse.AT, sre_parse.AT_BEGINNING), (sre_parse.AT, sre_parse.AT_BEGINNING_STRING))
+_END_ANCHORS = ((sre_parse.AT, sre_parse.AT_END), (sre_parse.AT, sre_parse.AT_END_STRING))
+
+class UnsupportedPattern(ValueError):
+    """Raised for patterns using constructs a generator cannot honour, e.g. lookarounds."""
+
+class _Node:
+    min_len: float = 0
+    max_len: float = 0
+
+    def emit(self, random: Random, need: float, room: float, groups: dict[int, str]) -> str:
+        raise NotImplementedError
+
+class _Chars(_Node):
+    """One character out of a fixed set."""
+    def __init__(self, chars: str):
+        if not chars:
+            raise UnsupportedPattern("Character set matches nothing")
+        self.chars = chars
+        self.min_len = self.max_len = 1
+
+    def emit(self, random, need, room, groups):
+        return random.choice(self.chars)
+
+class _Sequence(_Node):
+    def __init__(self, items: list[_Node]):
+        self.items = items
+        self.min_len = sum(item.min_len for item in items)
+        self.max_len = sum(item.max_len for item in items)
+        # minimum and maximum length of everything after each item
+        self.rest_min = [sum(item.min_len for item in items[i + 1:]) for i in range(len(items))]
+        self.rest_max = [sum(item.max_len for item in items[i + 1:]) for i in range(len(items))]
+
+    def emit(self, random, need, room, groups):
+        parts = []
+        for item, rest_min, rest_max in zip(self.items, self.rest_min, self.rest_max):
+            # take what the rest cannot provide, leave what the rest requires
+            part = item.emit(random, max(need - rest_max, 0), room - rest_min, groups)
+            parts.append(part)
+            need -= len(part)
+            room -= len(part)
+        return ''.join(parts)
+
+class _Branch(_Node):
+    def __init__(self, options: list[_Node]):
+        self.options = options
+        self.min_len = min(option.min_len for option in options)
+        self.max_len = max(option.max_len for option in options)
+
+    def emit(self, random, need, room, groups):
+        fitting = [o for o in self.options if o.min_len <= room and o.max_len >= need] or \
+                  [o for o in self.options if o.min_len <= room] or self.options
+        return random.choice(fitting).emit(random, need, room, groups)
+
+class _Repeat(_Node):
+    def __init__(self, low: int, high: int, item: _Node):
+        self.low = low
+        self.high = INF if high == sre_parse.MAXREPEAT else high
+        self.item = item
+        self.min_len = low * item.min_len
+        self.max_len = self.high * item.max_len if item.max_len else 0
+
+    def emit(self, random, need, room, groups):
+        item = self.item
+        high = self.high
+        if high == INF:
+            high = self.low + DEFAULT_REPEAT
+            if need > 0 and 0 < item.max_len < INF:
+                high = max(high, math.ceil(need / item.max_len))
+        if item.min_len > 0 and room < INF:
+            high = min(high, int(room // item.min_len))
+        low = self.low
+        if need > 0 and 0 < item.max_len < INF:
+            low = max(low, math.ceil(need / item.max_len))
+        count = random.randint(low, high) if low <= high else max(self.low, min(low, high))
+        parts = []
+        for i in range(count):
+            left = count - i - 1
+            part = item.emit(random, max(need - left * item.max_len, 0), room - left * item.min_len, groups)
+            parts.append(part)
+            need -= len(part)
+            room -= len(part)
+        return ''.join(parts)
+
+class _Group(_Node):
+    def __init__(self, group: int | None, item: _Node):
+        self.group = group
+        self.item = item
+        self.min_len, self.max_len = item.min_len, item.max_len
+
+    def emit(self, random, need, room, groups):
+        value = self.item.emit(random, need, room, groups)
+        if self.group is not None:
+            groups[self.group] = value
+        return value
+
+class _GroupRef(_Node):
+    max_len = INF
+
+    def __init__(self, group: int):
+        self.group = group
+
+    def emit(self, random, need, room, groups):
+        return groups.get(self.group, '')
+
+class _Empty(_Node):
+    def emit(self, random, need, room, groups):
+        return ''
+
+def _char_set(items: list[tuple[Any, Any]]) -> str:
+    chars: list[str] = []
+    negate = False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            chars.append(chr(av))
+        elif op is sre_parse.RANGE:
+            chars.extend(chr(c) for c in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY:
+            if av in _CATEGORIES:
+                chars.extend(_CATEGORIES[av])
+            elif av in _NEGATED_CATEGORIES:
+                excluded = set(_CATEGORIES[_NEGATED_CATEGORIES[av]])
+                chars.extend(c for c in _ALPHABET if c not in excluded)
+            else:
+                raise UnsupportedPattern(f"Unsupported category {av}")
+        else:
+            raise UnsupportedPattern(f"Unsupported set item {op}")
+    if negate:
+        excluded = set(chars)
+        return ''.join(c for c in _ALPHABET if c not in excluded)
+    return ''.join(dict.fromkeys(chars))
+
+def _compile(parsed: Any) -> _Node:
+    items: list[_Node] = []
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            items.append(_Chars(chr(av)))
+        elif op is sre_parse.NOT_LITERAL:
+            items.append(_Chars(_ALPHABET.replace(chr(av), '')))
+        elif op is sre_parse.ANY:
+            items.append(_Chars(_ALPHABET))
+        elif op is sre_parse.IN:
+            items.append(_Chars(_char_set(av)))
+        elif op is sre_parse.BRANCH:
+            items.append(_Branch([_compile(option) for option in av[1]]))
+        elif op is sre_parse.SUBPATTERN:
+            items.append(_Group(av[0], _compile(av[3])))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) or op is getattr(sre_parse, 'POSSESSIVE_REPEAT', None):
+            low, high, sub = av
+            items.append(_Repeat(low, high, _compile(sub)))
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            items.append(_Group(None, _compile(av)))
+        elif op is sre_parse.GROUPREF:
+            items.append(_GroupRef(av))
+        elif op is sre_parse.AT:
+            # anchors are zero width, the generated string starts and ends the match anyway
+            continue
+        else:
+            raise UnsupportedPattern(f"Unsupported pattern construct {op}")
+    if not items:
+        return _Empty()
+    return items[0] if len(items) == 1 else _Sequence(items)
+
+class PatternGenerator:
+    """
+    Generates strings matching a regular expression, compiled once from its parse tree.
+    Quantifiers choose repetition counts that keep the result inside the requested length limits.
+    Lookarounds and conditionals are not supported.
+    """
+    def __init__(self, pattern: str | Pattern):
+        self.pattern = pattern.pattern if hasattr(pattern, 'pattern') else pattern
+        try:
+            parsed = sre_parse.parse(self.pattern)
+        except Exception as e:
+            raise UnsupportedPattern(f"Cannot parse pattern {self.pattern!r}: {e}") from e
+        items = list(parsed)
+        # pydantic searches for the pattern, so only anchors decide where a match must start and end
+        self.anchored_start = bool(items) and items[0] in _START_ANCHORS
+        self.anchored_end = bool(items) and items[-1] in _END_ANCHORS
+        self.root = _compile(parsed)
+
+    @property
+    def min_length(self) -> float:
+        return self.root.min_len
+
+    @property
+    def max_length(self) -> float:
+        return self.root.max_len
+
+    def generate(self, random: Random, min_length: int | None = None, max_length: int | None = None) -> str:
+        """
+        A string matching the pattern, with a length in [min_length, max_length] where possible.
+        A match too short for min_length is padded with digits on a side the pattern is not
+        anchored to, since the pattern only has to be found in the string.
+        Raises ValueError when no attempt fits the limits.
+        """
+        need = min_length or 0
+        room = INF if max_length is None else max_length
+        short = None
+        for _ in range(MAX_PATTERN_ATTEMPTS):
+            value = self.root.emit(random, need, room, {})
+            if need <= len(value) <= room:
+                return value
+            if len(value) < need and short is None:
+                short = value
+        if short is not None and not (self.anchored_start and self.anchored_end):
+            padding = ''.join(random.choice(string.digits) for _ in range(need - len(short)))
+            return short + padding if not self.anchored_end else padding + short
+        raise ValueError(f"Could not generate a string matching {self.pattern!r} with length in [{need}, {room}]")
+
+@lru_cache(maxsize=1024)
+def get_pattern_generator(pattern: str | Pattern) -> PatternGenerator:
+    """The compiled generator of a pattern, shared per process. Raises UnsupportedPattern."""
+    return PatternGenerator(pattern)
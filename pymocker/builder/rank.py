@@ -1,11 +1,65 @@
-from sentence_transformers import SentenceTransformer, util
+from __future__ import annotations
 import os
+import math
+import heapq
+import threading
+import importlib.util
+from typing import TYPE_CHECKING, Sequence
+from pymocker.builder.utils import to_snake_case
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
 
+DEFAULT_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+class ModelManager:
+    """
+    Holds a single SentenceTransformer per process.
+    The model is loaded on first use, can be pre-warmed with `warm()`
+    and dropped with `release()`. Loading is guarded by a lock so
+    concurrent callers never load the weights twice.
+    sentence_transformers (and torch) are only imported when the model is loaded.
+    """
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME):
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def get(self) -> SentenceTransformer:
+        """Returns the shared model, loading it if needed."""
+        model = self._model
+        if model is None:
+            with self._lock:
+                model = self._model
+                if model is None:
+                    model = self._load()
+                    self._model = model
+        return model
+
+    def _load(self) -> SentenceTransformer:
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name)
+
+    def warm(self) -> None:
+        """Loads the model ahead of the first ranking call."""
+        self.get()
+
+    def release(self) -> None:
+        """Drops the shared model so its memory can be reclaimed."""
+        with self._lock:
+            self._model = None
+
+model_manager = ModelManager()
+
 def rank(options:list[str],target:str):
-    model = SentenceTransformer('all-MiniLM-L6-v2')
     if not options:
         return []
+    from sentence_transformers import util
+    model = model_manager.get()
     query_embeddings = model.encode(options, convert_to_tensor=True)
     target_embedding = model.encode(target, convert_to_tensor=True)
     cos_scores = util.cos_sim(query_embeddings, target_embedding)
@@ -14,4 +68,226 @@ def rank(options:list[str],target:str):
         key=lambda x: x[1][0],
         reverse=True
     )
-    
\ No newline at end of file
+
+class Ranker:
+    """
+    Interface for the similarity backends used by the cosine similarity rule.
+    A ranker scores a target field name against the method names of a provider.
+    Scores of different backends are on different scales, so each one has the
+    `default_threshold` used when Mocker.Config.confidence_threshold is None.
+    """
+    name: str = ''
+    default_threshold: float = 0.5
+
+    def rank(self, provider: object, target: str, names: Sequence[str] | None = None) -> list[tuple[str, list[float]]]:
+        """(name, [score]) pairs for the provider's methods (or the given subset), best first."""
+        raise NotImplementedError
+
+    def best_matches(self, provider: object, targets: Sequence[str], names: Sequence[str] | None = None) -> list[tuple[str, float] | None]:
+        """
+        The best (name, score) for each target, or None when there is nothing to rank.
+        Backends override this to score all targets at once.
+        """
+        best = []
+        for target in targets:
+            ranked = self.rank(provider, target, names)
+            best.append((ranked[0][0], ranked[0][1][0]) if ranked else None)
+        return best
+
+class EmbeddingRanker(Ranker):
+    """Cosine similarity of sentence-transformer embeddings. Requires sentence-transformers."""
+    name = 'embedding'
+    default_threshold = 0.5
+
+    def __init__(self, manager: ModelManager = model_manager):
+        self.manager = manager
+
+    def index(self, provider: object):
+        from pymocker.builder.index import get_method_index
+        return get_method_index(provider, self.manager)
+
+    def rank(self, provider, target, names=None):
+        return self.index(provider).rank(target, names)
+
+    def best_matches(self, provider, targets, names=None):
+        return self.index(provider).best_matches(targets, names)
+
+def _name_features(name: str, n: int = 3) -> dict[str, float]:
+    """Word tokens plus character n-grams of each word, e.g. first_name -> first, #fi, fir, ..."""
+    features: dict[str, float] = {}
+    for word in to_snake_case(name).split('_'):
+        if not word:
+            continue
+        features['w:' + word] = features.get('w:' + word, 0.0) + 1.0
+        padded = f"#{word}#"
+        for i in range(max(len(padded) - n + 1, 1)):
+            gram = padded[i:i + n]
+            features[gram] = features.get(gram, 0.0) + 1.0
+    return features
+
+class LexicalIndex:
+    """
+    Sparse TF-IDF vectors over word tokens and character n-grams of method names,
+    stored as an inverted index so a query is scored against every name at once.
+    """
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        docs = [_name_features(name) for name in self.names]
+        document_frequency: dict[str, int] = {}
+        for features in docs:
+            for feature in features:
+                document_frequency[feature] = document_frequency.get(feature, 0) + 1
+        total = len(docs)
+        self.idf = {f: math.log((total + 1) / (df + 1)) + 1.0 for f, df in document_frequency.items()}
+        self.postings: dict[str, list[tuple[int, float]]] = {}
+        for row, features in enumerate(docs):
+            weights = {f: tf * self.idf[f] for f, tf in features.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for feature, weight in weights.items():
+                self.postings.setdefault(feature, []).append((row, weight / norm))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def sparse_scores(self, target: str) -> dict[int, float]:
+        """Cosine similarity of target against the names sharing at least one feature with it."""
+        query = {f: tf * self.idf[f] for f, tf in _name_features(target).items() if f in self.idf}
+        norm = math.sqrt(sum(w * w for w in query.values())) or 1.0
+        scores: dict[int, float] = {}
+        for feature, weight in query.items():
+            weight /= norm
+            for row, doc_weight in self.postings[feature]:
+                scores[row] = scores.get(row, 0.0) + weight * doc_weight
+        return scores
+
+    def scores(self, target: str) -> list[float]:
+        """Cosine similarity of target against every indexed name."""
+        scores = [0.0] * len(self.names)
+        for row, score in self.sparse_scores(target).items():
+            scores[row] = score
+        return scores
+
+    def top_k(self, target: str, k: int, names: Sequence[str] | None = None) -> list[str]:
+        """
+        The k names most similar to target, restricted to `names` if given.
+        Only names sharing a feature with the target are visited, so the cost
+        depends on the query rather than on the number of indexed names.
+        """
+        scores = self.sparse_scores(target)
+        if names is not None:
+            allowed = {self.positions[name] for name in names if name in self.positions}
+            scores = {row: score for row, score in scores.items() if row in allowed}
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [self.names[row] for row, _ in best]
+
+    def rank(self, target: str, names: Sequence[str] | None = None) -> list[tuple[str, list[float]]]:
+        names = self.names if names is None else list(names)
+        if not names:
+            return []
+        scores = self.scores(target)
+        return sorted(
+            ((name, [scores[self.positions[name]]]) for name in names),
+            key=lambda x: x[1][0],
+            reverse=True
+        )
+
+class LexicalRanker(Ranker):
+    """
+    Character n-gram TF-IDF similarity. Pure Python, no model to load. Names sharing a
+    word score higher than with embeddings, e.g. quantity and city score 0.47, so its
+    default threshold is higher.
+    """
+    name = 'lexical'
+    default_threshold = 0.6
+
+    def __init__(self):
+        self._indexes: dict[str, LexicalIndex] = {}
+        self._lock = threading.Lock()
+
+    def index(self, provider: object) -> LexicalIndex:
+        from pymocker.builder.registry import get_provider_registry
+        registry = get_provider_registry(provider)
+        names, key = registry.names, registry.fingerprint
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = LexicalIndex(names)
+                    self._indexes[key] = index
+        return index
+
+    def rank(self, provider, target, names=None):
+        return self.index(provider).rank(target, names)
+
+class TwoStageRanker(Ranker):
+    """
+    Shortlists the `candidates` closest method names with the lexical trigram index,
+    then reranks only that shortlist with the embedding ranker. If no method shares
+    a trigram with the field, every method is reranked, as the embedding ranker would.
+    """
+    name = 'two_stage'
+
+    def __init__(self, candidates: int = 32, prefilter: LexicalRanker | None = None, reranker: Ranker | None = None):
+        self.candidates = candidates
+        self.prefilter = prefilter or get_ranker('lexical')
+        self.reranker = reranker or EmbeddingRanker()
+
+    @property
+    def default_threshold(self) -> float:
+        # the scores are the reranker's
+        return self.reranker.default_threshold
+
+    def _shortlist(self, provider, target, names):
+        shortlist = self.prefilter.index(provider).top_k(target, self.candidates, names)
+        return shortlist or names
+
+    def rank(self, provider, target, names=None):
+        if names is not None and not names:
+            return []
+        return self.reranker.rank(provider, target, self._shortlist(provider, target, names))
+
+    def best_matches(self, provider, targets, names=None):
+        if not isinstance(self.reranker, EmbeddingRanker):
+            return super().best_matches(provider, targets, names)
+        if names is not None and not names:
+            return [None] * len(targets)
+        index = self.reranker.index(provider)
+        queries = index.encode_queries(targets)
+        return [
+            index.best_match_for_query(query, self._shortlist(provider, target, names))
+            for target, query in zip(targets, queries)
+        ]
+
+RANKER_MAP: dict[str, type[Ranker]] = {
+    'embedding': EmbeddingRanker,
+    'lexical': LexicalRanker,
+    'two_stage': TwoStageRanker,
+}
+_RANKERS: dict[type[Ranker], Ranker] = {}
+
+def embedding_backend_available() -> bool:
+    return importlib.util.find_spec('sentence_transformers') is not None
+
+def get_ranker(ranker: str | Ranker | type[Ranker] = 'auto') -> Ranker:
+    """
+    Resolves Mocker.Config.ranker to a Ranker instance. Named rankers are shared per process.
+    'auto' picks the embedding ranker when sentence-transformers is installed, else the lexical one.
+    """
+    if isinstance(ranker, Ranker):
+        return ranker
+    if ranker == 'auto':
+        ranker = 'embedding' if embedding_backend_available() else 'lexical'
+    if isinstance(ranker, str):
+        if ranker not in RANKER_MAP:
+            raise ValueError(f"Unknown ranker '{ranker}', expected one of {sorted(RANKER_MAP)} or a Ranker instance")
+        ranker_cls = RANKER_MAP[ranker]
+    elif isinstance(ranker, type) and issubclass(ranker, Ranker):
+        ranker_cls = ranker
+    else:
+        raise TypeError(f"Expected a ranker name, Ranker subclass or Ranker instance, got {ranker!r}")
+    instance = _RANKERS.get(ranker_cls)
+    if instance is None:
+        instance = _RANKERS.setdefault(ranker_cls, ranker_cls())
+    return instance
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Callable
+
+from pymocker.builder.utils import add_segment_words, get_public_method_names, provider_fingerprint, to_snake_case
+
+_REGISTRIES: dict[int, "ProviderRegistry"] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+def provider_version(provider: object) -> tuple[int, int]:
+    """
+    A cheap signature of a provider's method set: the number of sub-providers of a Faker generator
+    and the number of instance attributes, which grow when `add_provider` or setattr adds methods.
+    """
+    try:
+        providers = len(getattr(provider, 'providers', None) or ())
+    except TypeError:
+        providers = 0
+    return providers, len(getattr(provider, '__dict__', ()))
+
+def normalize_name(name: str) -> str:
+    """Cheap normalization used for method lookups: snake case, lower case, single underscores."""
+    return re.sub(r'[^0-9a-z]+', '_', to_snake_case(name)).strip('_')
+
+class ProviderRegistry:
+    """
+    The public callables of one provider instance, collected once.
+
+    Holds the callables keyed by raw name, a map from normalized name to raw name,
+    and (through the type catalog) the method names keyed by return type, so the
+    lookup rules never have to scan the provider with dir()/hasattr again.
+    `get_provider_registry` refreshes it when methods are added to the provider, e.g. with
+    `Faker.add_provider`. Methods added to the provider's class need an explicit `refresh()`.
+    """
+    def __init__(self, provider: object):
+        self.provider = provider
+        self.refresh()
+
+    def refresh(self) -> None:
+        self.names = get_public_method_names(self.provider)
+        self.methods: dict[str, Callable[..., Any]] = {name: getattr(self.provider, name) for name in self.names}
+        self.normalized: dict[str, str] = {}
+        for name in self.names:
+            self.normalized.setdefault(normalize_name(name), name)
+        # so field names made of these words segment into them, e.g. jsonpayload -> json_payload
+        add_segment_words(word for name in self.normalized for word in name.split('_'))
+        self.fingerprint = provider_fingerprint(self.provider, self.names)
+        self.version = provider_version(self.provider)
+        self._catalog = None
+
+    def find(self, *candidates: str) -> str | None:
+        """The raw name of the first candidate matching a method by raw or normalized name."""
+        for candidate in candidates:
+            if candidate in self.methods:
+                return candidate
+        for candidate in candidates:
+            name = self.normalized.get(normalize_name(candidate))
+            if name is not None:
+                return name
+        return None
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            from pymocker.builder.catalog import get_type_catalog
+            self._catalog = get_type_catalog(self.provider)
+        return self._catalog
+
+    def names_for(self, field_type: Any = None) -> list[str]:
+        """Method names whose return type equals field_type, a dictionary lookup."""
+        return self.catalog.names_for(field_type)
+
+def get_provider_registry(provider: object) -> ProviderRegistry:
+    """
+    Returns the registry of a provider instance, building it on first use and again when
+    methods were added to the provider since, see `provider_version`.
+    """
+    registry = _REGISTRIES.get(id(provider))
+    if registry is not None and registry.provider is provider and registry.version == provider_version(provider):
+        return registry
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(id(provider))
+        if registry is None or registry.provider is not provider:
+            registry = ProviderRegistry(provider)
+            _REGISTRIES[id(provider)] = registry
+        elif registry.version != provider_version(provider):
+            registry.refresh()
+    return registry
+
+def clear_provider_registries() -> None:
+    """Forgets every registry, e.g. after providers were modified in place."""
+    with _REGISTRIES_LOCK:
+        _REGISTRIES.clear()
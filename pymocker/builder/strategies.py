@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import inspect
+from decimal import Decimal
+from random import Random
+from typing import Any, Callable, Mapping, TypeVar, get_origin
+
+from polyfactory.exceptions import ParameterException
+from polyfactory.value_generators.constrained_numbers import (
+    handle_constrained_decimal,
+    handle_constrained_float,
+    handle_constrained_int,
+)
+
+from .extensible import GenerationError
+from .patterns import UnsupportedPattern, get_pattern_generator
+from .validators import compile_validator
+
+T = TypeVar("T")
+
+Strategy = Callable[[Random], Any]
+
+NUMBER_CONSTRAINTS = frozenset({'gt', 'ge', 'lt', 'le', 'multiple_of'})
+DECIMAL_CONSTRAINTS = NUMBER_CONSTRAINTS | {'max_digits', 'decimal_places'}
+STRING_CONSTRAINTS = frozenset({'min_length', 'max_length', 'lower_case', 'upper_case'})
+
+# Faker's numeric methods take inclusive bounds under one of these keyword pairs
+_RANGE_KEYWORDS = (('min_value', 'max_value'), ('min', 'max'))
+# Faker's text methods take an upper length under one of these keywords, with the smallest they accept
+_MAX_LENGTH_KEYWORDS = (('max_nb_chars', 5), ('max_chars', 1))
+
+# Draws a string strategy joins before giving up on reaching min_length, or makes
+# looking for a value within max_length before truncating one
+_MAX_STRING_DRAWS = 8
+# Name parts of provider methods with structured values, such as emails, urls or phone numbers,
+# which are never truncated or joined: a cut email still looks like one but is not valid
+_STRUCTURED_NAME_PARTS = (
+    'email', 'url', 'uri', 'domain', 'hostname', 'phone', 'msisdn', 'ip', 'mac', 'iban', 'bban',
+    'swift', 'isbn', 'ean', 'ssn', 'uuid', 'credit', 'postcode', 'zipcode', 'license', 'slug',
+    'path', 'md5', 'sha', 'password',
+)
+
+def _parameter_names(generator: Callable[..., Any]) -> frozenset[str]:
+    try:
+        return frozenset(inspect.signature(generator).parameters)
+    except (TypeError, ValueError):
+        return frozenset()
+
+def _active(constraints: Mapping[str, Any], names: frozenset[str]) -> dict[str, Any]:
+    """The constraints among names that are actually set."""
+    return {k: v for k, v in constraints.items() if k in names and v is not None and v is not False}
+
+def _bounds(constraints: Mapping[str, Any], step: Any) -> tuple[Any, Any]:
+    """Inclusive (low, high) bounds, moving exclusive bounds inwards by step."""
+    low = constraints.get('ge')
+    if low is None and constraints.get('gt') is not None:
+        low = constraints['gt'] + step
+    high = constraints.get('le')
+    if high is None and constraints.get('lt') is not None:
+        high = constraints['lt'] - step
+    return low, high
+
+def _bind_range(generator: Callable[..., T], low: Any, high: Any) -> Callable[[], T]:
+    """Pass the bounds to the provider method when it accepts them, e.g. pyint(min_value, max_value)."""
+    if low is None or high is None or low > high:
+        return generator
+    parameters = _parameter_names(generator)
+    for low_keyword, high_keyword in _RANGE_KEYWORDS:
+        if low_keyword in parameters and high_keyword in parameters:
+            return lambda: generator(**{low_keyword: low, high_keyword: high})
+    return generator
+
+def _directed(
+    generator: Callable[[], Any],
+    check: Callable[[Any], bool],
+    sample: Callable[[Random], Any],
+) -> Strategy:
+    """Keep the provider's value when it already fits, otherwise sample inside the constraints."""
+    def strategy(random: Random) -> Any:
+        try:
+            value = generator()
+        except (ArithmeticError, ValueError):
+            # e.g. a provider rejecting the bounds it was given
+            value = None
+        if value is not None and check(value):
+            return value
+        try:
+            value = sample(random)
+        except (ParameterException, ArithmeticError, ValueError) as e:
+            raise GenerationError(str(e)) from e
+        if not check(value):
+            raise GenerationError(f"Sampled value {value!r} does not satisfy the constraints")
+        return value
+    return strategy
+
+def _sample_multiple(low: int, high: int, multiple_of: int) -> Callable[[Random], int]:
+    """Uniform over the multiples of multiple_of in [low, high]."""
+    first, last = -(-low // multiple_of), high // multiple_of
+    return lambda random: random.randint(first, last) * multiple_of
+
+def int_strategy(generator: Callable[[], int], constraints: Mapping[str, Any]) -> Strategy | None:
+    """Samples integers inside gt/ge/lt/le, on multiples of multiple_of."""
+    active = _active(constraints, NUMBER_CONSTRAINTS)
+    if not active:
+        return None
+    low, high = _bounds(active, 1)
+    multiple_of = active.get('multiple_of')
+    if isinstance(multiple_of, int) and multiple_of > 0 and low is not None and high is not None:
+        sample = _sample_multiple(low, high, multiple_of)
+    else:
+        sample = lambda random: handle_constrained_int(random, **active)
+    return _directed(
+        _bind_range(generator, low, high),
+        compile_validator(int, active),
+        sample,
+    )
+
+def float_strategy(generator: Callable[[], float], constraints: Mapping[str, Any]) -> Strategy | None:
+    """Samples floats inside gt/ge/lt/le, on multiples of multiple_of."""
+    active = _active(constraints, NUMBER_CONSTRAINTS)
+    if not active:
+        return None
+    # exclusive bounds stay exclusive, the check rejects a value landing on them
+    low, high = _bounds(active, 0)
+    return _directed(
+        _bind_range(generator, low, high),
+        compile_validator(float, active),
+        lambda random: handle_constrained_float(random, **active),
+    )
+
+def decimal_strategy(generator: Callable[[], Decimal], constraints: Mapping[str, Any]) -> Strategy | None:
+    """
+    Samples Decimals inside the bounds with at most max_digits digits and decimal_places places.
+    The provider's value is first rounded to decimal_places, which is often all it needs.
+    """
+    active = _active(constraints, DECIMAL_CONSTRAINTS)
+    if not active:
+        return None
+    decimal_places = active.get('decimal_places')
+    low, high = _bounds(active, Decimal(1).scaleb(-decimal_places) if decimal_places is not None else 0)
+    bound = _bind_range(generator, low, high)
+    if decimal_places is not None:
+        exponent = Decimal(1).scaleb(-decimal_places)
+        def rounded() -> Decimal | None:
+            value = bound()
+            return Decimal(value).quantize(exponent) if value is not None else None
+        provider = rounded
+    else:
+        provider = bound
+    return _directed(
+        provider,
+        compile_validator(Decimal, active),
+        lambda random: handle_constrained_decimal(random, **active),
+    )
+
+def _truncate(value: str, max_length: int, min_length: int) -> str:
+    """Cut at the last word boundary within max_length, or hard cut if that would be too short."""
+    if len(value) <= max_length:
+        return value
+    cut = value[:max_length]
+    if not value[max_length].isspace() and ' ' in cut:
+        # the cut falls inside a word, drop that word
+        head = cut[:cut.rfind(' ')].rstrip(' ,;:-')
+        if len(head) >= max(min_length, 1):
+            return head
+    trimmed = cut.rstrip()
+    return trimmed if len(trimmed) >= max(min_length, 1) else cut
+
+def _is_structured(generator: Callable[..., Any]) -> bool:
+    """Whether a provider method returns structured values, judged by its name, e.g. safe_email."""
+    parts = getattr(generator, '__name__', '').lower().split('_')
+    return any(part.startswith(_STRUCTURED_NAME_PARTS) for part in parts)
+
+def string_strategy(generator: Callable[[], str], constraints: Mapping[str, Any]) -> Strategy | None:
+    """
+    Fits provider strings to min_length/max_length and the case constraints. Length limits are
+    passed to provider methods that accept them (text, pystr). A value over max_length is first
+    drawn again, and only free text is truncated at a word boundary when no draw fits; shorter
+    text is extended with further draws. Structured values such as emails, urls or phone numbers
+    are never cut or joined: the strategy raises GenerationError instead, so the field falls back
+    to rejection sampling. Fields with a pattern use `pattern_strategy`.
+    """
+    if constraints.get('pattern'):
+        return pattern_strategy(generator, constraints)
+    active = _active(constraints, STRING_CONSTRAINTS)
+    if not active:
+        return None
+    min_length = active.get('min_length') or 0
+    max_length = active.get('max_length')
+    lower_case = active.get('lower_case', False)
+    upper_case = active.get('upper_case', False)
+    check = compile_validator(str, active)
+    structured = _is_structured(generator)
+
+    bound_kwargs: dict[str, Any] = {}
+    parameters = _parameter_names(generator)
+    if max_length is not None:
+        for keyword, smallest in _MAX_LENGTH_KEYWORDS:
+            if keyword in parameters and max_length >= smallest:
+                bound_kwargs[keyword] = max_length
+                break
+        if min_length and 'max_chars' in bound_kwargs and 'min_chars' in parameters:
+            bound_kwargs['min_chars'] = min(min_length, max_length)
+    call = (lambda: generator(**bound_kwargs)) if bound_kwargs else generator
+
+    def draw() -> str:
+        value = call()
+        if value is None:
+            raise GenerationError("Provider returned None")
+        value = str(value)
+        if lower_case:
+            value = value.lower()
+        if upper_case:
+            value = value.upper()
+        return value
+
+    def strategy(random: Random) -> str:
+        value = draw()
+        if check(value):
+            return value
+        if structured or (max_length is not None and len(value) > max_length):
+            for _ in range(_MAX_STRING_DRAWS):
+                candidate = draw()
+                if check(candidate):
+                    return candidate
+            if structured:
+                raise GenerationError(
+                    f"No value of {getattr(generator, '__name__', 'the provider')} fits the string constraints"
+                )
+        for _ in range(_MAX_STRING_DRAWS):
+            if len(value) >= min_length:
+                break
+            value = f"{value} {draw()}"
+        if max_length is not None:
+            value = _truncate(value, max_length, min_length)
+        if not check(value):
+            raise GenerationError(f"Could not fit {value!r} to the string constraints")
+        return value
+    return strategy
+
+def pattern_strategy(generator: Callable[[], str], constraints: Mapping[str, Any]) -> Strategy | None:
+    """
+    Keeps the provider's string when it matches the pattern and the other string constraints,
+    otherwise generates one from the pattern within the length limits. None for patterns
+    the generator does not support, e.g. with lookarounds.
+    """
+    try:
+        pattern_generator = get_pattern_generator(constraints['pattern'])
+    except UnsupportedPattern:
+        return None
+    active = _active(constraints, STRING_CONSTRAINTS | {'pattern'})
+    min_length, max_length = active.get('min_length'), active.get('max_length')
+    check = compile_validator(str, active)
+
+    def strategy(random: Random) -> str:
+        value = generator()
+        if isinstance(value, str) and check(value):
+            return value
+        for _ in range(_MAX_STRING_DRAWS):
+            try:
+                value = pattern_generator.generate(random, min_length, max_length)
+            except ValueError as e:
+                raise GenerationError(str(e)) from e
+            if check(value):
+                return value
+        raise GenerationError(f"Could not generate a string matching {constraints['pattern']!r} within the constraints")
+    return strategy
+
+STRATEGY_MAP = {
+    int: int_strategy,
+    float: float_strategy,
+    Decimal: decimal_strategy,
+    str: string_strategy,
+}
+
+def compile_strategy(generator: Callable[[], Any], annotation: Any, constraints: Mapping[str, Any]) -> Strategy | None:
+    """
+    Builds a constraint-directed strategy for a provider method, or None when the type or
+    constraints are not supported and rejection sampling should be used instead.
+    The strategy takes a Random instance and raises GenerationError when it cannot produce a valid value.
+    """
+    origin_type = get_origin(annotation) or annotation
+    builder = STRATEGY_MAP.get(origin_type)
+    if builder is None or not constraints:
+        return None
+    return builder(generator, constraints)
@@ -1,11 +1,120 @@
 import re
+import os
+import sys
+import hashlib
 import inspect
-from typing import Any
-from wordsegment import load, segment
-load()
+import threading
+import importlib.abc
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
 
+# Size of the compact segmentation dictionary: the most frequent unigrams, and the
+# bigrams over those unigrams seen at least this many times. A fraction of the memory
+# of the full wordsegment corpus. Words of provider method names are added on top, see
+# `add_segment_words`, as rarer ones such as json, iban or msisdn would otherwise be split.
+SEGMENT_VOCABULARY_SIZE = 50_000
+SEGMENT_MIN_BIGRAM_COUNT = 500_000
+
+_segmenter = None
+_segmenter_lock = threading.Lock()
+# words added with add_segment_words, kept in the dictionary whatever their rank
+_segment_words: set[str] = set()
+
+def _read_unigrams(words: set[str] | None = None) -> tuple[dict[str, float], float]:
+    """
+    The counts of the most frequent unigrams and of the given words, and the count of the
+    least frequent of the former. Only the head of the file is read without words.
+    """
+    from wordsegment import Segmenter
+    counts: dict[str, float] = {}
+    floor = 0.0
+    with open(Segmenter.UNIGRAMS_FILENAME, encoding='utf-8') as reader:
+        # the unigram file is sorted by frequency
+        for rank, line in enumerate(reader):
+            if rank >= SEGMENT_VOCABULARY_SIZE and not words:
+                break
+            word, count = line.split('\t')
+            if rank < SEGMENT_VOCABULARY_SIZE:
+                counts[word] = floor = float(count)
+            elif word in words:
+                counts[word] = float(count)
+    return counts, floor
+
+def _load_segmenter():
+    """Builds a wordsegment Segmenter over the compact dictionary, once, on first use."""
+    global _segmenter
+    if _segmenter is None:
+        with _segmenter_lock:
+            if _segmenter is None:
+                from wordsegment import Segmenter
+                segmenter = Segmenter()
+                counts, floor = _read_unigrams(_segment_words)
+                segmenter.unigrams.update(counts)
+                segmenter.floor = floor
+                _add_missing_words(segmenter, _segment_words)
+                unigrams = segmenter.unigrams
+                with open(Segmenter.BIGRAMS_FILENAME, encoding='utf-8') as reader:
+                    for line in reader:
+                        bigram, count = line.split('\t')
+                        count = float(count)
+                        if count < SEGMENT_MIN_BIGRAM_COUNT:
+                            continue
+                        first, _, second = bigram.partition(' ')
+                        if first in unigrams and second in unigrams:
+                            segmenter.bigrams[bigram] = count
+                segmenter.total = Segmenter.TOTAL
+                segmenter.limit = Segmenter.LIMIT
+                _segmenter = segmenter
+    return _segmenter
+
+def _add_missing_words(segmenter, words: set[str]) -> None:
+    # words the corpus lacks count as the rarest word of the compact dictionary
+    for word in words:
+        segmenter.unigrams.setdefault(word, segmenter.floor)
+
+def add_segment_words(words: Iterable[str]) -> None:
+    """
+    Keeps words, e.g. the words of provider method names, whole when segmenting. They are
+    added to the compact dictionary with their count in the full corpus, or with the count of
+    its rarest word when the corpus lacks them, and memoized segmentations are dropped.
+    """
+    words = {word for word in words if len(word) > 2 and word.isalpha()}
+    with _segmenter_lock:
+        new = words - _segment_words
+        if not new:
+            return
+        _segment_words.update(new)
+        segmenter = _segmenter
+        # without a segmenter, they are read along with the dictionary on first use
+        missing = new - segmenter.unigrams.keys() if segmenter is not None else set()
+        if missing:
+            counts, _ = _read_unigrams(missing)
+            segmenter.unigrams.update({word: count for word, count in counts.items() if word in missing})
+            _add_missing_words(segmenter, missing)
+    _segment_part.cache_clear()
+    segment_and_join_word.cache_clear()
+
+@lru_cache(maxsize=2**16)
+def _segment_part(part: str) -> tuple[str, ...]:
+    # words of provider method names are kept whole, e.g. ein rather than e_in
+    if len(part) <= 2 or part.isdigit() or part in _segment_words:
+        return (part,)
+    return tuple(_load_segmenter().segment(part))
+
+@lru_cache(maxsize=2**16)
 def segment_and_join_word(word:str, sep:str='_'):
-    return sep.join(segment(word)).lower()
+    """
+    Splits a field name into words and joins them with sep, e.g. emailAddress1 -> email_address_1.
+    Snake case and camel case boundaries are taken as given, so wordsegment's search only
+    runs on the (short, often repeated) parts between them. Results are memoized.
+    """
+    words = []
+    for part in re.split('[^0-9a-z]+', to_snake_case(word)):
+        if part:
+            words.extend(_segment_part(part))
+    return sep.join(words).lower()
 
 def get_return_type(func: callable,find_by_executing_method=False) -> Any:
     """A helper to safely get the return type annotation of a function."""
@@ -20,8 +129,104 @@ def get_return_type(func: callable,find_by_executing_method=False) -> Any:
     except (ValueError, TypeError):
         return Any
     
+def get_cache_dir(*parts: str) -> Path:
+    """
+    Returns (and creates) a directory for pymocker's on-disk caches.
+    Defaults to ~/.cache/pymocker, override with the PYMOCKER_CACHE_DIR environment variable.
+    """
+    root = os.environ.get('PYMOCKER_CACHE_DIR') or os.path.join(Path.home(), '.cache', 'pymocker')
+    path = Path(root, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def get_public_method_names(provider: object) -> list[str]:
+    """Sorted names of the public callables on a provider instance."""
+    names = []
+    for method_name in dir(provider):
+        if method_name.startswith('_'):
+            continue
+        try:
+            if callable(getattr(provider, method_name)):
+                names.append(method_name)
+        except (AttributeError, TypeError, NotImplementedError):
+            continue
+    return sorted(names)
+
+def provider_locale(provider: object) -> str:
+    """The locale(s) of a Faker-like provider, or an empty string for plain providers."""
+    locales = getattr(provider, 'locales', None)
+    if not locales:
+        return ''
+    if isinstance(locales, str):
+        return locales
+    return ','.join(str(locale) for locale in locales)
+
+def provider_source_digest(provider: object) -> str:
+    """
+    A digest of the module, name and source of a provider's classes and of the providers added
+    to it with `add_provider`, so editing a custom provider's methods changes its fingerprint.
+    Faker's own classes are left out, the Faker version covers them.
+    """
+    try:
+        sub_providers = list(getattr(provider, 'providers', None) or ())
+    except TypeError:
+        sub_providers = []
+    sources = []
+    seen = set()
+    for instance in (provider, *sub_providers):
+        for cls in type(instance).__mro__:
+            if cls in seen or cls.__module__.split('.')[0] in ('builtins', 'faker'):
+                continue
+            seen.add(cls)
+            try:
+                source = inspect.getsource(cls)
+            except (OSError, TypeError):
+                source = ''
+            sources.append(f"{cls.__module__}.{cls.__qualname__}\n{source}")
+    return hashlib.sha256('\n'.join(sources).encode()).hexdigest()[:16]
+
+def provider_fingerprint(provider: object, names: Sequence[str] | None = None) -> str:
+    """A stable identifier for a provider's class, locale, public method set and source, see `provider_source_digest`."""
+    cls = type(provider)
+    if names is None:
+        names = get_public_method_names(provider)
+    digest = hashlib.sha256('\n'.join(names).encode()).hexdigest()[:16]
+    return f"{cls.__module__}.{cls.__qualname__}|{provider_locale(provider)}|{digest}|{provider_source_digest(provider)}"
+
 def to_snake_case(name):
     name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
     name = re.sub('__([A-Z])', r'_\1', name)
     name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
-    return name.lower()
\ No newline at end of file
+    return name.lower()
+
+class _PostImportFinder(importlib.abc.MetaPathFinder):
+    """Runs a callback right after a given top-level module finishes importing."""
+    def __init__(self, module_name: str, callback: Callable[[Any], None]):
+        self.module_name = module_name
+        self.callback = callback
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self.module_name:
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        exec_module = spec.loader.exec_module
+        callback = self.callback
+        def exec_and_notify(module):
+            exec_module(module)
+            callback(module)
+        spec.loader.exec_module = exec_and_notify
+        return spec
+
+def when_imported(module_name: str, callback: Callable[[Any], None]) -> None:
+    """
+    Calls callback(module) once module_name is imported, immediately if it already is.
+    Lets pymocker hook into optional heavy libraries without importing them itself.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        callback(module)
+        return
+    sys.meta_path.insert(0, _PostImportFinder(module_name, callback))
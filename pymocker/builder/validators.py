@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import inspect
 import re
+from functools import lru_cache, partial
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Collection, Literal, Mapping, Pattern, get_origin
+from typing import Any, Callable, Collection, Literal, Mapping, Pattern, Sequence, get_origin
 from uuid import UUID
 
 # Re-use existing validation logic where possible from polyfactory
@@ -86,7 +87,7 @@ def is_valid_string(
     if max_length is not None and len(value) > max_length: return False
     if lower_case and not value.islower(): return False
     if upper_case and not value.isupper(): return False
-    if pattern and not re.match(pattern, value): return False
+    if pattern and not re.search(pattern, value): return False
     return True
 
 def is_valid_bytes(
@@ -176,6 +177,168 @@ VALIDATOR_MAP = {
     Path: is_valid_path,
 }
 
+def compile_number_validator(
+    gt: Any = None,
+    ge: Any = None,
+    lt: Any = None,
+    le: Any = None,
+    multiple_of: Any = None,
+) -> Callable[[Any], bool]:
+    """Builds a checker for int, float and Decimal bounds with only the given constraints in it."""
+    checks = []
+    if gt is not None: checks.append(lambda value: value > gt)
+    if ge is not None: checks.append(lambda value: value >= ge)
+    if lt is not None: checks.append(lambda value: value < lt)
+    if le is not None: checks.append(lambda value: value <= le)
+    if multiple_of is not None: checks.append(lambda value: passes_pydantic_multiple_validator(value, multiple_of))
+    if not checks:
+        return _always_valid
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda value: first(value) and second(value)
+    return lambda value: all(check(value) for check in checks)
+
+def compile_string_validator(
+    min_length: int | None = None,
+    max_length: int | None = None,
+    lower_case: bool = False,
+    upper_case: bool = False,
+    pattern: str | Pattern | None = None,
+) -> Callable[[str], bool]:
+    """Builds a string checker with fixed length bounds and a precompiled pattern."""
+    min_length = min_length if min_length is not None else 0
+    max_length = max_length if max_length is not None else float('inf')
+    match = re.compile(pattern).search if pattern else None
+
+    def check(value: str) -> bool:
+        if not min_length <= len(value) <= max_length: return False
+        if lower_case and not value.islower(): return False
+        if upper_case and not value.isupper(): return False
+        if match is not None and not match(value): return False
+        return True
+    return check
+
+def compile_decimal_validator(**constraints: Any) -> Callable[[Decimal], bool]:
+    """Builds a Decimal checker: bounds are compiled, digits are only counted when constrained."""
+    max_digits = constraints.pop('max_digits', None)
+    decimal_places = constraints.pop('decimal_places', None)
+    in_bounds = compile_number_validator(**constraints)
+    if max_digits is None and decimal_places is None:
+        return in_bounds
+    return lambda value: in_bounds(value) and is_valid_decimal(value, max_digits=max_digits, decimal_places=decimal_places)
+
+VALIDATOR_COMPILER_MAP = {
+    int: compile_number_validator,
+    float: compile_number_validator,
+    Decimal: compile_decimal_validator,
+    str: compile_string_validator,
+}
+
+def _always_valid(value: Any) -> bool:
+    return True
+
+@lru_cache(maxsize=None)
+def _parameter_names(func: Callable[..., Any]) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+def _relevant_constraints(func: Callable[..., Any], constraints: Mapping[str, Any]) -> dict[str, Any]:
+    """Constraints accepted by func, so an invalid keyword argument is never passed."""
+    valid_keys = _parameter_names(func)
+    return {k: v for k, v in constraints.items() if k in valid_keys}
+
+def _build_validator(annotation: Any, constraints: Mapping[str, Any]) -> Callable[[Any], bool]:
+    origin_type = get_origin(annotation) or annotation
+    compiler = VALIDATOR_COMPILER_MAP.get(origin_type)
+    if compiler is not None:
+        valid_keys = _parameter_names(VALIDATOR_MAP[origin_type])
+        return compiler(**{k: v for k, v in constraints.items() if k in valid_keys})
+    validator = VALIDATOR_MAP.get(origin_type)
+    if validator is None:
+        return _always_valid
+    return partial(validator, **_relevant_constraints(validator, constraints))
+
+@lru_cache(maxsize=4096)
+def _cached_validator(annotation: Any, constraint_items: tuple[tuple[str, Any], ...]) -> Callable[[Any], bool]:
+    return _build_validator(annotation, dict(constraint_items))
+
+def compile_validator(annotation: Any, constraints: Mapping[str, Any] | None = None) -> Callable[[Any], bool]:
+    """
+    Compiles the check for an (annotation, constraints) pair into a single callable taking the value.
+    Type dispatch and constraint filtering happen here, once, and the result is cached.
+    """
+    constraints = constraints or {}
+    try:
+        return _cached_validator(annotation, tuple(sorted(constraints.items())))
+    except TypeError:
+        # unhashable annotation or constraint values
+        return _build_validator(annotation, constraints)
+
+# Constraints evaluated over a whole block with numpy, the rest is checked value by value
+_BLOCK_BOUNDS = ('gt', 'ge', 'lt', 'le')
+_BLOCK_LENGTHS = ('min_length', 'max_length')
+
+def _scalar_block_validator(check: Callable[[Any], bool]) -> Callable[[Sequence[Any]], list[bool]]:
+    return lambda values: [value is not None and check(value) for value in values]
+
+def _numeric_block_validator(bounds: dict[str, Any], check: Callable[[Any], bool] | None, fallback: Callable[[Sequence[Any]], list[bool]]):
+    def validate(values: Sequence[Any]) -> list[bool]:
+        import numpy as np
+        array = np.asarray(values)
+        # None, bool, big ints or mixed types: no numeric array to work on
+        if array.dtype.kind not in 'iuf':
+            return fallback(values)
+        mask = np.ones(len(array), dtype=bool)
+        if 'gt' in bounds: mask &= array > bounds['gt']
+        if 'ge' in bounds: mask &= array >= bounds['ge']
+        if 'lt' in bounds: mask &= array < bounds['lt']
+        if 'le' in bounds: mask &= array <= bounds['le']
+        if check is None:
+            return mask.tolist()
+        return [bool(ok) and check(value) for ok, value in zip(mask, values)]
+    return validate
+
+def _length_block_validator(lengths: dict[str, Any], check: Callable[[Any], bool] | None, fallback: Callable[[Sequence[Any]], list[bool]]):
+    def validate(values: Sequence[Any]) -> list[bool]:
+        import numpy as np
+        try:
+            sizes = np.fromiter((len(value) if value is not None else -1 for value in values), dtype=np.int64, count=len(values))
+        except TypeError:
+            return fallback(values)
+        mask = sizes >= max(lengths.get('min_length') or 0, 0)
+        if lengths.get('max_length') is not None:
+            mask &= sizes <= lengths['max_length']
+        if check is None:
+            return mask.tolist()
+        return [bool(ok) and check(value) for ok, value in zip(mask, values)]
+    return validate
+
+def compile_block_validator(annotation: Any, constraints: Mapping[str, Any] | None = None) -> Callable[[Sequence[Any]], list[bool]]:
+    """
+    Compiles a check over a block of candidate values, returning one bool per value (None never passes).
+    Numeric bounds of int and float and the length limits of str and bytes are evaluated over the
+    whole block with numpy. Any other constraint is only checked for the values passing those.
+    """
+    constraints = {k: v for k, v in (constraints or {}).items() if v is not None and v is not False}
+    fallback = _scalar_block_validator(compile_validator(annotation, constraints))
+    origin_type = get_origin(annotation) or annotation
+    if origin_type in (int, float):
+        vectorized, names = _BLOCK_BOUNDS, ('gt', 'ge', 'lt', 'le', 'multiple_of')
+        block_validator = _numeric_block_validator
+    elif origin_type in (str, bytes):
+        vectorized, names = _BLOCK_LENGTHS, tuple(_parameter_names(VALIDATOR_MAP[origin_type]))
+        block_validator = _length_block_validator
+    else:
+        return fallback
+    relevant = {k: v for k, v in constraints.items() if k in names}
+    block = {k: v for k, v in relevant.items() if k in vectorized}
+    if not block:
+        return fallback
+    rest = {k: v for k, v in relevant.items() if k not in vectorized}
+    check = compile_validator(annotation, rest) if rest else None
+    return block_validator(block, check, fallback)
+
 def is_valid(value: Any, annotation: Any, **constraints: Any) -> bool:
     """
     Dynamically selects and applies the correct validator for a given type annotation.
@@ -185,16 +348,4 @@ def is_valid(value: Any, annotation: Any, **constraints: Any) -> bool:
     :param constraints: The keyword arguments for the constraints to check.
     :return: True if the value is valid, False otherwise.
     """
-    origin_type = get_origin(annotation) or annotation
-    validator = VALIDATOR_MAP.get(origin_type)
-
-    if validator:
-        # Filter constraints to only those relevant for the specific validator
-        # to prevent passing an invalid keyword argument.
-        sig = inspect.signature(validator)
-        valid_keys = {p.name for p in sig.parameters.values()}
-        relevant_constraints = {k: v for k, v in constraints.items() if k in valid_keys}
-        
-        return validator(value, **relevant_constraints)
-    return True
-
+    return compile_validator(annotation, constraints)(value)
@@ -1,38 +1,27 @@
+from __future__ import annotations
 import sys
 import os
-from findpython import TypeVar
-import pandas as pd
-from pydantic import BaseModel, Field, create_model
-from polyfactory.factories.base import BaseFactory
-from polyfactory.factories.pydantic_factory import ModelFactory
-
-from pandas.api.extensions import register_extension_dtype, ExtensionDtype, register_dataframe_accessor
-
-try:
-    from pydantic import BaseModel as BaseModelV1
-
-    # Keep this import last to prevent warnings from pydantic if pydantic v2
-    # is installed.
-    from pydantic.fields import (  # type: ignore[attr-defined]
-        Undefined,  # pyright: ignore[attr-defined,reportAttributeAccessIssue]
-    )
-
-    # prevent unbound variable warnings
-    BaseModelV2 = BaseModelV1
-    UndefinedV2 = Undefined
-except ImportError:
-    # pydantic v2
-
-    # v2 specific imports
-    from pydantic_core import PydanticUndefined as UndefinedV2
-    from pydantic.v1 import BaseModel as BaseModelV1  # type: ignore[assignment]
-from faker import Faker
-from typing import Type
-from pymocker.builder.mixins import PolyfactoryLogicMixin
-from pymocker.builder.rank import rank
-from pymocker.builder.utils import get_return_type, segment_and_join_word
+from typing import TYPE_CHECKING, Type
+from pymocker.builder.cache import MISSING, get_resolution_cache
+from pymocker.builder.rank import get_ranker
+from pymocker.builder.registry import get_provider_registry
+from pymocker.builder.utils import segment_and_join_word, when_imported
 import types
 from functools import wraps
+if TYPE_CHECKING:
+    from polyfactory.factories.base import BaseFactory
+
+class _DefaultProviders:
+    """Creates the default Faker provider on first access, so importing pymocker stays cheap."""
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner):
+        from faker import Faker
+        providers = [Faker()]
+        setattr(self.owner, self.name, providers)
+        return providers
 
 def add_passthrough_args_to_object_method(obj:object, attr_name) -> object:
     attr = getattr(obj, attr_name)
@@ -55,19 +44,88 @@ class Mocker:
         
         # - confidence_threshold -
         # Confidence threshold for cosine similarity metch between generation methods and field names.
-        # setting to 0 disables this behavior.
-        confidence_threshold:float = 0.5
+        # setting to 0 disables this behavior. None uses the default of the ranker, as the
+        # backends score on different scales: 0.5 for 'embedding' and 'two_stage', 0.6 for
+        # 'lexical'. A number applies as is to whichever ranker 'auto' picks.
+        confidence_threshold:float | None = None
+        
+        # - ranker -
+        # Similarity backend used by the cosine similarity rule. 'embedding' compares
+        # sentence-transformers embeddings (requires the optional `embedding` extra),
+        # 'lexical' compares character n-gram TF-IDF vectors and has no heavy dependencies.
+        # 'two_stage' shortlists candidates lexically and reranks only those with embeddings,
+        # which keeps matching cheap when stacking several large providers.
+        # 'auto' uses 'embedding' when sentence-transformers is installed, 'lexical' otherwise,
+        # each with its own default confidence_threshold.
+        # A Ranker instance or subclass can also be given.
+        ranker:str = 'auto'
         
         # - max_retries -
         # The number of times faker will attempt to generate a constraint fuffilling value.
         # Higher values will greatly affect performance.
+        # With coerce_on_fail, a field that rarely passes gets a smaller budget once its
+        # acceptance rate is known, see PolyfactoryLogicMixin.get_field_stats().
         max_retries:int = 300
         
         # - coerce_on_fail -
         # If set to True, coerce value to match constrains on faker generation failure.
         coerce_on_fail:bool = True
         
-        provider_instances:list[object] = [Faker()]
+        # - directed_generation -
+        # If set to True, constrained int, float, Decimal and str fields are generated from
+        # their constraints (sampling inside numeric ranges, fitting strings to length limits)
+        # instead of retrying the provider method until a value happens to fit.
+        # Rejection sampling is still used for constraints without a strategy.
+        directed_generation:bool = True
+        
+        # - sampling_block_size -
+        # If above 0, rejection sampling draws candidates in blocks of this size, validates
+        # each block at once (numeric bounds and lengths with numpy) and hands the accepted
+        # values to successive builds. Worth enabling when building many rows.
+        sampling_block_size:int = 0
+        
+        # - field_time_budget -
+        # Seconds rejection sampling may spend on one constrained field before it stops
+        # retrying and coerces the last value (or fails, without coerce_on_fail), as if
+        # max_retries had run out. None leaves max_retries as the only limit. It only bounds
+        # the retries of constrained fields; use build_time_budget to bound whole builds.
+        field_time_budget:float | None = None
+        
+        # - build_time_budget -
+        # Seconds one build may spend, nested models included. Fields mapped to a provider
+        # method that are reached after the deadline, constrained or not, get polyfactory's
+        # value for their type instead of calling the provider; a call already running is not
+        # interrupted. Constrained fields reaching it while sampling get a single attempt before
+        # coercion. Overrunning builds are counted in PolyfactoryLogicMixin.get_build_stats(),
+        # timed out fields in get_field_stats().
+        build_time_budget:float | None = None
+        
+        # - columnar_batch -
+        # If set to True, Factory.batch(size) generates the rows column by column with
+        # build_batch: each field is filled in one loop and constrained fields are sampled
+        # in bulk, then the instances are created at the end.
+        columnar_batch:bool = False
+        
+        # - output_mode -
+        # 'validate' creates every row with full model validation. 'construct' skips it
+        # (model_construct for pydantic models), which is safe for rows whose constrained
+        # values were already checked or coerced. 'raw' returns plain dicts of field values.
+        output_mode:str = 'validate'
+        
+        # - validation_sample_rate -
+        # Debug switch for the 'construct' and 'raw' output modes: the share of rows that
+        # is still validated in full, raising on the first invalid one. 0 validates none.
+        validation_sample_rate:float = 0.0
+        
+        # - cache_resolutions -
+        # If set to True, remember which provider method each field resolved to in an
+        # on-disk cache under PYMOCKER_CACHE_DIR (~/.cache/pymocker by default), so
+        # decorating the same schema again skips the search entirely. The cache is
+        # invalidated when the Faker version, locales, provider classes or the source of
+        # custom providers change.
+        cache_resolutions:bool = False
+        
+        provider_instances:list[object] = _DefaultProviders()
     
     def __init__(self):
         pass
@@ -76,31 +134,43 @@ class Mocker:
         A decorator that enhances a polyfactory factory with automatic data generation.
         """
         def decorator(factory_class: Type[BaseFactory]):
-            if issubclass(factory_class, PolyfactoryLogicMixin):
-                new_factory_class = factory_class
-            else:
-                new_factory_class = type(
-                    factory_class.__name__,
-                    (PolyfactoryLogicMixin, factory_class),
-                    {}
-                )
-
-            config_vars = [attr for attr in dir(self.Config) if not attr.startswith('__') and not attr.endswith('__')]
-            for attr in config_vars:
-                if not hasattr(new_factory_class, attr):
-                    setattr(new_factory_class, attr, getattr(self.Config, attr))
-
-            for key, value in kwargs.items():
-                setattr(new_factory_class, f"__{key}__", value)
-
+            new_factory_class = self._prepare_factory(factory_class, **kwargs)
             self.add_methods_to_cls(new_factory_class)
-            
             return new_factory_class
 
         return decorator
-        
-                
-    def lookup_method_from_instances(self, field_name: str, field_type: Type = None, confidence_threshold: float = 0.75, rank_match=True):
+
+    def mock_all(self, factory_classes: list[Type[BaseFactory]], **kwargs) -> list[Type[BaseFactory]]:
+        """
+        Same as applying `mock(**kwargs)` to every factory, but resolves the fields of
+        all factories in one batch, e.g. for hundreds of models from a database reflection.
+        """
+        new_factory_classes = [self._prepare_factory(factory_class, **kwargs) for factory_class in factory_classes]
+        self.add_methods_to_classes(new_factory_classes)
+        return new_factory_classes
+
+    def _prepare_factory(self, factory_class: Type[BaseFactory], **kwargs) -> Type[BaseFactory]:
+        from pymocker.builder.mixins import PolyfactoryLogicMixin
+
+        if issubclass(factory_class, PolyfactoryLogicMixin):
+            new_factory_class = factory_class
+        else:
+            new_factory_class = type(
+                factory_class.__name__,
+                (PolyfactoryLogicMixin, factory_class),
+                {}
+            )
+
+        config_vars = [attr for attr in dir(self.Config) if not attr.startswith('__') and not attr.endswith('__')]
+        for attr in config_vars:
+            if not hasattr(new_factory_class, attr):
+                setattr(new_factory_class, attr, getattr(self.Config, attr))
+
+        for key, value in kwargs.items():
+            setattr(new_factory_class, f"__{key}__", value)
+        return new_factory_class
+
+    def lookup_method_from_instances(self, field_name: str, field_type: Type = None, confidence_threshold: float | None = 0.75, rank_match=True):
         """
         Gets all callable methods from the instances provided to Config.
         The first condition that matches the search criteria will be returned.
@@ -110,150 +180,141 @@ class Mocker:
         1. Exact match on field_name.
         2. Match on snake_cased field_name.
         3. Match based on cosine similarity of field name and method names.
-        """
-        def _find_exact_match(obj, name):
-            if hasattr(obj, name):
-                return getattr(obj, name)
-            return None
 
-        def _find_snake_case_match(obj, name):
-            lookup_name = segment_and_join_word(name)
-            if hasattr(obj, lookup_name):
-                return getattr(obj, lookup_name)
-            return None
+        With Config.cache_resolutions enabled, the outcome of each lookup (including
+        a miss) is stored on disk and reused by later lookups with the same arguments.
+        """
+        return self.resolve_fields([(field_name, field_type)], confidence_threshold, rank_match)[0]
 
-        def _find_cosine_similarity_match(obj, name, f_type, conf_thresh, r_match):
-            if not (r_match and conf_thresh > 0) or r_match == False:
-                return None
-            lookup_name = segment_and_join_word(name)
-            methods = []
-            obj_method_names = [method_name for method_name in dir(obj) if not method_name.startswith('_')]
-            for method_name in obj_method_names:
-                try:
-                    func = getattr(obj, method_name)
-                    if not callable(func):
-                        continue
-                    
-                    rtype = get_return_type(func, find_by_executing_method=True)
-                    if not (rtype == f_type or f_type is None):
-                        continue
+    def resolve_fields(self, fields: list[tuple[str, Type]], confidence_threshold: float | None = 0.75, rank_match=True) -> list:
+        """
+        Batch form of lookup_method_from_instances for (field_name, field_type) pairs.
+        Providers are visited in order and each field gets the same rules as a single lookup,
+        but every field still unresolved after the exact and snake case rules is ranked in one
+        call per provider and field type, so the ranker encodes all field names in one pass.
+        A confidence_threshold of None uses the ranker's default_threshold.
+        """
+        providers = self.Config.provider_instances
+        ranker = get_ranker(self.Config.ranker)
+        if confidence_threshold is None:
+            confidence_threshold = ranker.default_threshold
+        results = [None] * len(fields)
+        cache = get_resolution_cache(providers) if self.Config.cache_resolutions else None
+        keys = [
+            cache.key(name, f_type, confidence_threshold, rank_match, ranker) if cache is not None else None
+            for name, f_type in fields
+        ]
 
-                    methods.append({'name': method_name})
-                except TypeError:
+        pending = []
+        for i, key in enumerate(keys):
+            if cache is None:
+                pending.append(i)
+                continue
+            cached = cache.get(key)
+            if cached is None:
+                continue
+            if cached is not MISSING:
+                index, method_name = cached
+                method = get_provider_registry(providers[index]).methods.get(method_name) if index < len(providers) else None
+                if method:
+                    results[i] = method
                     continue
+            pending.append(i)
+        if not pending:
+            return results
 
-            if not methods:
-                return None
-
-            ranked_methods = rank([m['name'] for m in methods], lookup_name)
-            if ranked_methods and ranked_methods[0][1][0] >= conf_thresh:
-                return getattr(obj, ranked_methods[0][0])
-            
-            return None
+        # the registries add the words of method names to the segmentation dictionary
+        registries = [get_provider_registry(obj) for obj in providers]
+        lookup_names = {i: segment_and_join_word(fields[i][0]) for i in pending}
+        use_ranking = rank_match and confidence_threshold > 0
+        resolved: dict[int, tuple[int, str]] = {}
+        for index, (obj, registry) in enumerate(zip(providers, registries)):
+            if not pending:
+                break
+            unmatched = []
+            for i in pending:
+                # exact match, then snake case match
+                method_name = registry.find(fields[i][0], lookup_names[i])
+                if method_name is not None:
+                    resolved[i] = (index, method_name)
+                else:
+                    unmatched.append(i)
+            pending = unmatched
+            if not (use_ranking and pending):
+                continue
 
-        rules = [
-            lambda obj: _find_exact_match(obj, field_name),
-            lambda obj: _find_snake_case_match(obj, field_name),
-            lambda obj: _find_cosine_similarity_match(obj, field_name, field_type, confidence_threshold, rank_match)
-        ]
+            groups: list[tuple[Type, list[int]]] = []
+            for i in pending:
+                for f_type, members in groups:
+                    if f_type == fields[i][1]:
+                        members.append(i)
+                        break
+                else:
+                    groups.append((fields[i][1], [i]))
+            for f_type, members in groups:
+                method_names = registry.names_for(f_type)
+                if not method_names:
+                    continue
+                targets = list(dict.fromkeys(lookup_names[i] for i in members))
+                matches = dict(zip(targets, ranker.best_matches(obj, targets, method_names)))
+                for i in members:
+                    match = matches[lookup_names[i]]
+                    if match is not None and match[1] >= confidence_threshold:
+                        resolved[i] = (index, match[0])
+            pending = [i for i in pending if i not in resolved]
 
-        for obj in self.Config.provider_instances:
-            for rule in rules:
-                method = rule(obj)
-                if method:
-                    return method
-        return None
+        for i, (index, method_name) in resolved.items():
+            results[i] = get_provider_registry(providers[index]).methods[method_name]
+        if cache is not None:
+            cache.update({keys[i]: resolved.get(i) for i in lookup_names})
+        return results
 
     def add_methods_to_cls(self, obj: Type[BaseFactory]):
         """
         A class decorator that finds all public methods on a Faker
         instance and adds them to the decorated class.
         """
-        obj=obj
-        mfs = obj.get_model_fields()
-        for field_meta in mfs:
-            if hasattr(obj, field_meta.name) and not hasattr(BaseFactory, field_meta.name):
-                continue
+        return self.add_methods_to_classes([obj])[0]
 
-            method = self.lookup_method_from_instances(
-                field_meta.name,
-                field_type=field_meta.annotation,
-                confidence_threshold=self.Config.confidence_threshold,
-                rank_match=self.Config.match_field_generation_on_cosine_similarity
-            )
+    def add_methods_to_classes(self, classes: list[Type[BaseFactory]]) -> list[Type[BaseFactory]]:
+        """
+        add_methods_to_cls for many factories, resolving all of their fields in one batch.
+
+        :raises ConstraintError: If the constraints of a field cannot be satisfied by any value.
+        """
+        from polyfactory.factories.base import BaseFactory
+        targets = []
+        for obj in classes:
+            for field_meta in obj.get_model_fields():
+                if hasattr(obj, field_meta.name) and not hasattr(BaseFactory, field_meta.name):
+                    continue
+                targets.append((obj, field_meta))
+
+        methods = self.resolve_fields(
+            [(field_meta.name, field_meta.annotation) for _, field_meta in targets],
+            confidence_threshold=self.Config.confidence_threshold,
+            rank_match=self.Config.match_field_generation_on_cosine_similarity
+        )
+        for (obj, field_meta), method in zip(targets, methods):
             if method:
                 setattr(obj, field_meta.name, method)
-        return obj
-    
-def dict_model(name: str, dict_def: dict):
-    fields = {}
-    for field_name, value in dict_def.items():
-        if isinstance(value, tuple):
-            fields[field_name] = value
-        elif isinstance(value, dict):
-            fields[field_name] = (dict_model(f"{name}_{field_name}", value), ...)
-        else:
-            raise ValueError(f"Field {field_name}:{value} has invalid syntax")
-    return create_model(name, **fields)
-try:
-    del pd.DataFrame.mocker
-except AttributeError:
-    pass
-from enum import Enum
-class BuildMode(Enum):
-    append:str='append'
-    replace:str='replace'
-    
-@pd.api.extensions.register_dataframe_accessor("mocker")
-class MockerAccessor:
-    def __init__(self, pandas_obj:pd.DataFrame):
-        self._obj = pandas_obj
-    @property
-    def _pydantic_cls(self) -> Type[BaseModel]:
-        df = self._obj.convert_dtypes(infer_objects=True)
+        for obj in classes:
+            # fields changed, so a build plan compiled earlier is stale. Compiling it
+            # now analyses every field's constraints, so impossible ones fail at decoration
+            if hasattr(obj, 'reset_build_plan'):
+                obj.reset_build_plan()
+                obj.get_build_plan()
+        return classes
 
-        field_definitions = {}
-        for col, dtype in df.dtypes.items():
-            # Use `tolist` trick on an example value to get the native type
-            sample = df[col].dropna().iloc[0] if not df[col].dropna().empty else None
-            if sample is None:
-                py_type = str  # fallback for empty column
-            else:
-                native = getattr(sample, "tolist", lambda: sample)()
-                py_type = type(native)
+def _register_dataframe_accessor(pandas_module) -> None:
+    import pymocker.dataframe
 
-            field_definitions[col] = (py_type, ...)
-        
-        return dict_model(
-            "PandasPydanticModel",
-            field_definitions
-        )
-    
-    def create_factory(self, mocker:Mocker,  **kwargs):
-        # Generate mock data
-        
-        @mocker.mock()
-        class DFFactory(ModelFactory[self._pydantic_cls]):...
-        self.df_factory = DFFactory
-        
-    def build(self,
-              rows:int=1,
-              mode:BuildMode='append',
-              **kwargs):
-        # Generate mock data
-        mocker = kwargs.get("mocker",None)
-        if not hasattr(self, "df_factory") and not mocker:
-            raise Exception
-        if mocker:
-            self.create_factory(mocker)
-        
-        new_data = []
-        for i in range(rows):
-            data_instance=self.df_factory.build()
-            new_data.append({col: getattr(data_instance, col) for col in self._obj.columns})
-        if mode == 'append':
-            self._obj = pd.concat([self._obj, pd.DataFrame(new_data)], ignore_index=True)
-        elif mode == 'replace':
-            self._obj = pd.DataFrame(new_data)
-        
-        return self._obj
\ No newline at end of file
+# the `mocker` DataFrame accessor is registered as soon as pandas is imported,
+# without pymocker importing pandas itself
+when_imported('pandas', _register_dataframe_accessor)
+
+def __getattr__(name: str):
+    if name in ('MockerAccessor', 'BuildMode', 'dict_model'):
+        import pymocker.dataframe
+        return getattr(pymocker.dataframe, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
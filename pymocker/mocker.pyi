@@ -1,27 +1,31 @@
-from polyfactory.factories import DataclassFactory as DataclassFactory, TypedDictFactory as TypedDictFactory
 from polyfactory.factories.base import BaseFactory
-from polyfactory.factories.pydantic_factory import ModelFactory as ModelFactory
-from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory as SQLAlchemyFactory
-from pydantic.fields import Undefined
-from pydantic.v1 import BaseModel as BaseModelV1
-from pymocker.builder.mixins import PolyfactoryLogicMixin as PolyfactoryLogicMixin
-from pymocker.builder.rank import rank as rank
-from pymocker.builder.utils import get_return_type as get_return_type, segment_and_join_word as segment_and_join_word
-from sympy.liealgebras.type_e import TypeE as TypeE
-
-BaseModelV2 = BaseModelV1
-UndefinedV2 = Undefined
+from pymocker.builder.cache import MISSING as MISSING, get_resolution_cache as get_resolution_cache
+from pymocker.builder.rank import get_ranker as get_ranker
+from pymocker.builder.utils import segment_and_join_word as segment_and_join_word, when_imported as when_imported
+from pymocker.dataframe import BuildMode as BuildMode, MockerAccessor as MockerAccessor, dict_model as dict_model
 
 def add_passthrough_args_to_object_method(obj: object, attr_name) -> object: ...
 
 class Mocker:
     class Config:
         match_field_generation_on_cosine_similarity: bool
-        confidence_threshold: float
+        confidence_threshold: float | None
         max_retries: int
         coerce_on_fail: bool
+        directed_generation: bool
+        sampling_block_size: int
+        field_time_budget: float | None
+        build_time_budget: float | None
+        columnar_batch: bool
+        output_mode: str
+        validation_sample_rate: float
+        ranker: str
+        cache_resolutions: bool
         provider_instances: list[object]
     def __init__(self) -> None: ...
     def mock(self, **kwargs): ...
-    def lookup_method_from_instances(self, field_name: str, field_type: type = None, confidence_threshold: float = 0.75, rank_match: bool = True): ...
+    def mock_all(self, factory_classes: list[type[BaseFactory]], **kwargs) -> list[type[BaseFactory]]: ...
+    def lookup_method_from_instances(self, field_name: str, field_type: type = None, confidence_threshold: float | None = 0.75, rank_match: bool = True): ...
+    def resolve_fields(self, fields: list[tuple[str, type]], confidence_threshold: float | None = 0.75, rank_match: bool = True) -> list: ...
     def add_methods_to_cls(self, obj: type[BaseFactory]): ...
+    def add_methods_to_classes(self, classes: list[type[BaseFactory]]) -> list[type[BaseFactory]]: ...
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# keep on-disk caches (embeddings, types, resolutions) out of the user's home directory
+os.environ.setdefault("PYMOCKER_CACHE_DIR", tempfile.mkdtemp(prefix="pymocker-tests-"))
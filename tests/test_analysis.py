@@ -0,0 +1,56 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from pymocker.builder.analysis import ConstraintError, analyse_constraints
+
+# 1. Feasible constraints and their normalized range
+
+def test_int_bounds_become_inclusive_multiples():
+    assert analyse_constraints(int, {"gt": 0, "lt": 10, "multiple_of": 4}) == {"ge": 4, "le": 8, "multiple_of": 4}
+    assert analyse_constraints(int, {"ge": 1.5}) == {"ge": 2}
+    assert analyse_constraints(int, {"ge": 3, "gt": 5}) == {"ge": 6}
+
+def test_date_bounds_become_inclusive():
+    assert analyse_constraints(date, {"gt": date(2020, 1, 1), "lt": date(2020, 1, 3)}) == {
+        "ge": date(2020, 1, 2), "le": date(2020, 1, 2),
+    }
+
+def test_feasible_constraints_are_kept():
+    assert analyse_constraints(float, {"ge": 0.3, "le": 0.3, "multiple_of": 0.1}) == {"ge": 0.3, "le": 0.3, "multiple_of": 0.1}
+    assert analyse_constraints(Decimal, {"max_digits": 4, "decimal_places": 2, "le": Decimal("99.99")})
+    assert analyse_constraints(str, {"min_length": 2, "max_length": 2, "pattern": "^a+$"})
+    assert analyse_constraints(List[int], {"min_length": 1, "max_length": 3})
+    assert analyse_constraints(Optional[int], {"ge": 10, "le": 1}) == {"ge": 10, "le": 1}
+    assert analyse_constraints(bool, {}) == {}
+
+def test_unanchored_patterns_may_match_inside_longer_strings():
+    """Tests that min_length is only checked against the pattern when it is anchored at both ends."""
+    assert analyse_constraints(str, {"pattern": r"\d{3}", "min_length": 10})
+    assert analyse_constraints(str, {"pattern": r"^\d{3}", "min_length": 10})
+    with pytest.raises(ConstraintError):
+        analyse_constraints(str, {"pattern": r"^\d{3}$", "min_length": 10})
+
+# 2. Impossible constraints
+
+@pytest.mark.parametrize("annotation,constraints", [
+    (int, {"gt": 5, "lt": 6}),
+    (int, {"ge": 1, "le": 3, "multiple_of": 5}),
+    (int, {"multiple_of": 0}),
+    (float, {"gt": 1.0, "lt": 1.0}),
+    (float, {"ge": 0.1, "le": 0.9, "multiple_of": 1.0}),
+    (Decimal, {"max_digits": 2, "decimal_places": 3}),
+    (Decimal, {"max_digits": 3, "decimal_places": 1, "ge": Decimal("100")}),
+    (str, {"min_length": 5, "max_length": 2}),
+    (str, {"lower_case": True, "upper_case": True}),
+    (str, {"pattern": "(unclosed"}),
+    (str, {"pattern": r"^\d{5}$", "max_length": 4}),
+    (str, {"pattern": r"^(ab|c)$", "min_length": 3}),
+    (bytes, {"min_length": -1}),
+    (List[int], {"min_length": 3, "max_length": 1}),
+    (date, {"ge": date(2020, 1, 2), "lt": date(2020, 1, 2)}),
+])
+def test_impossible_constraints_are_rejected(annotation, constraints):
+    with pytest.raises(ConstraintError):
+        analyse_constraints(annotation, constraints)
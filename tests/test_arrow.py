@@ -0,0 +1,160 @@
+from dataclasses import dataclass, field as dataclass_field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional
+
+import pytest
+from unittest.mock import patch
+from pydantic import BaseModel, Field, ValidationError
+from polyfactory.factories.dataclass_factory import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.field_meta import Null
+
+from pymocker.builder.arrow import ArrowSink, arrow_schema, arrow_type, column_to_arrow
+from pymocker.mocker import Mocker
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+class Color(Enum):
+    RED = "red"
+
+class Inner(BaseModel):
+    x: int
+
+class Row(BaseModel):
+    id: int = Field(ge=0, le=100)
+    score: float
+    inner: Inner
+    note: Optional[str] = None
+
+class Counts(BaseModel):
+    counts: dict[str, int]
+    extra: Optional[dict[str, int]]
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+class LexicalMocker(Mocker):
+    class Config(Mocker.Config):
+        ranker = 'lexical'
+
+def mock_factory(model, use_defaults=False, base=ModelFactory):
+    @LexicalMocker().mock()
+    class Factory(base[model]):
+        __use_defaults__ = use_defaults
+    return Factory
+
+@pytest.fixture
+def factory():
+    return mock_factory(Row)
+
+def test_arrow_type_follows_the_annotation():
+    """Tests that annotations map to Arrow types without looking at any values."""
+    assert arrow_type(Optional[int]) == pa.int64()
+    assert arrow_type(datetime) == pa.timestamp('us')
+    assert arrow_type(date) == pa.date32()
+    assert arrow_type(Color) == pa.string()
+    assert arrow_type(list[str]) == pa.list_(pa.string())
+    assert arrow_type(dict[str, int]) == pa.map_(pa.string(), pa.int64())
+    assert arrow_type(Optional[dict[str, list[int]]]) == pa.map_(pa.string(), pa.list_(pa.int64()))
+    assert arrow_type(Point) == pa.struct([("x", pa.float64()), ("y", pa.float64())])
+    for annotation in (dict, Any, int | str):
+        with pytest.raises(TypeError):
+            arrow_type(annotation)
+    with pytest.raises(TypeError, match="'payload'"):
+        arrow_schema({"id": int, "payload": dict})
+
+def test_column_to_arrow_converts_plain_values():
+    """Tests that models, enums and Null are converted to Arrow structs, values and nulls."""
+    assert column_to_arrow([1, 2], arrow_type(Optional[int])).type == pa.int64()
+    assert column_to_arrow([Color.RED, Null]).to_pylist() == ["red", None]
+    assert column_to_arrow([Inner(x=1)]).to_pylist() == [{"x": 1}]
+
+def test_sink_converts_every_batch_to_its_schema(tmp_path):
+    """Tests that batches are converted to the sink's schema, whatever their values."""
+    path = tmp_path / "rows.arrow"
+    schema = pa.schema([("a", pa.int32()), ("b", pa.map_(pa.string(), pa.int64()))])
+    with ArrowSink(str(path), schema, format='ipc') as sink:
+        sink.write({"a": [1, 2], "b": [None, None]})
+        sink.write({"b": [{"k": 1}], "a": [3]})
+        with pytest.raises(ValueError, match="'a'"):
+            sink.write({"a": ["x"], "b": [None]})
+    table = pa.ipc.open_file(str(path)).read_all()
+    assert sink.rows == 3
+    assert table.schema == schema
+    assert table.column("b").to_pylist() == [None, None, [("k", 1)]]
+    with pytest.raises(ValueError):
+        ArrowSink(str(path), schema, format='csv')
+
+def test_write_parquet_streams_row_groups(factory, tmp_path):
+    """Tests that rows are written in row groups of row_group_size, with the requested codec."""
+    path = tmp_path / "rows.parquet"
+    assert factory.write_parquet(str(path), rows=25, row_group_size=10, compression='zstd') == 25
+
+    parquet = pq.ParquetFile(str(path))
+    assert [parquet.metadata.row_group(i).num_rows for i in range(parquet.num_row_groups)] == [10, 10, 5]
+    assert parquet.metadata.row_group(0).column(0).compression == 'ZSTD'
+    assert parquet.schema_arrow.names == ["id", "score", "inner", "note"]
+    assert parquet.schema_arrow.field("inner").type == pa.struct([("x", pa.int64())])
+    for row in parquet.read().to_pylist():
+        Row(**row)
+
+def test_write_arrow_writes_ipc_files(factory, tmp_path):
+    """Tests that IPC files hold one record batch per row_group_size rows and take build kwargs."""
+    path = tmp_path / "rows.arrow"
+    factory.write_arrow(str(path), rows=5, row_group_size=2, compression='lz4', score=1.5)
+    reader = pa.ipc.open_file(str(path))
+    assert reader.num_record_batches == 3
+    assert reader.read_all().column("score").to_pylist() == [1.5] * 5
+
+def test_write_arrow_validates_rows_before_writing(factory, tmp_path):
+    """Tests that rows are validated as the output mode asks before they reach the file."""
+    path = tmp_path / "rows.arrow"
+    with pytest.raises(ValidationError):
+        factory.write_arrow(str(path), rows=5, id=500)
+    with patch.object(factory, "__output_mode__", "construct"):
+        assert factory.write_arrow(str(path), rows=5, id=500) == 5
+    assert pa.ipc.open_file(str(path)).read_all().column("id").to_pylist() == [500] * 5
+
+def test_write_arrow_calls_default_factories(tmp_path):
+    """Tests that fields left to their default_factory get a new value for every row."""
+    made = []
+    class Tagged(BaseModel):
+        id: int
+        tags: list[str] = Field(default_factory=lambda: made.append(1) or ["new"])
+
+    @dataclass
+    class Labelled:
+        id: int
+        labels: list[str] = dataclass_field(default_factory=lambda: ["new"])
+
+    for model, base, name in ((Tagged, ModelFactory, "tags"), (Labelled, DataclassFactory, "labels")):
+        factory = mock_factory(model, use_defaults=True, base=base)
+        path = tmp_path / f"{name}.parquet"
+        factory.write_parquet(str(path), rows=4, row_group_size=2)
+        assert pq.read_table(str(path)).column(name).to_pylist() == [["new"]] * 4
+    assert len(made) >= 4
+
+    class Derived(BaseModel):
+        id: int
+        key: str = Field(default_factory=lambda data: str(data["id"]))
+    factory = mock_factory(Derived, use_defaults=True)
+    with pytest.raises(TypeError, match="key"):
+        factory.write_parquet(str(tmp_path / "derived.parquet"), rows=2)
+
+@pytest.mark.parametrize("format", ["parquet", "ipc"])
+def test_dict_fields_keep_their_map_type_across_batches(tmp_path, format):
+    """Tests that dict and optional dict fields are maps in every batch, whatever keys each one draws."""
+    path = str(tmp_path / "counts")
+    factory = mock_factory(Counts)
+    factory.write_arrow(path, rows=40, format=format, row_group_size=4)
+    table = pq.read_table(path) if format == 'parquet' else pa.ipc.open_file(path).read_all()
+
+    assert table.num_rows == 40
+    assert table.schema.field("counts").type == pa.map_(pa.string(), pa.int64())
+    assert table.schema.field("extra").type == pa.map_(pa.string(), pa.int64())
+    for row in table.to_pylist():
+        Counts(counts=dict(row["counts"]), extra=None if row["extra"] is None else dict(row["extra"]))
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+import pytest
+
+from pymocker.builder.cache import (
+    MISSING,
+    ResolutionCache,
+    clear_resolution_caches,
+    environment_fingerprint,
+    get_resolution_cache,
+)
+from pymocker.builder.rank import get_ranker
+from pymocker.mocker import Mocker
+
+# 1. Providers for testing
+
+class CityProvider:
+    def city(self): return "Paris"
+
+class OtherProvider:
+    def city(self): return "Rome"
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYMOCKER_CACHE_DIR", str(tmp_path))
+    clear_resolution_caches()
+    yield tmp_path
+    clear_resolution_caches()
+
+# 2. Tests for ResolutionCache
+
+def test_resolution_cache_round_trip(tmp_path):
+    """Tests that hits and misses are persisted and reloaded."""
+    path = str(tmp_path / "resolutions.json")
+    cache = ResolutionCache(path)
+    hit = cache.key("city", str, 0.5, True)
+    miss = cache.key("nothing", str, 0.5, True)
+    cache.set(hit, (0, "city"))
+    cache.set(miss, None)
+
+    reloaded = ResolutionCache(path)
+    assert reloaded.get(hit) == (0, "city")
+    assert reloaded.get(miss) is None
+    assert reloaded.get(cache.key("city", int, 0.5, True)) is MISSING
+
+def test_resolution_cache_key_depends_on_threshold_type_and_ranker():
+    """Tests that lookups with different arguments never share an entry."""
+    keys = {
+        ResolutionCache.key("city", str, 0.5, True),
+        ResolutionCache.key("city", int, 0.5, True),
+        ResolutionCache.key("city", str, 0.75, True),
+        ResolutionCache.key("city", str, 0.5, False),
+        ResolutionCache.key("city", str, 0.5, True, get_ranker("lexical")),
+    }
+    assert len(keys) == 5
+
+def test_environment_fingerprint_changes_with_providers():
+    """Tests that changing the provider set invalidates the cache."""
+    assert environment_fingerprint([CityProvider()]) == environment_fingerprint([CityProvider()])
+    assert environment_fingerprint([CityProvider()]) != environment_fingerprint([OtherProvider()])
+    assert environment_fingerprint([CityProvider(), OtherProvider()]) != environment_fingerprint([OtherProvider(), CityProvider()])
+
+def test_environment_fingerprint_changes_with_provider_source():
+    """Tests that editing a custom provider's method body invalidates the cache."""
+    before = environment_fingerprint([CityProvider()])
+    with patch("inspect.getsource", return_value="class CityProvider:\n    def city(self): return 'Rome'\n"):
+        after = environment_fingerprint([CityProvider()])
+    assert before != after
+
+def test_resolutions_are_not_cached_by_default():
+    """Tests that the on-disk cache is opt in."""
+    assert Mocker.Config.cache_resolutions is False
+
+def test_lookup_uses_cached_resolution():
+    """Tests that a warm lookup returns the cached method without searching again."""
+    class CachedMocker(Mocker):
+        class Config(Mocker.Config):
+            provider_instances = [CityProvider()]
+            match_field_generation_on_cosine_similarity = False
+            cache_resolutions = True
+
+    mocker = CachedMocker()
+    method = mocker.lookup_method_from_instances("city", str, rank_match=False)
+    assert method() == "Paris"
+
+    cache = get_resolution_cache(CachedMocker.Config.provider_instances)
+    key = cache.key("city", str, 0.75, False, get_ranker(CachedMocker.Config.ranker))
+    assert cache.get(key) == (0, "city")
+
+    clear_resolution_caches()
+    rules_ran = []
+    mocker_segment = "pymocker.mocker.segment_and_join_word"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mocker_segment, lambda *a, **k: rules_ran.append(a) or "")
+        assert mocker.lookup_method_from_instances("city", str, rank_match=False)() == "Paris"
+        assert mocker.lookup_method_from_instances("missing", str, rank_match=False) is None
+        rules_ran.clear()
+        assert mocker.lookup_method_from_instances("missing", str, rank_match=False) is None
+    assert rules_ran == []
@@ -0,0 +1,82 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+from faker import Faker
+
+from pymocker.builder.catalog import TypeCatalog, clear_type_catalogs, get_type_catalog
+
+# 1. Providers with and without annotations
+
+class CountingProvider:
+    calls = 0
+    def annotated(self) -> int:
+        raise AssertionError("annotated methods must never be called")
+    def generic(self) -> List[str]:
+        raise AssertionError("annotated methods must never be called")
+    def unannotated(self):
+        CountingProvider.calls += 1
+        return Decimal("1.5")
+    def needs_argument(self, value):
+        return value
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYMOCKER_CACHE_DIR", str(tmp_path))
+    CountingProvider.calls = 0
+    clear_type_catalogs()
+    yield tmp_path
+    clear_type_catalogs()
+
+# 2. Tests for TypeCatalog
+
+def test_catalog_prefers_annotations():
+    """Tests that annotated methods are catalogued without being called."""
+    catalog = TypeCatalog(CountingProvider())
+    assert catalog.get("annotated") is int
+    assert catalog.get("generic") == List[str]
+
+def test_catalog_samples_unannotated_methods_once():
+    """Tests that an unannotated method is called exactly once."""
+    catalog = get_type_catalog(CountingProvider())
+    get_type_catalog(CountingProvider())
+
+    assert catalog.get("unannotated") is Decimal
+    assert CountingProvider.calls == 1
+
+def test_catalog_sampled_types_are_cached_on_disk():
+    """Tests that a later process reuses sampled types instead of calling the method again."""
+    get_type_catalog(CountingProvider())
+    clear_type_catalogs()
+
+    catalog = get_type_catalog(CountingProvider())
+
+    assert catalog.get("unannotated") is Decimal
+    assert CountingProvider.calls == 1
+
+def test_catalog_methods_that_cannot_be_called_are_any():
+    """Tests that a method requiring arguments is catalogued as Any."""
+    catalog = TypeCatalog(CountingProvider())
+    assert catalog.get("needs_argument") is Any
+
+def test_catalog_names_for_type():
+    """Tests that field-type filtering is a lookup by return type."""
+    catalog = TypeCatalog(CountingProvider())
+    assert catalog.names_for(int) == ["annotated"]
+    assert catalog.names_for(Decimal) == ["unannotated"]
+    assert catalog.names_for(date) == []
+    assert set(catalog.names_for(None)) == {"annotated", "generic", "unannotated", "needs_argument"}
+
+def test_catalog_uses_static_faker_table(monkeypatch):
+    """Tests that slow built-in Faker methods are typed without being executed."""
+    def fail(*args, **kwargs):
+        raise AssertionError("Faker methods must not be executed")
+    monkeypatch.setattr(TypeCatalog, "_sample", staticmethod(fail))
+
+    catalog = get_type_catalog(Faker())
+
+    assert catalog.get("first_name") is str
+    assert catalog.get("zip") is bytes
+    assert catalog.get("uuid4") is str
+    assert "first_name" in catalog.names_for(str)
@@ -1,4 +1,5 @@
 
+import re
 import pytest
 from decimal import Decimal
 from datetime import date, timedelta
@@ -18,6 +19,7 @@ from pymocker.builder.coercers import (
     coerce_uuid,
     coerce_path,
     coerce_value,
+    compile_coercer,
     _coerce_numeric
 )
 
@@ -114,3 +116,30 @@ def test_coerce_value_dynamic_dispatch():
     assert isinstance(coerce_value(12.5, float, ge=15.0), float)
     # Test no-op for unhandled type
     assert coerce_value(True, bool) is True
+
+# Tests for compile_coercer
+def test_compile_coercer_is_cached():
+    assert compile_coercer(int, {"ge": 5}) is compile_coercer(int, {"ge": 5})
+    assert compile_coercer(int, {"ge": 5})(1) == 5
+    assert compile_coercer(str, {"max_length": 2, "ge": 1})("abc") == "ab"
+
+def test_compile_coercer_collection_dispatches_on_value_type():
+    coerce = compile_coercer(Collection, {"max_items": 1})
+    assert coerce({1, 2}) in ({1}, {2})
+    assert coerce([1, 2]) == [1]
+    assert compile_coercer(bool)(True) is True
+
+def test_coerce_string_pattern():
+    value = coerce_string("nope", pattern=r"^[A-Z]{3}-\d{2}$")
+    assert re.match(r"^[A-Z]{3}-\d{2}$", value)
+    assert coerce_string("ABC-12", pattern=r"^[A-Z]{3}-\d{2}$") == "ABC-12"
+    assert coerce_value("nope", str, pattern=r"^\d{4}$", max_length=4).isdigit()
+
+def test_coerce_string_pattern_uses_the_given_random():
+    """Tests that pattern coercion draws from the random instance it is given, so seeds reproduce it."""
+    from random import Random
+    pattern = r"^[A-Z]{8}$"
+    assert coerce_string("nope", pattern=pattern, random=Random(1)) == coerce_string("nope", pattern=pattern, random=Random(1))
+    assert compile_coercer(str, {"pattern": pattern}, Random(2))("nope") == compile_coercer(str, {"pattern": pattern}, Random(2))("nope")
+    padded = coerce_string("nope", pattern=r"\d{3}", min_length=10)
+    assert len(padded) == 10 and re.search(r"\d{3}", padded)
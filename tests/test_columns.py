@@ -0,0 +1,134 @@
+import time
+from collections import Counter, OrderedDict
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from pymocker.builder.columns import compile_column_draw
+from pymocker.mocker import Mocker
+
+class LexicalMocker(Mocker):
+    class Config(Mocker.Config):
+        ranker = 'lexical'
+
+class Flat(BaseModel):
+    first_name: str
+    last_name: str
+    email: str
+    city: str
+    phone_number: str
+    company: str
+    age: int
+
+class Traceable(BaseModel):
+    first_name: str
+    last_name: str
+    job: str
+    city: str
+    name: str
+    company: str
+    age: int
+
+@pytest.fixture
+def fake():
+    faker = Faker('en_US')
+    faker.seed_instance(0)
+    return faker
+
+@pytest.mark.parametrize("method", ['first_name', 'last_name', 'job', 'color_name', 'country', 'state'])
+def test_element_methods_draw_from_their_elements(fake, method):
+    draw = compile_column_draw(getattr(fake, method))
+    assert draw is not None
+    values = draw(500)
+    expected = {getattr(fake, method)() for _ in range(3000)}
+    assert len(values) == 500
+    assert set(values) & expected
+
+def test_first_name_draws_from_the_provider_elements(fake):
+    provider = fake.first_name.__self__
+    names = set(provider.first_names_male) | set(provider.first_names_female) | set(provider.first_names_nonbinary) | set(provider.first_names)
+    assert set(compile_column_draw(fake.first_name)(1000)) <= names
+
+def test_weighted_elements_follow_their_weights(fake):
+    class Provider(type(fake.first_name.__self__)):
+        def pick(self):
+            return self.random_element(OrderedDict([('rare', 0.1), ('common', 0.9)]))
+    provider = Provider(fake.first_name.__self__.generator)
+    # as faker.Factory sets it on the providers it adds
+    provider.__use_weighting__ = True
+    counts = Counter(compile_column_draw(provider.pick)(5000))
+    assert set(counts) == {'rare', 'common'}
+    assert 0.85 < counts['common'] / 5000 < 0.95
+
+@pytest.mark.parametrize("method", ['name', 'city', 'company', 'street_address', 'address'])
+def test_template_methods_fill_every_token(fake, method):
+    draw = compile_column_draw(getattr(fake, method))
+    assert draw is not None
+    for value in draw(200):
+        assert isinstance(value, str) and value
+        assert '{{' not in value and '}}' not in value
+
+def test_numerified_methods_replace_every_placeholder(fake):
+    draw = compile_column_draw(fake.phone_number)
+    assert draw is not None
+    assert all('#' not in value for value in draw(200))
+
+@pytest.mark.parametrize("method", ['email', 'user_name', 'pyint', 'date'])
+def test_untraced_methods_are_drawn_on_a_copy_of_the_generator(fake, method):
+    provider = getattr(fake, method).__self__
+    before = dict(vars(provider))
+    values = compile_column_draw(getattr(fake, method))(200)
+    assert len(values) == 200
+    assert {type(value) for value in values} == {type(getattr(fake, method)())}
+    assert vars(provider) == before
+
+def test_untraced_methods_keep_their_distribution(fake):
+    values = compile_column_draw(fake.email)(500)
+    assert all('@' in value and value == value.lower() for value in values)
+    assert len(set(values)) > 450
+
+def test_untraced_methods_follow_a_later_seed(fake):
+    draw = compile_column_draw(fake.email)
+    fake.seed_instance(7)
+    first = draw(20)
+    fake.seed_instance(7)
+    assert draw(20) == first
+
+def test_other_callables_are_not_compiled():
+    assert compile_column_draw(lambda: 1) is None
+    assert compile_column_draw(len) is None
+
+def test_tracing_leaves_the_provider_untouched(fake):
+    provider = fake.name.__self__
+    before = dict(vars(provider))
+    compile_column_draw(fake.name)
+    assert vars(provider) == before
+    assert isinstance(fake.name(), str)
+
+def test_draws_follow_the_provider_seed():
+    first, second = Faker('en_US'), Faker('en_US')
+    first.seed_instance(3)
+    second.seed_instance(3)
+    assert compile_column_draw(first.name)(50) == compile_column_draw(second.name)(50)
+
+def _speedup(model, size):
+    @LexicalMocker().mock()
+    class Factory(ModelFactory[model]): ...
+    Factory.build(); Factory.process_batch(10)
+    start = time.perf_counter()
+    for _ in range(size):
+        Factory.process_kwargs()
+    per_row = time.perf_counter() - start
+    start = time.perf_counter()
+    Factory.process_batch(size)
+    return per_row / (time.perf_counter() - start)
+
+def test_process_batch_speedup_on_traceable_fields():
+    # measured about 130x, see process_batch
+    assert _speedup(Traceable, 2000) >= 10
+
+def test_process_batch_speedup_with_untraceable_fields():
+    # email is generated value by value; measured about 30x, see process_batch
+    assert _speedup(Flat, 2000) >= 10
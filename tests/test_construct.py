@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from pydantic import BaseModel, Field
+
+from pymocker.builder.construct import compile_constructor
+
+class Plain(BaseModel):
+    a: int
+    b: str = "default"
+    c: list[int] = Field(default_factory=list)
+
+class Aliased(BaseModel):
+    a: int = Field(alias="A")
+
+def test_constructor_matches_model_construct():
+    """Tests that compiled construction sets the same fields, defaults and fields set as model_construct."""
+    construct = compile_constructor(Plain)
+    for row in ({"a": 1, "b": "x", "c": [1]}, {"a": 1}, {"b": "x", "a": 2}):
+        instance, expected = construct(dict(row)), Plain.model_construct(**row)
+        assert instance == expected
+        assert instance.model_fields_set == expected.model_fields_set
+        assert list(instance.__dict__) == list(expected.__dict__)
+
+def test_constructor_skips_validation():
+    """Tests that values are taken as they are."""
+    instance = compile_constructor(Plain)({"a": "not an int", "b": "x", "c": []})
+    assert instance.a == "not an int"
+
+def test_constructor_falls_back_to_model_construct():
+    """Tests that aliased models use model_construct and non-pydantic classes get no constructor."""
+    assert compile_constructor(Aliased)({"A": 1}).a == 1
+    @dataclass
+    class Data:
+        a: int
+    assert compile_constructor(Data) is None
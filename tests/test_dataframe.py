@@ -0,0 +1,211 @@
+from datetime import datetime, timezone
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from pydantic import ValidationError
+
+from pymocker.dataframe import clear_dataframe_caches, column_array, infer_schema
+from pymocker.mocker import Mocker
+
+class LexicalMocker(Mocker):
+    class Config(Mocker.Config):
+        ranker = 'lexical'
+
+@pytest.fixture
+def mocker():
+    return LexicalMocker()
+
+def test_column_array_types_columns():
+    """Tests that numeric, bool and datetime columns become typed arrays and text stays object."""
+    assert column_array([1, 2], int).dtype == np.int64
+    assert column_array([1.5, 2], float).dtype == np.float64
+    assert column_array([True, False], bool).dtype == np.bool_
+    assert column_array([datetime(2020, 1, 1)], datetime).dtype == np.dtype('datetime64[ns]')
+    assert column_array(["a", "b"], str).dtype == object
+    assert column_array(["a", None], str, pd.StringDtype()).dtype == pd.StringDtype()
+
+def test_column_array_falls_back_to_object():
+    """Tests that values not fitting the field's dtype are kept as they are."""
+    assert list(column_array([1, None], int)) == [1, None]
+    assert column_array([2 ** 70], int).dtype == object
+    mixed = [datetime(2020, 1, 1), datetime(2020, 1, 1, tzinfo=timezone.utc)]
+    assert list(column_array(mixed, datetime)) == mixed
+
+def test_build_generates_typed_columns(mocker):
+    """Tests that build fills every column with typed values in replace and append modes."""
+    df = pd.DataFrame({"id": [1], "first_name": ["Ann"], "score": [0.5], "active": [True]})
+    built = df.mocker.build(mocker=mocker, rows=20, mode='replace')
+
+    assert len(built) == 20
+    assert list(built.columns) == list(df.columns)
+    assert built.dtypes.to_dict() == {
+        "id": np.int64, "first_name": object, "score": np.float64, "active": np.bool_,
+    }
+    assert built["first_name"].map(type).eq(str).all()
+
+    appended = df.mocker.build(rows=5)
+    assert len(appended) == 25
+    assert appended["id"].dtype == np.int64
+
+def test_build_generates_the_example_frame_in_seconds(mocker):
+    """Tests that the columns of examples/example_df.py take seconds for 100,000 rows, here 20,000."""
+    df = pd.DataFrame(columns=['id', 'firstname', 'middlename', 'lastname', 'ssn', 'phonenumber',
+                               'address_line_1', 'address_line_2', 'company'])
+    df.mocker.build(mocker=mocker, rows=10, mode='replace')
+    start = time.perf_counter()
+    built = df.mocker.build(rows=20_000, mode='replace')
+    # measured about 0.7s
+    assert time.perf_counter() - start < 4
+    assert len(built) == 20_000 and built["firstname"].map(type).eq(str).all()
+
+def test_infer_schema_reads_a_bounded_sample():
+    """Tests that types come from the first rows only, with str for columns without a value there."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [None, None, 1.5], "c": ["x", None, None]})
+    assert infer_schema(df) == (("a", int), ("b", float), ("c", str))
+    assert infer_schema(df, sample_rows=2) == (("a", int), ("b", str), ("c", str))
+
+def test_factory_is_reused_for_frames_with_the_same_schema(mocker):
+    """Tests that the model and factory are decorated once per schema and mocker."""
+    clear_dataframe_caches()
+    first = pd.DataFrame({"id": [1], "first_name": ["Ann"]})
+    second = pd.DataFrame({"id": [7, 8], "first_name": ["Bob", "Eve"]})
+    with patch.object(mocker, "mock", wraps=mocker.mock) as mock:
+        first.mocker.build(mocker=mocker, rows=2)
+        first.mocker.build(mocker=mocker, rows=2)
+        second.mocker.build(mocker=mocker, rows=2)
+    assert mock.call_count == 1
+    assert first.mocker.df_factory is second.mocker.df_factory
+
+    other = pd.DataFrame({"id": [1.5], "first_name": ["Ann"]})
+    other.mocker.build(mocker=mocker, rows=1)
+    assert other.mocker.df_factory is not first.mocker.df_factory
+
+def test_factory_follows_config_changes(mocker, monkeypatch):
+    """Tests that changing the mocker's Config decorates a new factory for the same schema."""
+    class NameProvider:
+        def first_name(self):
+            return "Zed"
+    df = pd.DataFrame({"first_name": ["Ann"]})
+    df.mocker.build(mocker=mocker, rows=1, mode='replace')
+    factory = df.mocker.df_factory
+    monkeypatch.setattr(LexicalMocker.Config, "provider_instances", [NameProvider()])
+    built = df.mocker.build(mocker=mocker, rows=3, mode='replace')
+    assert df.mocker.df_factory is not factory
+    assert list(built["first_name"]) == ["Zed"] * 3
+
+def test_schema_is_inferred_again_when_dtypes_change(mocker):
+    """Tests that the accessor keeps its schema until the columns or dtypes of its frame change."""
+    df = pd.DataFrame({"id": [1]})
+    accessor = df.mocker
+    with patch("pymocker.dataframe.infer_schema", wraps=infer_schema) as infer:
+        assert accessor.schema == accessor.schema == (("id", int),)
+        accessor._obj = pd.DataFrame({"id": ["a"]})
+        assert accessor.schema == (("id", str),)
+    assert infer.call_count == 2
+
+def test_append_buffers_rows_until_flush(mocker):
+    """Tests that appended rows are combined with the frame in a single concat."""
+    df = pd.DataFrame({"id": [1], "first_name": ["Ann"]})
+    accessor = df.mocker
+    with patch("pymocker.dataframe.pd.concat", wraps=pd.concat) as concat:
+        accessor.append(rows=2, mocker=mocker).append(rows=3)
+        assert accessor.pending_rows == 5
+        assert len(accessor._obj) == 1
+        flushed = accessor.flush()
+    assert concat.call_count == 1
+    assert len(flushed) == 6 and accessor.pending_rows == 0
+    assert flushed["id"].dtype == np.int64
+
+def test_build_combines_buffered_rows(mocker):
+    """Tests that build appends buffered rows along with its own and replace discards them."""
+    df = pd.DataFrame({"id": [1]})
+    accessor = df.mocker
+    accessor.append(rows=2, mocker=mocker)
+    assert len(accessor.build(rows=3)) == 6
+    accessor.append(rows=2)
+    assert len(accessor.build(rows=3, mode='replace')) == 3
+    assert accessor.pending_rows == 0
+
+def test_build_validates_frame_rows(mocker):
+    """Tests that frame rows are validated in 'validate' mode and only sampled in the others."""
+    from pydantic import ValidationError
+    df = pd.DataFrame({"id": [1]})
+    accessor = df.mocker
+    accessor.create_factory(mocker)
+    factory = accessor.df_factory
+    with patch.object(factory, "process_batch", return_value={"id": [1, "x"]}):
+        with pytest.raises(ValidationError):
+            accessor.build(rows=2, mode='replace')
+        with patch.object(factory, "__output_mode__", 'construct'):
+            assert len(accessor.build(rows=2, mode='replace')) == 2
+            with patch.object(factory, "__validation_sample_rate__", 1.0), pytest.raises(ValidationError):
+                accessor.build(rows=2, mode='replace')
+
+def test_iter_chunks_streams_bounded_frames(mocker):
+    """Tests that iter_chunks yields frames of at most chunk_size rows without touching the frame."""
+    df = pd.DataFrame({"id": [1], "score": [0.5]})
+    chunks = list(df.mocker.iter_chunks(rows=7, chunk_size=3, mocker=mocker))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert list(pd.concat(chunks).index) == list(range(7))
+    assert all(chunk["id"].dtype == np.int64 for chunk in chunks)
+    assert len(df) == 1
+    with pytest.raises(ValueError):
+        df.mocker.iter_chunks(rows=7, chunk_size=0)
+
+def test_iter_chunks_generates_as_consumed(mocker):
+    """Tests that chunks are generated on demand, or at most prefetch_chunks ahead in a thread."""
+    df = pd.DataFrame({"id": [1]})
+    accessor = df.mocker
+    accessor.create_factory(mocker)
+    with patch.object(accessor, "_build_frame", wraps=accessor._build_frame) as build:
+        chunks = accessor.iter_chunks(rows=10, chunk_size=1)
+        assert build.call_count == 0
+        next(chunks)
+        assert build.call_count == 1
+        chunks.close()
+
+        build.reset_mock()
+        chunks = accessor.iter_chunks(rows=10, chunk_size=1, prefetch_chunks=2)
+        next(chunks)
+        time.sleep(0.2)
+        # one chunk taken, two waiting in the queue and one held by the paused producer
+        assert build.call_count <= 4
+        rest = list(chunks)
+    assert len(rest) == 9
+    assert build.call_count == 10
+
+def test_iter_chunks_raises_producer_errors(mocker):
+    """Tests that an error while prefetching is raised to the consumer."""
+    df = pd.DataFrame({"id": [1]})
+    accessor = df.mocker
+    accessor.create_factory(mocker)
+    with patch.object(accessor, "_build_frame", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError, match="boom"):
+            list(accessor.iter_chunks(rows=2, prefetch_chunks=1))
+
+def test_write_parquet_streams_the_frame_schema(mocker, tmp_path):
+    """Tests that the accessor writes generated rows with the frame's columns without building a frame."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame({"id": [1], "score": [0.5]})
+    path = tmp_path / "rows.parquet"
+    with patch("pymocker.dataframe.pd.DataFrame", wraps=pd.DataFrame) as frame:
+        assert df.mocker.write_parquet(str(path), rows=12, row_group_size=5, mocker=mocker) == 12
+    assert frame.call_count == 0
+    table = pq.read_table(str(path))
+    assert table.column_names == ["id", "score"]
+    assert str(table.schema.field("id").type) == "int64"
+    assert pq.ParquetFile(str(path)).num_row_groups == 3
+
+def test_write_arrow_passes_build_kwargs(mocker, tmp_path):
+    """Tests that the accessor hands its build kwargs to the factory, which validates the rows."""
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"id": [1], "score": [0.5]})
+    path = str(tmp_path / "rows.arrow")
+    assert df.mocker.write_arrow(path, rows=3, mocker=mocker, score=2.5) == 3
+    assert pa.ipc.open_file(path).read_all().column("score").to_pylist() == [2.5] * 3
+    with pytest.raises(ValidationError):
+        df.mocker.write_parquet(str(tmp_path / "rows.parquet"), rows=3, score="not a float")
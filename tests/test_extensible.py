@@ -1,6 +1,15 @@
 
 import pytest
-from pymocker.builder.extensible import generate_by_rejection_sampling, GenerationError
+from pymocker.builder.extensible import (
+    generate_by_rejection_sampling,
+    generate_by_batch_rejection_sampling,
+    generate_column_by_rejection_sampling,
+    CandidateBuffer,
+    GenerationError,
+    FieldStats,
+    ADAPTIVE_WARMUP_CALLS,
+    PROBE_RETRIES,
+)
 
 # A simple generator that returns incrementing integers
 class Counter:
@@ -53,3 +62,110 @@ def test_rejection_sampling_coerce_on_fail_with_none():
         generate_by_rejection_sampling(
             generator, int, {"ge": 5}, max_retries=10, coerce_on_fail=True
         )
+
+def test_stats_record_attempts():
+    """Tests that every call records its attempts and outcome."""
+    stats = FieldStats()
+    generate_by_rejection_sampling(Counter(), int, {"ge": 3}, stats=stats)
+    generate_by_rejection_sampling(lambda: 1, int, {"ge": 5}, max_retries=10, coerce_on_fail=True, stats=stats)
+
+    assert stats.as_dict() == {
+        "calls": 2, "attempts": 13, "accepted": 1, "coerced": 1, "failed": 0, "directed": 0, "timeouts": 0,
+        "acceptance_rate": 1 / 13,
+    }
+
+def test_stats_shrink_budget_of_fields_that_never_pass():
+    """Tests that a field that never passes is only probed once its statistics are trusted."""
+    stats = FieldStats()
+    calls = []
+    def generator():
+        calls.append(1)
+        return 1
+    for _ in range(ADAPTIVE_WARMUP_CALLS + 1):
+        calls.clear()
+        assert generate_by_rejection_sampling(generator, int, {"ge": 5}, max_retries=300, coerce_on_fail=True, stats=stats) == 5
+
+    assert len(calls) == PROBE_RETRIES
+    assert stats.retry_budget(300) == PROBE_RETRIES
+
+def test_stats_budget_follows_acceptance_rate():
+    """Tests that the budget leaves enough retries for a field that passes half of the time."""
+    stats = FieldStats()
+    for _ in range(ADAPTIVE_WARMUP_CALLS * 4):
+        stats.record(2, accepted=True)
+    assert 1 < stats.retry_budget(300) < 20
+
+def test_stats_keep_full_budget_without_coercion():
+    """Tests that the budget is never cut when a failure would raise instead of coerce."""
+    stats = FieldStats()
+    for _ in range(ADAPTIVE_WARMUP_CALLS):
+        stats.record(300, accepted=False, coerced=True)
+    generator = Counter()
+    assert generate_by_rejection_sampling(generator, int, {"ge": 50}, max_retries=300, stats=stats) == 50
+
+def test_batch_sampling_serves_successive_calls_from_one_block():
+    """Tests that accepted values of a block are handed out before drawing again."""
+    generator = Counter()
+    buffer = CandidateBuffer(generator, int, {"ge": 5}, block_size=10)
+    values = [generate_by_batch_rejection_sampling(buffer) for _ in range(6)]
+
+    assert values == [5, 6, 7, 8, 9, 10]
+    assert generator.val == 10
+
+def test_batch_sampling_respects_the_retry_budget():
+    """Tests that at most max_retries candidates are drawn before coercing or raising."""
+    generator = Counter()
+    buffer = CandidateBuffer(generator, int, {"ge": 100}, block_size=4)
+    assert generate_by_batch_rejection_sampling(buffer, max_retries=10, coerce_on_fail=True) == 100
+    assert generator.val == 10
+    with pytest.raises(GenerationError):
+        generate_by_batch_rejection_sampling(buffer, max_retries=10)
+
+def test_batch_sampling_stats_count_candidates():
+    """Tests that statistics count drawn and accepted candidates and each call once."""
+    stats = FieldStats()
+    buffer = CandidateBuffer(Counter(), int, {"multiple_of": 2}, block_size=10)
+    for _ in range(3):
+        generate_by_batch_rejection_sampling(buffer, stats=stats)
+
+    assert (stats.calls, stats.attempts, stats.accepted) == (3, 10, 5)
+    assert len(buffer) == 2
+
+def test_rejection_sampling_stops_at_the_deadline():
+    """Tests that a passed deadline ends sampling after one attempt, coercing or raising."""
+    stats = FieldStats()
+    generator = Counter()
+    assert generate_by_rejection_sampling(generator, int, {"ge": 50}, coerce_on_fail=True, stats=stats, deadline=0) == 50
+    assert generator.val == 1
+    assert (stats.attempts, stats.coerced, stats.timeouts) == (1, 1, 1)
+    with pytest.raises(GenerationError, match="time budget"):
+        generate_by_rejection_sampling(Counter(), int, {"ge": 50}, deadline=0)
+
+def test_batch_sampling_stops_at_the_deadline():
+    """Tests that a passed deadline stops drawing blocks after the first one."""
+    stats = FieldStats()
+    generator = Counter()
+    buffer = CandidateBuffer(generator, int, {"ge": 100}, block_size=4)
+    assert generate_by_batch_rejection_sampling(buffer, max_retries=40, coerce_on_fail=True, stats=stats, deadline=0) == 100
+    assert generator.val == 4
+    assert stats.timeouts == 1
+
+def test_column_sampling_redraws_only_rejected_positions():
+    """Tests that each position keeps its first accepted candidate and the rest are drawn again."""
+    stats = FieldStats()
+    generator = Counter()
+    values = generate_column_by_rejection_sampling(generator, int, {"multiple_of": 3}, 4, stats=stats)
+
+    assert values == [12, 6, 3, 9]
+    assert all(value % 3 == 0 for value in values)
+    assert (stats.calls, stats.accepted) == (4, 4)
+    assert stats.attempts == generator.val
+
+def test_column_sampling_coerces_or_raises_after_max_retries():
+    """Tests that positions without an accepted candidate are coerced, or fail without coerce_on_fail."""
+    stats = FieldStats()
+    values = generate_column_by_rejection_sampling(lambda: 1, int, {"ge": 5}, 3, max_retries=4, coerce_on_fail=True, stats=stats)
+    assert values == [5, 5, 5]
+    assert (stats.attempts, stats.coerced) == (12, 3)
+    with pytest.raises(GenerationError, match="3 of 3"):
+        generate_column_by_rejection_sampling(lambda: 1, int, {"ge": 5}, 3, max_retries=4)
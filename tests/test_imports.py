@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "pydantic", "polyfactory", "faker", "numpy", "torch", "sentence_transformers"]
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+def test_import_pymocker_defers_heavy_dependencies():
+    """Tests that importing pymocker loads none of its heavy dependencies."""
+    loaded = run(
+        "import sys, pymocker, pymocker.mocker\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == ""
+
+def test_import_pymocker_defers_word_corpus():
+    """Tests that the word segmentation corpus is loaded on first use, not at import."""
+    loaded = run(
+        "import pymocker\n"
+        "from pymocker.builder import utils\n"
+        "before = utils._segmenter is not None\n"
+        "utils.segment_and_join_word('firstname')\n"
+        "print(before, utils._segmenter is not None)"
+    )
+    assert loaded == "False True"
+
+def test_dataframe_accessor_registered_when_pandas_imported():
+    """Tests that the mocker accessor is available once pandas is imported, in either order."""
+    after = run("import pymocker, pandas as pd\nprint(hasattr(pd.DataFrame, 'mocker'))")
+    before = run("import pandas as pd, pymocker\nprint(hasattr(pd.DataFrame, 'mocker'))")
+    assert after == "True"
+    assert before == "True"
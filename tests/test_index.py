@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from pymocker.builder.index import clear_method_indexes, get_method_index
+from pymocker.builder.utils import get_public_method_names
+
+# 1. A tiny deterministic stand-in for the sentence transformer
+
+class FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, sentences, normalize_embeddings=False, convert_to_numpy=True):
+        single = isinstance(sentences, str)
+        batch = [sentences] if single else list(sentences)
+        self.encoded.extend(batch)
+        vectors = np.zeros((len(batch), 26), dtype=np.float32)
+        for row, sentence in enumerate(batch):
+            for char in sentence.lower():
+                if 'a' <= char <= 'z':
+                    vectors[row, ord(char) - ord('a')] += 1
+        if normalize_embeddings:
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors[0] if single else vectors
+
+class FakeManager:
+    model_name = "fake-model"
+    def __init__(self):
+        self.model = FakeModel()
+    def get(self):
+        return self.model
+
+class Provider:
+    attribute = "not callable"
+    def city(self): return "Paris"
+    def country(self): return "France"
+    def color(self): return "red"
+    def _private(self): return None
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYMOCKER_CACHE_DIR", str(tmp_path))
+    clear_method_indexes()
+    yield tmp_path
+    clear_method_indexes()
+
+# 2. Tests for the method index
+
+def test_public_method_names_only_lists_callables():
+    """Tests that private attributes and non-callables are excluded."""
+    assert get_public_method_names(Provider()) == ["city", "color", "country"]
+
+def test_index_is_built_once_per_provider_class():
+    """Tests that method names are only encoded the first time an index is requested."""
+    manager = FakeManager()
+    first = get_method_index(Provider(), manager)
+    second = get_method_index(Provider(), manager)
+
+    assert first is second
+    assert manager.model.encoded == ["city", "color", "country"]
+    assert first.embeddings.shape == (3, 26)
+
+def test_index_is_persisted_and_reused(cache_dir):
+    """Tests that a fresh process (simulated by clearing memory) loads embeddings from disk."""
+    get_method_index(Provider(), FakeManager())
+    assert list((cache_dir / "embeddings").glob("*.npy"))
+
+    clear_method_indexes()
+    manager = FakeManager()
+    index = get_method_index(Provider(), manager)
+
+    assert manager.model.encoded == []
+    assert isinstance(index.embeddings, np.memmap)
+
+def test_index_rank_orders_by_similarity():
+    """Tests that rank() returns (name, [score]) pairs with the best match first."""
+    index = get_method_index(Provider(), FakeManager())
+    ranked = index.rank("city")
+
+    assert ranked[0][0] == "city"
+    assert ranked[0][1][0] == pytest.approx(1.0, abs=1e-5)
+    assert [name for name, _ in ranked[1:]] != []
+
+def test_index_rank_on_subset():
+    """Tests that ranking can be restricted to a subset of the indexed names."""
+    index = get_method_index(Provider(), FakeManager())
+    ranked = index.rank("city", ["color", "country"])
+
+    assert {name for name, _ in ranked} == {"color", "country"}
+    assert index.rank("city", []) == []
+
+def test_index_best_matches_encodes_targets_in_one_batch():
+    """Tests that many targets are scored with a single encoder call."""
+    manager = FakeManager()
+    index = get_method_index(Provider(), manager)
+    calls = []
+    original = manager.model.encode
+    manager.model.encode = lambda sentences, **kw: calls.append(sentences) or original(sentences, **kw)
+
+    best = index.best_matches(["city", "country", "colour"])
+
+    assert calls == [["city", "country", "colour"]]
+    assert [name for name, _ in best] == ["city", "country", "color"]
+    assert best[0][1] == pytest.approx(1.0, abs=1e-5)
+
+def test_index_best_matches_on_subset():
+    """Tests that batch matching can be restricted to a subset of names."""
+    index = get_method_index(Provider(), FakeManager())
+    assert [name for name, _ in index.best_matches(["city"], ["color", "country"])] == ["country"]
+    assert index.best_matches(["city"], []) == [None]
+    assert index.best_matches([]) == []
@@ -1,10 +1,16 @@
+import time
+from enum import Enum
+from typing import Optional
 
 import pytest
 from unittest.mock import MagicMock, patch
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.exceptions import MissingBuildKwargException
 from polyfactory.field_meta import FieldMeta
+from polyfactory.fields import Ignore, PostGenerated, Require
 
+from pymocker.builder.analysis import ConstraintError
 from pymocker.builder.mixins import PolyfactoryLogicMixin
 
 # 1. Setup a mock model and factory
@@ -17,6 +23,9 @@ class MyFactory(PolyfactoryLogicMixin, ModelFactory[MyModel]):
     __max_retries__ = 300
     __coerce_on_fail__ = True
 
+class Color(Enum):
+    RED = "red"
+
 # 2. Tests for PolyfactoryLogicMixin
 
 def test_handle_factory_field_callable_with_constraints():
@@ -25,7 +34,8 @@ def test_handle_factory_field_callable_with_constraints():
     by generate_by_rejection_sampling.
     """
     # Mock the rejection sampling function to see if it's called
-    with patch("pymocker.builder.mixins.generate_by_rejection_sampling") as mock_generate:
+    with patch("pymocker.builder.mixins.generate_by_rejection_sampling") as mock_generate, \
+            patch.object(MyFactory, "__directed_generation__", False):
         mock_generate.return_value = 123  # The value it should return
 
         factory = MyFactory
@@ -47,7 +57,10 @@ def test_handle_factory_field_callable_with_constraints():
             int,
             {"ge": 100},
             max_retries=factory.__max_retries__,
-            coerce_on_fail=factory.__coerce_on_fail__
+            coerce_on_fail=factory.__coerce_on_fail__,
+            stats=None,
+            deadline=None,
+            random=factory.__random__
         )
         # Assert that the result is what our mock returned
         assert result == 123
@@ -81,6 +94,7 @@ def reset_factory():
         del MyFactory.x
     if hasattr(MyFactory, 'y'):
         del MyFactory.y
+    MyFactory.reset_build_plan()
 
 def test_process_kwargs_uses_factory_attributes():
     """
@@ -109,3 +123,295 @@ def test_process_kwargs_uses_factory_attributes():
         assert called_with_field_name == 'y'
         assert result['y'] == 'mocked_y'
 
+
+def test_build_plan_is_compiled_once():
+    """Tests that the model fields are only inspected when the plan is compiled."""
+    MyFactory.x = lambda: 1
+    MyFactory.y = lambda: "a"
+    with patch.object(MyFactory, "get_model_fields", wraps=MyFactory.get_model_fields) as get_fields:
+        results = [MyFactory.process_kwargs() for _ in range(5)]
+
+    assert get_fields.call_count == 1
+    assert results == [{"x": 1, "y": "a"}] * 5
+
+def test_reset_build_plan_picks_up_new_factory_fields():
+    """Tests that fields set after the first build are used once the plan is reset."""
+    MyFactory.x = lambda: 1
+    MyFactory.y = lambda: "a"
+    MyFactory.process_kwargs()
+
+    MyFactory.x = lambda: 2
+    assert MyFactory.process_kwargs()["x"] == 1
+    MyFactory.reset_build_plan()
+    assert MyFactory.process_kwargs()["x"] == 2
+
+def test_build_plan_binds_constraints():
+    """Tests that constrained callables without a strategy go through rejection sampling with the factory settings."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"ge": 100})
+    MyFactory.x = lambda: 100
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False), \
+            patch("pymocker.builder.mixins.generate_by_rejection_sampling", return_value=150) as mock_generate:
+        assert MyFactory.process_kwargs() == {"x": 150}
+        assert MyFactory.process_kwargs() == {"x": 150}
+
+    assert mock_generate.call_count == 2
+    mock_generate.assert_called_with(
+        MyFactory.x, int, {"ge": 100},
+        max_retries=MyFactory.__max_retries__,
+        coerce_on_fail=MyFactory.__coerce_on_fail__,
+        stats=MyFactory.get_field_stats()["x"],
+        deadline=None,
+        random=MyFactory.__random__
+    )
+
+def test_build_plan_keeps_field_semantics():
+    """Tests kwargs overrides and Ignore, Require and PostGenerated fields."""
+    MyFactory.x = lambda: 1
+    MyFactory.y = PostGenerated(lambda name, values: f"{name}={values['x']}")
+    assert MyFactory.process_kwargs() == {"x": 1, "y": "y=1"}
+    assert MyFactory.process_kwargs(x=5) == {"x": 5, "y": "y=5"}
+
+    MyFactory.y = Ignore()
+    MyFactory.reset_build_plan()
+    assert MyFactory.process_kwargs() == {"x": 1}
+
+    MyFactory.y = Require()
+    MyFactory.reset_build_plan()
+    with pytest.raises(MissingBuildKwargException):
+        MyFactory.process_kwargs()
+    assert MyFactory.process_kwargs(y="given") == {"x": 1, "y": "given"}
+
+def test_directed_generation_skips_rejection_sampling():
+    """Tests that a constrained numeric field is sampled inside its range instead of retried."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"ge": 100, "le": 110})
+    MyFactory.x = lambda: 5
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch("pymocker.builder.mixins.generate_by_rejection_sampling") as mock_generate:
+        values = [MyFactory.process_kwargs()["x"] for _ in range(20)]
+
+    mock_generate.assert_not_called()
+    assert all(100 <= value <= 110 for value in values)
+
+def test_field_stats_track_acceptance():
+    """Tests that each constrained factory field reports how often its values pass."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"multiple_of": 2})
+    values = iter([1, 2, 3, 3, 4])
+    MyFactory.x = lambda: next(values)
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False):
+        assert [MyFactory.process_kwargs()["x"] for _ in range(2)] == [2, 4]
+        stats = MyFactory.get_field_stats()
+
+    assert list(stats) == ["x"]
+    assert (stats["x"].calls, stats["x"].attempts, stats["x"].accepted) == (2, 5, 2)
+    assert stats["x"].acceptance_rate == pytest.approx(0.4)
+
+def test_sampling_block_size_uses_a_field_buffer():
+    """Tests that with a block size, candidates are drawn in blocks and buffered across builds."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"multiple_of": 3})
+    calls = []
+    def generator():
+        calls.append(1)
+        return len(calls)
+    MyFactory.x = generator
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False), \
+            patch.object(MyFactory, "__sampling_block_size__", 30):
+        values = [MyFactory.process_kwargs()["x"] for _ in range(10)]
+
+    assert values == list(range(3, 31, 3))
+    assert len(calls) == 30
+
+def test_build_plan_rejects_impossible_constraints():
+    """Tests that impossible constraints fail when the plan is compiled, naming the field."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"gt": 5, "lt": 6})
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]):
+        with pytest.raises(ConstraintError, match="MyFactory.x"):
+            MyFactory.get_build_plan()
+
+def test_build_plan_uses_feasible_range():
+    """Tests that rejection sampling receives the analysed range of the field."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"gt": 0, "lt": 10, "multiple_of": 4})
+    MyFactory.x = lambda: 1
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False), \
+            patch("pymocker.builder.mixins.generate_by_rejection_sampling", return_value=4) as mock_generate:
+        MyFactory.process_kwargs()
+
+    assert mock_generate.call_args[0][2] == {"ge": 4, "le": 8, "multiple_of": 4}
+
+def test_field_time_budget_stops_rejection_sampling():
+    """Tests that a field out of time is coerced before max_retries and counted as a timeout."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"ge": 100})
+    calls = []
+    MyFactory.x = lambda: calls.append(1) or 1
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False), \
+            patch.object(MyFactory, "__field_time_budget__", 0):
+        assert MyFactory.process_kwargs() == {"x": 100}
+        stats = MyFactory.get_field_stats()["x"]
+
+    assert len(calls) == 1
+    assert (stats.calls, stats.coerced, stats.timeouts) == (1, 1, 1)
+
+def test_build_time_budget_is_shared_with_nested_factories():
+    """Tests that nested builds inherit the deadline of the outer build and overruns are counted."""
+    class Outer(BaseModel):
+        inner: MyModel
+
+    class OuterFactory(PolyfactoryLogicMixin, ModelFactory[Outer]):
+        __model__ = Outer
+        __build_time_budget__ = 0
+        inner = MyFactory
+
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"ge": 100})
+    calls = []
+    MyFactory.x = lambda: calls.append(1) or 1
+    MyFactory.y = lambda: "a"
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta, FieldMeta(name="y", annotation=str)]), \
+            patch.object(MyFactory, "__directed_generation__", False):
+        inner = OuterFactory.process_kwargs()["inner"]
+        assert MyFactory.get_field_stats()["x"].timeouts == 1
+
+    # past the deadline, the providers are not called and polyfactory fills the fields
+    assert calls == []
+    assert inner.x >= 100 and isinstance(inner.y, str)
+    assert OuterFactory.get_build_stats().as_dict() == {"builds": 1, "timeouts": 1}
+    assert MyFactory.get_build_stats().builds == 0
+
+def test_build_time_budget_bounds_unconstrained_fields():
+    """Tests that a provider reached after the build deadline is skipped for polyfactory's value, in rows and columns."""
+    slow, fast = [], []
+    MyFactory.x = lambda: slow.append(1) or time.sleep(0.05) or 1
+    MyFactory.y = lambda: fast.append(1) or "a"
+    with patch.object(MyFactory, "__build_time_budget__", 0.01):
+        MyFactory.reset_build_plan()
+        row = MyFactory.process_kwargs()
+        assert row["x"] == 1 and isinstance(row["y"], str)
+        assert (len(slow), len(fast)) == (1, 0)
+        assert MyFactory.get_field_stats()["y"].timeouts == 1
+        assert MyFactory.get_build_stats().timeouts == 1
+
+    with patch.object(MyFactory, "__build_time_budget__", 0):
+        MyFactory.reset_build_plan()
+        columns = MyFactory.process_batch(3)
+        assert len(columns["x"]) == len(columns["y"]) == 3
+        assert (len(slow), len(fast)) == (1, 0)
+        assert MyFactory.get_field_stats()["x"].timeouts == 3
+
+def test_build_batch_matches_the_row_path():
+    """Tests that build_batch fills every field column by column, honouring kwargs and field kinds."""
+    values = iter(range(100))
+    MyFactory.x = lambda: next(values)
+    MyFactory.y = PostGenerated(lambda name, row: f"{name}={row['x']}")
+    batch = MyFactory.build_batch(3)
+    assert batch == [MyModel(x=0, y="y=0"), MyModel(x=1, y="y=1"), MyModel(x=2, y="y=2")]
+    assert MyFactory.build_batch(2, x=7) == [MyModel(x=7, y="y=7")] * 2
+
+    MyFactory.y = Require()
+    MyFactory.reset_build_plan()
+    with pytest.raises(MissingBuildKwargException):
+        MyFactory.build_batch(2)
+    assert MyFactory.process_batch(2, y="given") == {"x": [5, 6], "y": ["given", "given"]}
+
+def test_process_batch_samples_constrained_columns_in_bulk():
+    """Tests that only the rejected positions of a constrained column are drawn again."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"multiple_of": 2})
+    values = iter([1, 2, 3, 4, 5, 6, 8, 9, 10])
+    MyFactory.x = lambda: next(values)
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch.object(MyFactory, "__directed_generation__", False):
+        assert MyFactory.process_batch(4) == {"x": [8, 2, 6, 4]}
+        stats = MyFactory.get_field_stats()["x"]
+
+    assert (stats.calls, stats.attempts, stats.accepted) == (4, 7, 4)
+
+def test_process_batch_uses_directed_generation():
+    """Tests that constrained columns are generated by their strategy when one exists."""
+    field_meta = FieldMeta(name="x", annotation=int, constraints={"ge": 100, "le": 110})
+    MyFactory.x = lambda: 5
+    with patch.object(MyFactory, "get_model_fields", return_value=[field_meta]), \
+            patch("pymocker.builder.mixins.generate_column_by_rejection_sampling") as mock_generate:
+        column = MyFactory.process_batch(50)["x"]
+
+    mock_generate.assert_not_called()
+    assert len(column) == 50 and all(100 <= value <= 110 for value in column)
+    assert MyFactory.get_field_stats()["x"].directed == 50
+
+def test_columnar_batch_selects_build_batch():
+    """Tests that batch() goes through build_batch only when __columnar_batch__ is set."""
+    MyFactory.x = lambda: 1
+    MyFactory.y = lambda: "a"
+    with patch.object(MyFactory, "build_batch", wraps=MyFactory.build_batch) as build_batch:
+        assert MyFactory.batch(2) == [MyModel(x=1, y="a")] * 2
+        build_batch.assert_not_called()
+        with patch.object(MyFactory, "__columnar_batch__", True):
+            assert MyFactory.batch(2) == [MyModel(x=1, y="a")] * 2
+        build_batch.assert_called_once_with(2)
+
+def test_construct_mode_skips_validation():
+    """Tests that construct mode creates instances without validating them, for builds and batches."""
+    MyFactory.x = lambda: "not an int"
+    MyFactory.y = lambda: "a"
+    with pytest.raises(ValidationError):
+        MyFactory.build()
+    with patch.object(MyFactory, "__output_mode__", "construct"):
+        instance = MyFactory.build()
+        batch = MyFactory.build_batch(2)
+
+    assert isinstance(instance, MyModel) and instance.x == "not an int"
+    assert [item.x for item in batch] == ["not an int"] * 2
+
+def test_raw_mode_returns_dicts():
+    """Tests that raw mode never creates model instances."""
+    MyFactory.x = lambda: 1
+    MyFactory.y = lambda: "a"
+    with patch.object(MyFactory, "__output_mode__", "raw"), \
+            patch.object(MyFactory.__model__, "__init__") as model_init:
+        assert MyFactory.build() == {"x": 1, "y": "a"}
+        assert MyFactory.build_batch(2, y="b") == [{"y": "b", "x": 1}] * 2
+
+    model_init.assert_not_called()
+
+def test_validation_sample_rate_validates_rows():
+    """Tests that the debug switch validates a share of the rows built without validation."""
+    MyFactory.x = lambda: "not an int"
+    MyFactory.y = lambda: "a"
+    with patch.object(MyFactory, "__output_mode__", "raw"), \
+            patch.object(MyFactory, "__validation_sample_rate__", 1.0):
+        with pytest.raises(ValidationError):
+            MyFactory.build()
+        with pytest.raises(ValidationError):
+            MyFactory.build_batch(2)
+
+def test_unknown_output_mode_is_rejected():
+    """Tests that an unknown output mode fails when the plan is compiled."""
+    with patch.object(MyFactory, "__output_mode__", "fast"):
+        with pytest.raises(ValueError, match="output mode"):
+            MyFactory.get_build_plan()
+
+def test_process_batch_builds_the_provider_map_once():
+    """Tests that fields generated by polyfactory share one provider map per batch."""
+    with patch.object(ModelFactory, "get_provider_map", wraps=ModelFactory.get_provider_map) as get_provider_map:
+        MyFactory.process_batch(10)
+        assert get_provider_map.call_count == 1
+        MyFactory.process_kwargs()
+        assert get_provider_map.call_count == 3
+
+def test_plain_fields_left_to_polyfactory_are_drawn_by_column():
+    """Tests that unset fields of a plain type get a column form, and others keep polyfactory's per value path."""
+    class Overriding(MyFactory):
+        @classmethod
+        def get_field_value(cls, field_meta, field_build_parameters=None, build_context=None):
+            return super().get_field_value(field_meta, field_build_parameters, build_context)
+
+    assert MyFactory._compile_default_column(FieldMeta(name="x", annotation=int)) is not None
+    assert MyFactory._compile_default_column(FieldMeta(name="x", annotation=Optional[int])) is None
+    assert MyFactory._compile_default_column(FieldMeta(name="x", annotation=Color)) is None
+    assert MyFactory._compile_default_column(FieldMeta(name="x", annotation=int, constraints={"ge": 1})) is None
+    assert Overriding._compile_default_column(FieldMeta(name="x", annotation=int)) is None
+
+    columns = MyFactory.process_batch(20)
+    assert all(type(value) is int for value in columns["x"])
+    assert all(type(value) is str for value in columns["y"])
@@ -1,5 +1,5 @@
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from dataclasses import dataclass, field
 from typing import TypedDict, List
 
@@ -7,7 +7,9 @@ from pymocker.mocker import Mocker
 from polyfactory.factories.pydantic_factory import ModelFactory
 from polyfactory.factories.dataclass_factory import DataclassFactory
 from polyfactory.factories.typed_dict_factory import TypedDictFactory
+from pymocker.builder.analysis import ConstraintError
 from pymocker.builder.mixins import PolyfactoryLogicMixin
+from pymocker.builder.rank import LexicalRanker
 
 # 1. Define dummy models for testing
 
@@ -130,10 +132,14 @@ def test_method_finder_returns_none_for_no_match():
     """
     Tests that lookup_method_from_instances returns None when no suitable method is found.
     """
-    mocker.Config.confidence_threshold = 0.99 # Set a high threshold
-    method = mocker.lookup_method_from_instances("a_very_unlikely_field_name_to_exist", str)
+    class StrictMocker(Mocker):
+        class Config(Mocker.Config):
+            confidence_threshold = 0.99 # Set a high threshold
+    method = StrictMocker().lookup_method_from_instances(
+        "a_very_unlikely_field_name_to_exist", str, StrictMocker.Config.confidence_threshold
+    )
     assert method is None
-    mocker.Config.confidence_threshold = 0.75 # Reset threshold
+    assert Mocker.Config.confidence_threshold is None
 
 def test_add_methods_to_cls_decorator():
     """
@@ -151,4 +157,131 @@ def test_add_methods_to_cls_decorator():
 
     # 'first_name' should be found via segmentation
     assert hasattr(factory, "first_name")
-    assert callable(factory.first_name)
\ No newline at end of file
+    assert callable(factory.first_name)
+
+# 4. Tests for batch field resolution
+
+class BatchProvider:
+    def first_name(self) -> str: return "Ada"
+    def phone_number(self) -> str: return "555-0100"
+    def street_name(self) -> str: return "Main Street"
+    def age(self) -> int: return 36
+
+class CountingRanker(LexicalRanker):
+    name = "counting"
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+    def best_matches(self, provider, targets, names=None):
+        self.batches.append(list(targets))
+        return super().best_matches(provider, targets, names)
+
+def make_batch_mocker(ranker):
+    class BatchMocker(Mocker):
+        class Config(Mocker.Config):
+            provider_instances = [BatchProvider()]
+            cache_resolutions = False
+            confidence_threshold = 0.5
+    BatchMocker.Config.ranker = ranker
+    return BatchMocker()
+
+def test_resolve_fields_ranks_unmatched_fields_in_one_batch():
+    """Tests that fields left after the exact and snake case rules are ranked together."""
+    ranker = CountingRanker()
+    batch_mocker = make_batch_mocker(ranker)
+
+    methods = batch_mocker.resolve_fields(
+        [("first_name", str), ("mobile_phone_number", str), ("home_street", str), ("age", int)],
+        confidence_threshold=0.5,
+    )
+
+    assert [m() for m in methods] == ["Ada", "555-0100", "Main Street", 36]
+    assert ranker.batches == [["mobile_phone_number", "home_street"]]
+
+def test_resolve_fields_matches_single_lookup():
+    """Tests that batch resolution gives the same answer as one lookup per field."""
+    batch_mocker = make_batch_mocker(LexicalRanker())
+    fields = [("FirstName", str), ("cell_phone_number", str), ("unrelated", str), ("age", str)]
+
+    batch = batch_mocker.resolve_fields(fields, confidence_threshold=0.5)
+    single = [batch_mocker.lookup_method_from_instances(name, f_type, confidence_threshold=0.5) for name, f_type in fields]
+
+    assert [getattr(m, "__name__", None) for m in batch] == [getattr(m, "__name__", None) for m in single]
+
+def test_mock_all_resolves_many_factories_in_one_batch():
+    """Tests that mock_all decorates every factory with one ranking pass."""
+    class Customer(BaseModel):
+        customer_phone_number: str
+    class Supplier(BaseModel):
+        supplier_phone_number: str
+
+    class CustomerFactory(ModelFactory[Customer]):...
+    class SupplierFactory(ModelFactory[Supplier]):...
+
+    ranker = CountingRanker()
+    customer_factory, supplier_factory = make_batch_mocker(ranker).mock_all([CustomerFactory, SupplierFactory])
+
+    assert issubclass(customer_factory, PolyfactoryLogicMixin)
+    assert customer_factory.build().customer_phone_number == "555-0100"
+    assert supplier_factory.build().supplier_phone_number == "555-0100"
+    assert ranker.batches == [["customer_phone_number", "supplier_phone_number"]]
+
+def test_mock_rejects_impossible_constraints_at_decoration():
+    """Tests that an impossible constraint set fails when the factory is decorated, not at build time."""
+    class Person(BaseModel):
+        age: int = Field(ge=18, le=10)
+
+    class PersonFactory(ModelFactory[Person]):
+        __model__ = Person
+
+    with pytest.raises(ConstraintError, match="age"):
+        make_batch_mocker(LexicalRanker()).mock()(PersonFactory)
+
+def test_mock_accepts_unanchored_patterns_shorter_than_min_length():
+    """Tests that a pattern found inside a longer string is a valid schema, and its values validate."""
+    class Code(BaseModel):
+        code: str = Field(pattern=r"\d{3}", min_length=10)
+
+    class CodeFactory(ModelFactory[Code]):
+        __model__ = Code
+
+    factory = make_batch_mocker(LexicalRanker()).mock()(CodeFactory)
+    for code in factory.batch(20):
+        assert len(code.code) >= 10
+
+def test_mock_sees_providers_added_after_a_resolution():
+    """Tests that a provider added to a Faker instance after fields were resolved is used by later factories."""
+    from faker import Faker
+    from faker.providers import BaseProvider
+
+    class SuperHeroProvider(BaseProvider):
+        def super_hero_name(self) -> str: return "MockerMan"
+
+    class Hero(BaseModel):
+        super_hero_name: str
+
+    fake = Faker()
+    class HeroMocker(Mocker):
+        class Config(Mocker.Config):
+            provider_instances = [fake]
+            ranker = 'lexical'
+    hero_mocker = HeroMocker()
+
+    class HeroFactory(ModelFactory[Hero]):...
+    hero_mocker.mock()(HeroFactory)
+    fake.add_provider(SuperHeroProvider)
+    class LaterHeroFactory(ModelFactory[Hero]):...
+    assert hero_mocker.mock()(LaterHeroFactory).build().super_hero_name == "MockerMan"
+
+def test_length_limited_emails_stay_valid(monkeypatch):
+    """Tests that emails generated under max_length are drawn again or rejected, never cut short."""
+    import re
+    monkeypatch.setattr(Mocker.Config, 'ranker', 'lexical')
+
+    class Contact(BaseModel):
+        email: str = Field(max_length=20)
+
+    @Mocker().mock()
+    class ContactFactory(ModelFactory[Contact]):...
+    for contact in ContactFactory.batch(300):
+        assert re.fullmatch(r"[^@\s]+@[^@\s]+\.[a-z]{2,}", contact.email), contact.email
@@ -0,0 +1,50 @@
+import re
+from random import Random
+
+import pytest
+
+from pymocker.builder.patterns import PatternGenerator, UnsupportedPattern, get_pattern_generator
+
+random = Random(0)
+
+# 1. Generated strings match their pattern
+
+@pytest.mark.parametrize("pattern", [
+    r"^[A-Z]{3}-\d{4,6}$",
+    r"(ab|cd)+x?",
+    r"[^a-z]\w*\s",
+    r"id_(\d)\1",
+    r"^\S+@\S+\.com$",
+    r"[\d_-]{2}",
+    r".{2,}?",
+    r"(?:AB)?[0-9a-f]{8}",
+    r"",
+])
+def test_generated_strings_match(pattern):
+    generator = get_pattern_generator(pattern)
+    for _ in range(20):
+        assert re.fullmatch(pattern, generator.generate(random))
+
+def test_generated_strings_respect_length_limits():
+    generator = get_pattern_generator(r"^INV-\d+$")
+    for _ in range(20):
+        value = generator.generate(random, min_length=12, max_length=14)
+        assert re.fullmatch(r"INV-\d+", value) and 12 <= len(value) <= 14
+
+def test_length_bounds_of_a_pattern():
+    generator = PatternGenerator(r"[A-Z]{2}\d{3,5}(-x)?")
+    assert (generator.min_length, generator.max_length) == (5, 9)
+
+def test_impossible_length_raises():
+    with pytest.raises(ValueError):
+        get_pattern_generator(r"\d{3}").generate(random, max_length=2)
+
+# 2. Caching and unsupported patterns
+
+def test_generators_are_cached_per_pattern():
+    assert get_pattern_generator(r"\d+") is get_pattern_generator(r"\d+")
+
+@pytest.mark.parametrize("pattern", [r"a(?=b)", r"(?<!a)b", r"(a)?(?(1)b|c)"])
+def test_unsupported_patterns(pattern):
+    with pytest.raises(UnsupportedPattern):
+        PatternGenerator(pattern)
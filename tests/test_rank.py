@@ -1,6 +1,7 @@
 
 import pytest
-from pymocker.builder.rank import rank
+from concurrent.futures import ThreadPoolExecutor
+from pymocker.builder.rank import rank, ModelManager, LexicalRanker, Ranker, TwoStageRanker, get_ranker
 
 # Test cases for the rank function
 
@@ -63,3 +64,175 @@ def test_rank_with_single_option():
     assert ranked_results[0][0] == "developer"
     # The score should be reasonably high due to semantic similarity
     assert ranked_results[0][1][0] > 0.6
+
+# Test cases for the shared model manager
+
+class FakeModel:
+    instances = 0
+    def __init__(self, name):
+        FakeModel.instances += 1
+        self.name = name
+
+def fake_load(self):
+    return FakeModel(self.model_name)
+
+def test_model_manager_loads_once(monkeypatch):
+    """Tests that the model is created on first use and then reused."""
+    monkeypatch.setattr(ModelManager, "_load", fake_load)
+    FakeModel.instances = 0
+    manager = ModelManager("fake-model")
+
+    assert not manager.loaded
+    first = manager.get()
+    second = manager.get()
+
+    assert first is second
+    assert first.name == "fake-model"
+    assert FakeModel.instances == 1
+
+def test_model_manager_warm_and_release(monkeypatch):
+    """Tests that warm() pre-loads the model and release() drops it."""
+    monkeypatch.setattr(ModelManager, "_load", fake_load)
+    FakeModel.instances = 0
+    manager = ModelManager("fake-model")
+
+    manager.warm()
+    assert manager.loaded
+    manager.release()
+    assert not manager.loaded
+
+    manager.get()
+    assert FakeModel.instances == 2
+
+def test_model_manager_is_thread_safe(monkeypatch):
+    """Tests that concurrent first calls only load the model once."""
+    monkeypatch.setattr(ModelManager, "_load", fake_load)
+    FakeModel.instances = 0
+    manager = ModelManager("fake-model")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        models = list(pool.map(lambda _: manager.get(), range(32)))
+
+    assert FakeModel.instances == 1
+    assert all(m is models[0] for m in models)
+
+# Test cases for the pluggable rankers
+
+class NameProvider:
+    def first_name(self): return "Ada"
+    def last_name(self): return "Lovelace"
+    def phone_number(self): return "555-0100"
+    def company(self): return "Analytical Engines"
+
+def test_get_ranker_resolves_names_and_instances():
+    """Tests that rankers can be selected by name, class or instance."""
+    assert isinstance(get_ranker("lexical"), LexicalRanker)
+    assert get_ranker("lexical") is get_ranker(LexicalRanker)
+    custom = LexicalRanker()
+    assert get_ranker(custom) is custom
+    with pytest.raises(ValueError):
+        get_ranker("does-not-exist")
+
+def test_get_ranker_auto_falls_back_to_lexical(monkeypatch):
+    """Tests that 'auto' uses the lexical ranker when sentence-transformers is missing."""
+    monkeypatch.setattr("pymocker.builder.rank.embedding_backend_available", lambda: False)
+    assert isinstance(get_ranker("auto"), LexicalRanker)
+
+def test_lexical_ranker_orders_by_similarity():
+    """Tests that the lexical ranker puts the closest method name first."""
+    ranked = get_ranker("lexical").rank(NameProvider(), "cell_phone_number")
+    assert ranked[0][0] == "phone_number"
+    assert ranked[0][1][0] > 0.5
+    assert len(ranked) == 4
+
+def test_lexical_ranker_perfect_match_and_subset():
+    """Tests that an exact name scores 1.0 and that ranking respects a subset."""
+    ranker = get_ranker("lexical")
+    ranked = ranker.rank(NameProvider(), "first_name")
+    assert ranked[0] == ("first_name", [pytest.approx(1.0)])
+    assert [name for name, _ in ranker.rank(NameProvider(), "first_name", ["company"])] == ["company"]
+    assert ranker.rank(NameProvider(), "first_name", []) == []
+
+def test_mocker_with_lexical_ranker():
+    """Tests that a Mocker configured with the lexical ranker matches fields without a model."""
+    from pydantic import BaseModel
+    from polyfactory.factories.pydantic_factory import ModelFactory
+    from pymocker.mocker import Mocker
+
+    class Contact(BaseModel):
+        given_first_name: str
+        mobile_phone_number: str
+
+    class LexicalMocker(Mocker):
+        class Config(Mocker.Config):
+            ranker = "lexical"
+            provider_instances = [NameProvider()]
+
+    @LexicalMocker().mock()
+    class ContactFactory(ModelFactory[Contact]):...
+
+    contact = ContactFactory.build()
+    assert contact.given_first_name == "Ada"
+    assert contact.mobile_phone_number == "555-0100"
+
+class RecordingRanker(Ranker):
+    name = "recording"
+    def __init__(self):
+        self.seen = []
+    def rank(self, provider, target, names=None):
+        self.seen.append(None if names is None else list(names))
+        return [(name, [1.0]) for name in (names or [])]
+
+class WideProvider:
+    pass
+
+for i in range(200):
+    setattr(WideProvider, f"unrelated_method_{i}", lambda self: None)
+WideProvider.phone_number = lambda self: "555-0100"
+WideProvider.phone_extension = lambda self: "42"
+
+def test_lexical_top_k_only_visits_overlapping_names():
+    """Tests that the prefilter returns at most k candidates, closest first."""
+    index = get_ranker("lexical").index(WideProvider())
+    assert index.top_k("mobile_phone_number", 2) == ["phone_number", "phone_extension"]
+    assert index.top_k("mobile_phone_number", 5, ["phone_extension"]) == ["phone_extension"]
+
+def test_two_stage_ranker_reranks_shortlist_only():
+    """Tests that only the lexical shortlist reaches the reranker."""
+    reranker = RecordingRanker()
+    ranker = TwoStageRanker(candidates=3, reranker=reranker)
+    ranked = ranker.rank(WideProvider(), "mobile_phone_number")
+
+    # none of the 200 unrelated methods share a trigram with the field
+    assert reranker.seen[0] == ["phone_number", "phone_extension"]
+    assert ranked[0][0] == "phone_number"
+
+def test_two_stage_ranker_falls_back_without_lexical_overlap():
+    """Tests that a field with no lexical overlap is reranked against every allowed name."""
+    reranker = RecordingRanker()
+    ranker = TwoStageRanker(candidates=3, reranker=reranker)
+    ranker.rank(NameProvider(), "zzz", ["company", "last_name"])
+    assert reranker.seen == [["company", "last_name"]]
+    assert ranker.rank(NameProvider(), "zzz", []) == []
+
+class FixedScoreRanker(Ranker):
+    name = "fixed"
+    default_threshold = 0.6
+    def rank(self, provider, target, names=None):
+        return [(name, [0.55]) for name in (names or [])]
+
+def test_confidence_threshold_defaults_to_the_rankers_own():
+    """Tests that each ranker brings the default threshold of its score scale."""
+    from pymocker.mocker import Mocker
+    assert get_ranker("lexical").default_threshold == 0.6
+    assert TwoStageRanker(reranker=RecordingRanker()).default_threshold == RecordingRanker.default_threshold == 0.5
+
+    class FixedMocker(Mocker):
+        class Config(Mocker.Config):
+            ranker = FixedScoreRanker()
+            provider_instances = [NameProvider()]
+            confidence_threshold = None
+
+    mocker = FixedMocker()
+    assert mocker.resolve_fields([("mobile", str)], FixedMocker.Config.confidence_threshold) == [None]
+    assert mocker.resolve_fields([("mobile", str)], confidence_threshold=0.5)[0] is not None
@@ -0,0 +1,81 @@
+from datetime import date
+
+from pymocker.builder.registry import (
+    ProviderRegistry,
+    clear_provider_registries,
+    get_provider_registry,
+    normalize_name,
+)
+
+# 1. A provider with mixed naming styles
+
+class MixedProvider:
+    label = "not callable"
+    def first_name(self) -> str: return "Ada"
+    def superHeroName(self) -> str: return "MockerMan"
+    def birthday(self) -> date: return date(1815, 12, 10)
+    def _hidden(self) -> str: return "hidden"
+
+# 2. Tests for ProviderRegistry
+
+def test_normalize_name():
+    """Tests that camel case, pascal case and separators normalize to snake case."""
+    assert normalize_name("superHeroName") == "super_hero_name"
+    assert normalize_name("FirstName") == "first_name"
+    assert normalize_name("first-name ") == "first_name"
+
+def test_registry_holds_public_callables_only():
+    """Tests that only public callables are registered."""
+    registry = ProviderRegistry(MixedProvider())
+    assert registry.names == ["birthday", "first_name", "superHeroName"]
+    assert registry.methods["first_name"]() == "Ada"
+
+def test_registry_find_by_raw_and_normalized_name():
+    """Tests exact lookups first, then lookups by normalized name."""
+    registry = ProviderRegistry(MixedProvider())
+    assert registry.find("first_name") == "first_name"
+    assert registry.find("FirstName") == "first_name"
+    assert registry.find("super_hero_name") == "superHeroName"
+    assert registry.find("label") is None
+    assert registry.find("_hidden") is None
+    assert registry.find("missing", "first_name") == "first_name"
+
+def test_registry_names_by_return_type():
+    """Tests that methods can be looked up by return type."""
+    registry = ProviderRegistry(MixedProvider())
+    assert registry.names_for(date) == ["birthday"]
+    assert sorted(registry.names_for(str)) == ["first_name", "superHeroName"]
+
+def test_registry_is_built_once_per_instance():
+    """Tests that the registry is shared for one instance and separate for another."""
+    clear_provider_registries()
+    provider = MixedProvider()
+    assert get_provider_registry(provider) is get_provider_registry(provider)
+    assert get_provider_registry(provider) is not get_provider_registry(MixedProvider())
+
+def test_registry_refresh_picks_up_new_methods():
+    """Tests that refresh() sees methods added after the registry was built."""
+    provider = MixedProvider()
+    registry = get_provider_registry(provider)
+    provider.nickname = lambda: "Countess"
+    assert registry.find("nickname") is None
+    registry.refresh()
+    assert registry.find("nickname") == "nickname"
+
+def test_registry_sees_methods_added_to_the_provider():
+    """Tests that the registry is rebuilt after Faker.add_provider or setattr add methods."""
+    from faker import Faker
+    from faker.providers import BaseProvider
+
+    class SuperHeroProvider(BaseProvider):
+        def super_hero_name(self) -> str: return "MockerMan"
+
+    fake = Faker()
+    assert get_provider_registry(fake).find("super_hero_name") is None
+    fake.add_provider(SuperHeroProvider)
+    assert get_provider_registry(fake).find("super_hero_name") == "super_hero_name"
+
+    provider = MixedProvider()
+    get_provider_registry(provider)
+    provider.nickname = lambda: "Countess"
+    assert get_provider_registry(provider).find("nickname") == "nickname"
@@ -0,0 +1,123 @@
+import inspect
+import itertools
+import re
+from decimal import Decimal
+from random import Random
+from typing import List
+
+import pytest
+from faker import Faker
+
+from pymocker.builder.extensible import GenerationError
+from pymocker.builder.strategies import compile_strategy
+from pymocker.builder.validators import is_valid
+
+# 1. Setup
+
+fake = Faker()
+Faker.seed(0)
+random = Random(0)
+
+def counting(values):
+    """A generator cycling through values, counting its calls."""
+    cycle = itertools.cycle(values)
+    def generator(**kwargs):
+        generator.calls += 1
+        generator.kwargs = kwargs
+        return next(cycle)
+    generator.calls = 0
+    generator.kwargs = {}
+    return generator
+
+# 2. Tests for compile_strategy
+
+def test_no_strategy_for_unsupported_types_or_constraints():
+    assert compile_strategy(lambda: [1], List[int], {"min_items": 1}) is None
+    assert compile_strategy(lambda: 1, int, {}) is None
+    assert compile_strategy(lambda: "a", str, {"pattern": "a(?=b)"}) is None
+
+def test_int_strategy_keeps_valid_provider_values():
+    generator = counting([7])
+    strategy = compile_strategy(generator, int, {"ge": 5, "le": 10})
+    assert strategy(random) == 7
+    assert generator.calls == 1
+
+def test_int_strategy_samples_inside_the_range():
+    generator = counting([1000])
+    strategy = compile_strategy(generator, int, {"gt": 5, "lt": 50, "multiple_of": 7})
+    for _ in range(50):
+        value = strategy(random)
+        assert 5 < value < 50 and value % 7 == 0
+    # one provider call per value, never a retry loop
+    assert generator.calls == 50
+
+def test_int_strategy_passes_bounds_to_faker():
+    strategy = compile_strategy(fake.pyint, int, {"ge": 10, "le": 12})
+    assert all(10 <= strategy(random) <= 12 for _ in range(20))
+
+def test_float_strategy():
+    strategy = compile_strategy(counting([-3.0]), float, {"gt": 0.5, "le": 1.5})
+    assert all(0.5 < strategy(random) <= 1.5 for _ in range(20))
+
+def test_decimal_strategy_rounds_to_decimal_places():
+    strategy = compile_strategy(counting([Decimal("1.23456")]), Decimal, {"max_digits": 4, "decimal_places": 2})
+    assert strategy(random) == Decimal("1.23")
+
+def test_decimal_strategy_samples_digits_and_bounds():
+    constraints = {"max_digits": 5, "decimal_places": 2, "ge": Decimal("10"), "le": Decimal("20")}
+    strategy = compile_strategy(counting([Decimal("123456.789")]), Decimal, constraints)
+    for _ in range(20):
+        assert is_valid(strategy(random), Decimal, **constraints)
+
+def test_string_strategy_truncates_at_word_boundary():
+    strategy = compile_strategy(counting(["hello wonderful world"]), str, {"max_length": 12})
+    assert strategy(random) == "hello"
+
+def test_string_strategy_draws_again_before_truncating():
+    strategy = compile_strategy(counting(["hello wonderful world", "short one"]), str, {"max_length": 12})
+    assert strategy(random) == "short one"
+
+def test_string_strategy_never_cuts_structured_values():
+    generator = counting(["frank.johnson@example.com"])
+    generator.__name__ = "safe_email"
+    strategy = compile_strategy(generator, str, {"max_length": 20})
+    with pytest.raises(GenerationError):
+        strategy(random)
+    strategy = compile_strategy(fake.email, str, {"max_length": 20})
+    for _ in range(200):
+        try:
+            value = strategy(random)
+        except GenerationError:
+            continue
+        assert re.fullmatch(r"[^@\s]+@[^@\s]+\.[a-z]{2,}", value), value
+
+def test_string_strategy_extends_short_values():
+    strategy = compile_strategy(counting(["ab", "cd"]), str, {"min_length": 4, "max_length": 6})
+    assert strategy(random) == "ab cd"
+
+def test_string_strategy_applies_case():
+    strategy = compile_strategy(counting(["Hello"]), str, {"upper_case": True})
+    assert strategy(random) == "HELLO"
+
+def test_string_strategy_passes_length_to_faker_text():
+    generator = counting(["short text"])
+    generator.__signature__ = inspect.signature(fake.text)
+    strategy = compile_strategy(generator, str, {"max_length": 30})
+    strategy(random)
+    assert generator.kwargs == {"max_nb_chars": 30}
+    assert all(len(compile_strategy(fake.text, str, {"max_length": 30})(random)) <= 30 for _ in range(20))
+
+def test_strategy_raises_generation_error_for_impossible_constraints():
+    strategy = compile_strategy(counting([1]), int, {"ge": 10, "le": 5})
+    with pytest.raises(GenerationError):
+        strategy(random)
+
+def test_pattern_strategy_keeps_matching_provider_values():
+    strategy = compile_strategy(counting(["AB-1234"]), str, {"pattern": r"^[A-Z]{2}-\d{4}$"})
+    assert strategy(random) == "AB-1234"
+
+def test_pattern_strategy_generates_from_the_pattern():
+    constraints = {"pattern": r"^INV-\d+$", "min_length": 8, "max_length": 10}
+    strategy = compile_strategy(counting(["not an invoice"]), str, constraints)
+    for _ in range(20):
+        assert is_valid(strategy(random), str, **constraints)
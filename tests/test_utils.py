@@ -0,0 +1,79 @@
+import pytest
+
+from pymocker.builder import utils
+from pymocker.builder.utils import segment_and_join_word, to_snake_case
+
+# Test cases for word segmentation
+
+@pytest.mark.parametrize("name, expected", [
+    ("firstname", "first_name"),
+    ("FirstName", "first_name"),
+    ("first_name", "first_name"),
+    ("CellPhoneNumber", "cell_phone_number"),
+    ("emailAddress1", "email_address_1"),
+    ("address_line1", "address_line_1"),
+    ("phonenumber_home", "phone_number_home"),
+    ("ID", "id"),
+    ("", ""),
+])
+def test_segment_and_join_word(name, expected):
+    """Tests that field names in any style are split into snake case words."""
+    assert segment_and_join_word(name) == expected
+
+def test_segment_and_join_word_custom_separator():
+    """Tests that the separator can be changed."""
+    assert segment_and_join_word("firstname", sep=" ") == "first name"
+
+def test_segment_and_join_word_is_memoized(monkeypatch):
+    """Tests that repeated names and repeated fragments are not segmented again."""
+    monkeypatch.setattr(utils, "_segment_words", set())
+    segment_and_join_word.cache_clear()
+    utils._segment_part.cache_clear()
+    segmenter = utils._load_segmenter()
+    calls = []
+    original = segmenter.segment
+    monkeypatch.setattr(segmenter, "segment", lambda text: calls.append(text) or original(text))
+
+    segment_and_join_word("homephonenumber")
+    segment_and_join_word("homephonenumber")
+    segment_and_join_word("work_homephonenumber")
+
+    assert calls == ["homephonenumber", "work"]
+
+def test_compact_dictionary_is_bounded():
+    """Tests that the segmentation dictionary is pruned to the configured size plus provider words."""
+    segmenter = utils._load_segmenter()
+    assert len(segmenter.unigrams) <= utils.SEGMENT_VOCABULARY_SIZE + len(utils._segment_words)
+    assert all(count >= utils.SEGMENT_MIN_BIGRAM_COUNT for count in segmenter.bigrams.values())
+
+@pytest.mark.parametrize("name, expected", [
+    ("json_payload", "json_payload"),
+    ("jsonpayload", "json_payload"),
+    ("iban", "iban"),
+    ("emoji", "emoji"),
+    ("msisdn", "msisdn"),
+    ("ein", "ein"),
+])
+def test_provider_method_words_stay_whole(name, expected):
+    """Tests that words of Faker's method names are not split by the compact dictionary."""
+    from faker import Faker
+    from pymocker.builder.registry import get_provider_registry
+    get_provider_registry(Faker())
+    assert segment_and_join_word(name) == expected
+
+def test_add_segment_words_updates_a_loaded_dictionary(monkeypatch):
+    """Tests that words added after the dictionary is loaded are kept whole from then on."""
+    monkeypatch.setattr(utils, "_segment_words", set(utils._segment_words))
+    utils._load_segmenter()
+    assert segment_and_join_word("bluecheese") == "blue_cheese"
+    utils.add_segment_words(["bluecheese"])
+    assert segment_and_join_word("bluecheese_id") == "bluecheese_id"
+    assert "bluecheese" in utils._load_segmenter().unigrams
+    monkeypatch.undo()
+    segment_and_join_word.cache_clear()
+    utils._segment_part.cache_clear()
+
+def test_to_snake_case():
+    """Tests camel and pascal case conversion."""
+    assert to_snake_case("superHeroName") == "super_hero_name"
+    assert to_snake_case("HTTPResponseCode") == "http_response_code"
@@ -17,7 +17,9 @@ from pymocker.builder.validators import (
     is_valid_date,
     is_valid_uuid,
     is_valid_path,
-    is_valid
+    is_valid,
+    compile_validator,
+    compile_block_validator,
 )
 
 # --- Integer Validators ---
@@ -95,3 +97,47 @@ def test_is_valid_dynamic():
     assert is_valid([1, 2], List[int], max_items=2)
     # Test unhandled type
     assert is_valid(True, bool) is True
+
+# --- Compiled Validators ---
+def test_compile_validator_is_cached():
+    assert compile_validator(str, {"max_length": 5}) is compile_validator(str, {"max_length": 5})
+    assert compile_validator(int, {"ge": 1, "le": 2}) is compile_validator(int, {"le": 2, "ge": 1})
+
+def test_compile_validator_matches_is_valid():
+    cases = [
+        (int, {"ge": 5, "lt": 15, "multiple_of": 2}, [10, 4, 15, 11]),
+        (float, {"gt": 10.0, "le": 11.0}, [10.5, 10.0, 11.0, 11.5]),
+        (Decimal, {"max_digits": 4, "decimal_places": 2, "ge": 0}, [Decimal("10.55"), Decimal("10.555"), Decimal("-1")]),
+        (str, {"min_length": 3, "max_length": 7, "pattern": r"^\d{3}-\w{3}$"}, ["123-abc", "hi", "abc-123"]),
+        (str, {"lower_case": True}, ["hello", "Hello"]),
+        (List[int], {"max_items": 2, "unique_items": True}, [[1, 2], [1, 1], [1, 2, 3]]),
+        (bool, {}, [True]),
+    ]
+    for annotation, constraints, values in cases:
+        check = compile_validator(annotation, constraints)
+        for value in values:
+            assert check(value) == is_valid(value, annotation, **constraints)
+
+def test_compile_validator_ignores_irrelevant_constraints():
+    check = compile_validator(int, {"ge": 1, "max_length": 3})
+    assert check(2)
+    assert not check(0)
+
+def test_compile_validator_accepts_unhashable_constraints():
+    check = compile_validator(List[int], {"min_items": 1, "examples": [[1]]})
+    assert check([1])
+    assert not check([])
+
+# --- Block Validators ---
+def test_compile_block_validator_matches_is_valid():
+    cases = [
+        (int, {"ge": 5, "lt": 15, "multiple_of": 2}, [10, 4, 15, 11, None, 12]),
+        (float, {"gt": 10.0, "le": 11.0}, [10.5, 10.0, 11.0, 11.5, float("nan")]),
+        (str, {"min_length": 3, "max_length": 5, "lower_case": True}, ["hello", "hi", "Hello", "toolong", None]),
+        (bytes, {"max_length": 2}, [b"ab", b"abc"]),
+        (date, {"ge": date(2020, 1, 1)}, [date(2021, 1, 1), date(2019, 1, 1)]),
+        (int, {"ge": 0}, [True, 1, 10**30, -(10**30)]),
+    ]
+    for annotation, constraints, values in cases:
+        expected = [value is not None and is_valid(value, annotation, **constraints) for value in values]
+        assert compile_block_validator(annotation, constraints)(values) == expected